@@ -70,6 +70,24 @@ from .config import (
     SERVICE_NAMES_COPILOT,
     ES_URL,
     ES_INDEX_PATTERN,
+    PARALLEL_WORKERS,
+    HEADLESS,
+    ROUTE_BLOCKING,
+    TRACE_ON_FAILURE,
+    CONTEXT_PREWARM,
+    PERSISTENT_PROFILES,
+    MULTI_TAB_SENDS,
+    LOGIN_GATING,
+    EXECUTION_MODE,
+    ASYNC_CONCURRENCY,
+    LARGE_BODY_MODE,
+    LARGE_BODY_SIZES_KB,
+    ATTACH_SWEEP_MODE,
+    BENCH_MODE,
+    BENCH_REPEATS,
+    BURST_MODE,
+    COPILOT_SWEEP_MODE,
+    COPILOT_PROMPT_MAX_CHARS,
 )
 
 from .function import (
@@ -82,6 +100,74 @@ from .function import (
     click_confirm_if_popup_exists,
     safe_send_with_popup_retry,
     capture_failure_screenshot,
+    send_and_wait_for_request,
+    is_send_request,
+    make_dlp_token,
+    wait_for_ready,
+    expect_file_transmitted,
+)
+
+from .session import (
+    get_session_path,
+    reuse_vendor_session,
+    save_vendor_session,
+)
+
+from .parallel import (
+    collect_test_modules,
+    build_service_shards,
+)
+
+from .network import (
+    apply_route_policy,
+)
+
+from .large_body import (
+    build_large_body,
+    insert_text_fast,
+    attach_large_body_timing,
+)
+
+from .attach_sweep import (
+    generate_sweep_file,
+    attach_sweep_cases,
+    sweep_upload_timeout_ms,
+    verify_and_record_sweep,
+)
+
+from .bench import (
+    bench_cases,
+    make_bench_payload,
+    record_bench,
+    ensure_bench_cleanup_ok,
+    delete_bench_files,
+)
+
+from .burst import (
+    run_message_burst,
+)
+
+from .prompt_sweep import (
+    prompt_sweep_cases,
+    input_char_limit,
+    OutgoingTracker,
+    verify_and_record_prompt_sweep,
+)
+
+from .ui_drift import (
+    check_ui_drift,
+)
+
+from .context_pool import (
+    open_service_page,
+)
+
+from .multitab import (
+    run_multi_tab_sends,
+)
+
+from .async_runner import (
+    run_async_flows,
 )
 
 __all__ = [
@@ -150,6 +236,24 @@ __all__ = [
     "SERVICE_NAMES_COPILOT",
     "ES_URL",
     "ES_INDEX_PATTERN",
+    "PARALLEL_WORKERS",
+    "HEADLESS",
+    "ROUTE_BLOCKING",
+    "TRACE_ON_FAILURE",
+    "CONTEXT_PREWARM",
+    "PERSISTENT_PROFILES",
+    "MULTI_TAB_SENDS",
+    "LOGIN_GATING",
+    "EXECUTION_MODE",
+    "ASYNC_CONCURRENCY",
+    "LARGE_BODY_MODE",
+    "LARGE_BODY_SIZES_KB",
+    "ATTACH_SWEEP_MODE",
+    "BENCH_MODE",
+    "BENCH_REPEATS",
+    "BURST_MODE",
+    "COPILOT_SWEEP_MODE",
+    "COPILOT_PROMPT_MAX_CHARS",
     "search_logs_from_es",
     "assert_es_logs",
     "assert_es_logs_with_retry",
@@ -160,6 +264,38 @@ __all__ = [
     "click_confirm_if_popup_exists",
     "safe_send_with_popup_retry",
     "capture_failure_screenshot",
+    "send_and_wait_for_request",
+    "is_send_request",
+    "make_dlp_token",
+    "get_session_path",
+    "reuse_vendor_session",
+    "save_vendor_session",
+    "collect_test_modules",
+    "build_service_shards",
+    "apply_route_policy",
+    "wait_for_ready",
+    "expect_file_transmitted",
+    "check_ui_drift",
+    "build_large_body",
+    "insert_text_fast",
+    "attach_large_body_timing",
+    "generate_sweep_file",
+    "attach_sweep_cases",
+    "sweep_upload_timeout_ms",
+    "verify_and_record_sweep",
+    "bench_cases",
+    "make_bench_payload",
+    "record_bench",
+    "ensure_bench_cleanup_ok",
+    "delete_bench_files",
+    "run_message_burst",
+    "prompt_sweep_cases",
+    "input_char_limit",
+    "OutgoingTracker",
+    "verify_and_record_prompt_sweep",
+    "open_service_page",
+    "run_multi_tab_sends",
+    "run_async_flows",
 
 
 ]
\ No newline at end of file
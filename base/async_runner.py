@@ -0,0 +1,263 @@
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import time
+import traceback
+import uuid
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from playwright.async_api import async_playwright, Page, Browser
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from base.config import ASYNC_CONCURRENCY, HEADLESS, SEND_REQUEST_MATCHERS, SEND_REQUEST_TIMEOUT_MS
+from base.function import assert_es_logs_with_retry, get_screenshot_path, make_dlp_token, is_send_request
+from base.session import check_storage_state_expiry, get_session_path
+
+# ============================
+# async 플로우 정의 형식
+# ============================
+# {
+#     "name"         : "test_dooray_board_normal"   (Allure 테스트 이름)
+#     "suite"        : "dooray_board"               (Allure suite 라벨)
+#     "vendor"       : "dooray"                     (storageState 벤더 키)
+#     "service_names": SERVICE_NAMES_DOORAY_BOARD   (ES 검증 ServiceName)
+#     "test_cases"   : PATTERN_LOGGING_CASE         (assert_es_logs 기대값)
+#     "run"          : async def run(page, token)   (페이지 조작 ~ 전송까지)
+# }
+AsyncFlowFn = Callable[[Page, str], Awaitable[None]]
+
+
+async def async_send_and_wait_for_request(page: Page, service: str, send_action,
+                                          timeout: int = None, fallback_ms: int = 5000):
+    """
+    send_and_wait_for_request 의 async 버전.
+    send_action 은 코루틴 함수 (예: page.get_by_role("button", name="보내기").click)
+    """
+    matcher = SEND_REQUEST_MATCHERS.get(service)
+    if matcher is None:
+        await send_action()
+        print(f"[ASYNC][SEND] {service}: 전송 요청 matcher 없음 → {fallback_ms}ms 고정 대기")
+        await page.wait_for_timeout(fallback_ms)
+        return None
+
+    timeout = SEND_REQUEST_TIMEOUT_MS if timeout is None else timeout
+    started = time.monotonic()
+    try:
+        async with page.context.expect_event("requestfinished",
+                                             predicate=lambda req: is_send_request(matcher, req),
+                                             timeout=timeout) as finished_info:
+            await send_action()
+        send_request = await finished_info.value
+
+    except PlaywrightTimeoutError:
+        print(f"[ASYNC][SEND] {service}: {timeout}ms 안에 전송 요청({matcher['url']}) 미감지 → ES 재시도에 맡김")
+        return None
+
+    elapsed_ms = int((time.monotonic() - started) * 1000)
+    response = await send_request.response()
+    result = {
+        "service": service,
+        "url": send_request.url,
+        "method": send_request.method,
+        "status": response.status if response else None,
+        "elapsed_ms": elapsed_ms,
+    }
+    print(f"[ASYNC][SEND] {service}: {result['method']} {result['url']} → {result['status']} ({elapsed_ms}ms)")
+    return result
+
+
+class AllureResultWriter:
+    """
+    allure-pytest 없이 async 플로우 결과를 allure-results 형식(*-result.json)으로 남긴다.
+    pytest 결과와 같은 디렉터리에 써도 allure generate 가 함께 읽는다.
+    """
+
+    def __init__(self, results_dir: str):
+        self.results_dir = results_dir
+        os.makedirs(results_dir, exist_ok=True)
+
+    def attach_file(self, result: dict, path: str, name: str, mime: str = "image/jpeg") -> None:
+        ext = os.path.splitext(path)[1]
+        source = f"{uuid.uuid4()}-attachment{ext}"
+        shutil.copy(path, os.path.join(self.results_dir, source))
+        result["attachments"].append({"name": name, "source": source, "type": mime})
+
+    def attach_json(self, result: dict, data, name: str) -> None:
+        source = f"{uuid.uuid4()}-attachment.json"
+        with open(os.path.join(self.results_dir, source), "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        result["attachments"].append({"name": name, "source": source, "type": "application/json"})
+
+    def new_result(self, flow: dict, token: str) -> dict:
+        full_name = f"async_flows#{flow['name']}"
+        return {
+            "uuid": str(uuid.uuid4()),
+            "historyId": hashlib.md5(full_name.encode("utf-8")).hexdigest(),
+            "fullName": full_name,
+            "name": flow["name"],
+            "status": None,
+            "statusDetails": {},
+            "stage": "running",
+            "start": int(time.time() * 1000),
+            "stop": None,
+            "steps": [],
+            "attachments": [],
+            "parameters": [{"name": "dlp_token", "value": token}],
+            "labels": [
+                {"name": "suite", "value": flow["suite"]},
+                {"name": "framework", "value": "playwright-async"},
+                {"name": "language", "value": "python"},
+            ],
+        }
+
+    def write(self, result: dict) -> None:
+        result["stage"] = "finished"
+        result["stop"] = int(time.time() * 1000)
+        path = os.path.join(self.results_dir, f"{result['uuid']}-result.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+
+class _StepRecorder:
+    """
+    플로우 단계별 소요 시간을 Allure step 으로 기록. (async with recorder("단계명"): ...)
+    """
+
+    def __init__(self, result: dict):
+        self.result = result
+
+    def __call__(self, name: str):
+        recorder = self
+
+        class _Step:
+            async def __aenter__(self):
+                self.step = {"name": name, "status": "passed", "stage": "finished",
+                             "start": int(time.time() * 1000), "stop": None}
+                recorder.result["steps"].append(self.step)
+                return self.step
+
+            async def __aexit__(self, exc_type, exc, tb):
+                self.step["stop"] = int(time.time() * 1000)
+                if exc_type is not None:
+                    self.step["status"] = "failed" if issubclass(exc_type, AssertionError) else "broken"
+                return False
+
+        return _Step()
+
+
+async def _run_one_flow(browser: Browser, flow: dict, writer: AllureResultWriter,
+                        semaphore: asyncio.Semaphore, name_locks: Dict[str, asyncio.Lock]) -> dict:
+    token = make_dlp_token()
+    result = writer.new_result(flow, token)
+    step = _StepRecorder(result)
+
+    # 같은 ServiceName 을 쓰는 플로우끼리는 순서대로 (ES 최신 문서 fallback 이 섞이지 않도록)
+    # 데드락 방지를 위해 항상 정렬된 순서로 잠근다.
+    # 잠금을 먼저 잡고 나서 동시 실행 슬롯을 잡는다. (슬롯을 먼저 잡으면 잠금 대기 중인 같은 서비스
+    # 플로우들이 슬롯을 차지해 다른 서비스가 못 돌고 사실상 직렬 실행이 됨)
+    locks = [name_locks[n] for n in sorted(set(flow["service_names"]))]
+    for lock in locks:
+        await lock.acquire()
+
+    try:
+        async with semaphore:
+            context = None
+            page = None
+            try:
+                reason = check_storage_state_expiry(flow["vendor"])
+                if reason:
+                    result["status"] = "skipped"
+                    result["statusDetails"] = {"message": f"{flow['vendor']} 세션 없음/만료 ({reason}) → pytest 로그인 테스트 먼저 실행"}
+                    print(f"[ASYNC] {flow['name']} skip: {reason}")
+                    return result
+
+                print(f"[ASYNC] {flow['name']} 시작 (token={token})")
+                context = await browser.new_context(storage_state=get_session_path(flow["vendor"]))
+                page = await context.new_page()
+
+                async with step("페이지 조작 및 전송"):
+                    send_result = await flow["run"](page, token)
+                if send_result:
+                    writer.attach_json(result, send_result, f"{flow['suite']}_send_request")
+
+                # ES 검증은 동기 requests 기반이므로 스레드로 넘겨서 이벤트 루프를 막지 않는다.
+                async with step("ES 로그 검증"):
+                    await asyncio.to_thread(
+                        assert_es_logs_with_retry,
+                        service_name=flow["service_names"],
+                        test_cases=flow["test_cases"],
+                        token=token,
+                        size=1,
+                        max_attempts=3,
+                        interval_sec=5,
+                    )
+
+                result["status"] = "passed"
+                print(f"[ASYNC] {flow['name']} PASS")
+
+            except Exception as e:
+                result["status"] = "failed" if isinstance(e, AssertionError) else "broken"
+                result["statusDetails"] = {"message": str(e), "trace": traceback.format_exc()}
+                print(f"[WARN] [ASYNC] {flow['name']} 실패: {e}")
+
+                if page is not None:
+                    screenshot_path = get_screenshot_path(flow["name"])
+                    try:
+                        await page.screenshot(path=screenshot_path, type="jpeg", quality=80, timeout=5000)
+                        writer.attach_file(result, screenshot_path, f"{flow['name']}_failure_screenshot")
+                    except Exception as se:
+                        print(f"[WARN] Failed to take screenshot for {flow['name']}: {se}")
+
+            finally:
+                if context is not None:
+                    await context.close()
+                writer.write(result)
+    finally:
+        for lock in reversed(locks):
+            lock.release()
+
+    return result
+
+
+async def _run_async_flows(flows: List[dict], concurrency: int, results_dir: str) -> List[dict]:
+    writer = AllureResultWriter(results_dir)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    name_locks: Dict[str, asyncio.Lock] = {}
+    for flow in flows:
+        for name in flow["service_names"]:
+            name_locks.setdefault(name, asyncio.Lock())
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=HEADLESS)
+        try:
+            return await asyncio.gather(
+                *(_run_one_flow(browser, flow, writer, semaphore, name_locks) for flow in flows)
+            )
+        finally:
+            await browser.close()
+
+
+def run_async_flows(flows: List[dict], concurrency: Optional[int] = None,
+                    results_dir: str = "allure-results") -> List[dict]:
+    """
+    async 플로우 목록을 한 이벤트 루프 / 한 Chromium 에서 동시에 실행하고
+    플로우별 Allure 결과를 results_dir 에 남긴다.
+
+    - 동시에 열리는 컨텍스트 수는 concurrency (기본 ASYNC_CONCURRENCY) 로 제한
+    - ServiceName 이 겹치는 플로우는 서로 순서대로 실행
+    - 로그인은 하지 않는다. 저장된 storageState 가 없거나 만료면 skipped
+    """
+    concurrency = ASYNC_CONCURRENCY if concurrency is None else concurrency
+    print(f"[ASYNC] 플로우 {len(flows)}개 실행 (concurrency={concurrency}, headless={HEADLESS})")
+
+    started = time.monotonic()
+    results = asyncio.run(_run_async_flows(flows, concurrency, results_dir))
+
+    summary: Dict[str, int] = {}
+    for r in results:
+        summary[r["status"]] = summary.get(r["status"], 0) + 1
+    print(f"[ASYNC] 완료 {summary} ({time.monotonic() - started:.1f}s)")
+
+    return results
@@ -0,0 +1,156 @@
+import json
+import os
+import time
+from typing import Dict, List, Optional
+
+import allure
+import pytest
+
+from base.config import (
+    DLP_FILE_SINGLE,
+    DLP_NORMAL,
+    UPLOAD_TIMEOUT_MS,
+    TEST_DEADLINE_SEC,
+    ATTACH_SWEEP_SIZES_KB,
+    ATTACH_SWEEP_TYPES,
+    ATTACH_SWEEP_MIN_KBPS,
+    ATTACH_SIZE_LIMITS_KB,
+)
+from base.function import assert_es_logs_with_retry
+
+# 이번 실행의 스윕 결과 (conftest 가 세션 종료 시 저장/요약)
+SWEEP_RESULTS: List[Dict] = []
+
+# 케이스당 ES 대기(verify_and_record_sweep: 30회 × 2초 + 조회 시간)와 로그인/작성 화면 조작 여유 (초)
+_SWEEP_ES_WAIT_SEC = 90
+_SWEEP_UI_MARGIN_SEC = 90
+
+
+def get_sweep_file_dir() -> str:
+    sweep_dir = os.path.join(os.getcwd(), "report", "sweep_files")
+    os.makedirs(sweep_dir, exist_ok=True)
+    return sweep_dir
+
+
+def generate_sweep_file(size_kb: int, kind: str) -> str:
+    """
+    스윕용 첨부파일을 만든다. (같은 크기/종류는 실행 간 재사용)
+
+    - txt : DLP_NORMAL 반복 텍스트 (DLP 가 내용 검사까지 하는 경로)
+    - bin : 난수 바이트 (압축/내용 검사가 의미 없는 경로)
+    - jpg : test.jpeg 뒤에 난수를 덧붙여 크기만 늘린 이미지 (헤더는 정상 JPEG)
+    """
+    path = os.path.join(get_sweep_file_dir(), f"sweep_{size_kb}KB.{kind}")
+    size = size_kb * 1024
+    if os.path.exists(path) and os.path.getsize(path) == size:
+        return path
+
+    if kind == "txt":
+        line = ("\n".join(DLP_NORMAL) + "\n").encode("utf-8")
+        data = (line * (size // len(line) + 1))[:size]
+    elif kind == "bin":
+        data = os.urandom(size)
+    elif kind == "jpg":
+        with open(DLP_FILE_SINGLE, "rb") as f:
+            head = f.read()
+        data = head[:size] + os.urandom(max(size - len(head), 0))
+    else:
+        raise ValueError(f"지원하지 않는 스윕 파일 종류: {kind}")
+
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+def attach_sweep_cases(service: str) -> List:
+    """
+    서비스 한도(ATTACH_SIZE_LIMITS_KB) 이하의 (크기, 종류) 조합을 parametrize 용으로 돌려준다.
+    크기별로 deadline 마커를 붙여 업로드 대기 한도 + ES 대기를 다 써도 watchdog 에 걸리지 않게 한다.
+
+    사용 예)
+        @pytest.mark.parametrize("size_kb, kind", attach_sweep_cases("daum_mail"))
+    """
+    limit = ATTACH_SIZE_LIMITS_KB.get(service)
+    return [
+        pytest.param(size_kb, kind, id=f"{size_kb}KB-{kind}",
+                     marks=pytest.mark.deadline(sweep_deadline_sec(size_kb)))
+        for size_kb in ATTACH_SWEEP_SIZES_KB
+        if limit is None or size_kb <= limit
+        for kind in ATTACH_SWEEP_TYPES
+    ]
+
+
+def sweep_upload_timeout_ms(size_kb: int) -> int:
+    """
+    파일 크기에 비례한 업로드 대기 시간 (ATTACH_SWEEP_MIN_KBPS 기준, 최소 UPLOAD_TIMEOUT_MS)
+    """
+    return max(UPLOAD_TIMEOUT_MS, int(size_kb / ATTACH_SWEEP_MIN_KBPS * 1000))
+
+
+def sweep_deadline_sec(size_kb: int) -> int:
+    """
+    크기별 케이스 벽시계 제한. (TEST_DEADLINE_SEC 보다 짧아지지는 않음)
+    """
+    needed = sweep_upload_timeout_ms(size_kb) / 1000 + _SWEEP_ES_WAIT_SEC + _SWEEP_UI_MARGIN_SEC
+    return max(TEST_DEADLINE_SEC, int(needed))
+
+
+def verify_and_record_sweep(service: str, size_kb: int, kind: str, upload: Dict,
+                            service_names, test_cases, token: str) -> Dict:
+    """
+    ES 에 파일 로그가 도착할 때까지 짧은 간격으로 확인하고,
+    업로드 시간 / 로그 도착 시간을 한 건으로 기록한다. (로그가 안 오면 logged=False 로 기록 후 실패)
+    """
+    started = time.monotonic()
+    error: Optional[AssertionError] = None
+    try:
+        assert_es_logs_with_retry(
+            service_name=service_names,
+            test_cases=test_cases,
+            token=token,
+            size=1,
+            max_attempts=30,
+            interval_sec=2,
+            # 토큰 문서가 없을 때 최신 ServiceName 문서(대개 직전 케이스 로그)로 통과시키지 않는다
+            allow_fallback=False,
+        )
+    except AssertionError as e:
+        error = e
+
+    # 마지막 업로드 요청 종료 시각 기준 (없으면 with 블록 경과 시간)
+    upload_ms = upload.get("upload_ms") or upload.get("elapsed_ms")
+    result = {
+        "service": service,
+        "size_kb": size_kb,
+        "kind": kind,
+        "upload_ms": upload_ms,
+        "upload_kbps": round(size_kb / (upload_ms / 1000), 1) if upload_ms else None,
+        "transmitted_bytes": upload.get("transmitted_bytes"),
+        "log_ms": int((time.monotonic() - started) * 1000),
+        "logged": error is None,
+    }
+    SWEEP_RESULTS.append(result)
+
+    print(f"[SWEEP] {service} {size_kb}KB {kind}: 업로드 {result['upload_ms']}ms "
+          f"({result['upload_kbps']}KB/s), 로그 {result['log_ms']}ms, logged={result['logged']}")
+    allure.attach(
+        json.dumps(result, ensure_ascii=False, indent=2),
+        name=f"{service}_attach_sweep_{size_kb}KB_{kind}",
+        attachment_type=allure.attachment_type.JSON,
+    )
+
+    if error is not None:
+        raise error
+    return result
+
+
+def summarize_sweep() -> List[str]:
+    """
+    세션 종료 시 호출. 서비스/크기/종류별 한 줄 요약.
+    """
+    lines = []
+    for r in sorted(SWEEP_RESULTS, key=lambda r: (r["service"], r["size_kb"], r["kind"])):
+        log = f"{r['log_ms']}ms" if r["logged"] else "미수신"
+        lines.append(f"[SWEEP] {r['service']:<16} {r['size_kb']:>6}KB {r['kind']:<4} "
+                     f"업로드 {r['upload_ms']}ms ({r['upload_kbps']}KB/s)  로그 {log}")
+    return lines
@@ -0,0 +1,192 @@
+import json
+import os
+import statistics
+from typing import Callable, Dict, List, Optional
+
+import allure
+import pytest
+from playwright.sync_api import Browser, Page
+
+from base.config import (
+    HEADLESS,
+    TEST_DEADLINE_SEC,
+    BENCH_DUT_PROXY,
+    BENCH_BYPASS_PROXY,
+    BENCH_SIZES_KB,
+    BENCH_REPEATS,
+)
+from base.attach_sweep import sweep_upload_timeout_ms
+from base.watchdog import WATCHDOG
+
+# 반복 1회당 업로드 외 UI 조작(메뉴/파일 선택) 여유와 케이스당 페이지 진입 여유 (초)
+_BENCH_STEP_MARGIN_SEC = 15
+# 반복 1회분 업로드 파일 삭제(우클릭 → 삭제 → 확인 → 목록에서 사라짐) 여유 (초)
+_BENCH_DELETE_SEC = 15
+_BENCH_CASE_MARGIN_SEC = 60
+
+# 벤치마크 경로 이름 → 브라우저 프록시 (빈 값 = 직접 연결)
+BENCH_ROUTES = {
+    "dut": BENCH_DUT_PROXY,
+    "bypass": BENCH_BYPASS_PROXY,
+}
+
+# 이번 실행의 벤치마크 결과 (conftest 가 세션 종료 시 저장/요약)
+BENCH_RESULTS: List[Dict] = []
+
+# 업로드 파일 정리에 실패한 서비스 {서비스: 사유} (이후 같은 서비스 벤치 케이스는 업로드 전에 실패)
+_BENCH_CLEANUP_FAILED: Dict[str, str] = {}
+
+
+def bench_deadline_sec(size_kb: int) -> int:
+    """
+    크기별 케이스 벽시계 제한. 반복마다 업로드 대기 한도(sweep_upload_timeout_ms)를 다 써도
+    watchdog 에 걸리지 않도록 잡는다. finally 의 업로드 파일 삭제 시간도 포함. (TEST_DEADLINE_SEC 보다 짧아지지는 않음)
+    """
+    per_repeat = sweep_upload_timeout_ms(size_kb) / 1000 + _BENCH_STEP_MARGIN_SEC + _BENCH_DELETE_SEC
+    return max(TEST_DEADLINE_SEC, int(BENCH_REPEATS * per_repeat) + _BENCH_CASE_MARGIN_SEC)
+
+
+def bench_cases() -> List:
+    """
+    (경로, 크기) 조합을 parametrize 용으로 돌려준다. 우회 프록시가 없으면 bypass 케이스는 skip.
+    크기별로 deadline 마커를 붙여 기본 TEST_DEADLINE_SEC 대신 bench_deadline_sec 를 쓴다.
+
+    사용 예)
+        @pytest.mark.parametrize("route, size_kb", bench_cases())
+    """
+    cases = []
+    for size_kb in BENCH_SIZES_KB:
+        for route in BENCH_ROUTES:
+            marks = [pytest.mark.deadline(bench_deadline_sec(size_kb))]
+            if route == "bypass" and not BENCH_BYPASS_PROXY:
+                marks.append(pytest.mark.skip(reason="BENCH_BYPASS_PROXY 미설정"))
+            cases.append(pytest.param(route, size_kb, id=f"{route}-{size_kb}KB", marks=marks))
+    return cases
+
+
+def launch_route_browser(playwright, route: str) -> Browser:
+    """
+    경로별 전용 Chromium. 프록시는 브라우저 단위로 걸어 두 경로의 조건(캐시/연결 재사용)을 분리한다.
+    """
+    proxy = BENCH_ROUTES[route]
+    print(f"[BENCH] {route} 경로 Chromium 실행 (proxy={proxy or '직접 연결'})")
+    browser = playwright.chromium.launch(headless=HEADLESS, proxy={"server": proxy} if proxy else None)
+    WATCHDOG.register_browser(browser)
+    return browser
+
+
+def make_bench_payload(size_kb: int, name: str) -> Dict:
+    """
+    set_files 에 바로 넘기는 메모리 파일. 반복마다 이름을 바꿔 덮어쓰기 팝업을 피한다.
+    (난수 내용이라 전송 구간 압축의 영향을 받지 않음)
+
+    올린 파일은 케이스 finally 에서 delete_bench_files() 로 지운다.
+    (기본값 기준 실행당 서비스/경로별 약 205MB → 남겨 두면 드라이브 용량이 차서 일반 업로드 테스트가 깨짐)
+    """
+    return {"name": name, "mimeType": "application/octet-stream", "buffer": os.urandom(size_kb * 1024)}
+
+
+def ensure_bench_cleanup_ok(service: str) -> None:
+    """
+    벤치 케이스 시작 시 호출. 앞선 케이스가 올린 파일을 못 지웠으면 더 올리지 않고 바로 실패.
+    """
+    reason = _BENCH_CLEANUP_FAILED.get(service)
+    if reason:
+        pytest.fail(f"{service} 이전 벤치 업로드 파일 정리 실패 → 벤치 중단 ({reason})")
+
+
+def delete_bench_files(page: Page, service: str, names: List[str],
+                       delete_one: Callable[[Page, str], None]) -> None:
+    """
+    벤치 케이스 finally 에서 호출. 이번 케이스가 올린 bench_* 파일을 delete_one(page, name) 으로 하나씩 지운다.
+    (delete_one 은 서비스별 드라이브 UI 조작, 못 지우면 예외)
+
+    하나라도 못 지우면 서비스를 정리 실패로 표시 → 같은 서비스의 남은 벤치 케이스는
+    ensure_bench_cleanup_ok() 에서 업로드 전에 실패한다. (남은 파일 이름은 Allure 에 첨부)
+    """
+    if not names:
+        return
+
+    failed = []
+    for name in names:
+        try:
+            delete_one(page, name)
+        except Exception as e:
+            print(f"[BENCH] {service}: {name} 삭제 실패: {e}")
+            failed.append(name)
+
+    print(f"[BENCH] {service}: 업로드 파일 {len(names) - len(failed)}/{len(names)}건 삭제")
+    if failed:
+        _BENCH_CLEANUP_FAILED[service] = f"{len(failed)}건 미삭제, 예) {failed[0]}"
+        allure.attach(
+            "\n".join(failed),
+            name=f"{service}_bench_files_not_deleted",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+
+
+def _stats(values: List[float]) -> Dict[str, Optional[float]]:
+    if not values:
+        return {"n": 0, "mean": None, "median": None, "stdev": None, "min": None, "max": None}
+    return {
+        "n": len(values),
+        "mean": round(statistics.mean(values), 1),
+        "median": round(statistics.median(values), 1),
+        "stdev": round(statistics.stdev(values), 1) if len(values) > 1 else 0.0,
+        "min": round(min(values), 1),
+        "max": round(max(values), 1),
+    }
+
+
+def record_bench(service: str, route: str, size_kb: int, uploads: List[Dict]) -> Dict:
+    """
+    반복 업로드 결과(expect_file_transmitted 기록 목록)를 통계로 묶어 Allure 첨부 + 세션 결과에 추가.
+    """
+    times_ms = [u.get("upload_ms") or u["elapsed_ms"] for u in uploads]
+    # 이번 케이스가 올린 파일 (delete_bench_files 로 삭제, 실패 시 수동 정리용)
+    uploaded_files = [name for u in uploads for name in u.get("files", [])]
+    mbps = [size_kb / 1024 / (t / 1000) for t in times_ms if t]
+
+    result = {
+        "service": service,
+        "route": route,
+        "size_kb": size_kb,
+        "time_ms": _stats(times_ms),
+        "throughput_mb_s": _stats(mbps),
+        "samples_ms": times_ms,
+        "uploaded_files": uploaded_files,
+    }
+    BENCH_RESULTS.append(result)
+
+    print(f"[BENCH] {service} {route} {size_kb}KB: 완료 시간 중앙값 {result['time_ms']['median']}ms "
+          f"(±{result['time_ms']['stdev']}), 처리량 중앙값 {result['throughput_mb_s']['median']}MB/s, "
+          f"n={len(times_ms)}")
+    allure.attach(
+        json.dumps(result, ensure_ascii=False, indent=2),
+        name=f"{service}_bench_{route}_{size_kb}KB",
+        attachment_type=allure.attachment_type.JSON,
+    )
+    return result
+
+
+def summarize_bench() -> List[Dict]:
+    """
+    세션 종료 시 호출. 같은 서비스/크기의 dut 와 bypass 중앙값을 비교해 DLP 검사 오버헤드를 계산한다.
+    """
+    by_key = {}
+    for r in BENCH_RESULTS:
+        by_key.setdefault((r["service"], r["size_kb"]), {})[r["route"]] = r
+
+    summary = []
+    for (service, size_kb), routes in sorted(by_key.items()):
+        dut = routes.get("dut", {}).get("time_ms", {}).get("median")
+        bypass = routes.get("bypass", {}).get("time_ms", {}).get("median")
+        overhead = round((dut - bypass) / bypass * 100, 1) if dut and bypass else None
+        summary.append({
+            "service": service,
+            "size_kb": size_kb,
+            "dut_median_ms": dut,
+            "bypass_median_ms": bypass,
+            "overhead_pct": overhead,
+        })
+    return summary
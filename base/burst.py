@@ -0,0 +1,166 @@
+import json
+import time
+from typing import Callable, Dict, List
+
+import allure
+import requests
+from playwright.sync_api import Page
+
+from base.config import (
+    DLP_NORMAL,
+    SEND_REQUEST_MATCHERS,
+    BURST_COUNT,
+    BURST_RATE_PER_SEC,
+    BURST_LOG_TIMEOUT_SEC,
+    BURST_POLL_SEC,
+    BURST_MAX_LOSS_RATE,
+)
+from base.function import is_send_request, make_dlp_token, search_logs_from_es
+
+# 이번 실행의 burst 결과 (conftest 가 세션 종료 시 저장/요약)
+BURST_RESULTS: List[Dict] = []
+
+
+def _percentile(values: List[int], p: float):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * p), len(ordered) - 1)]
+
+
+def run_message_burst(page: Page, service: str, service_names,
+                      fill: Callable[[Page, str], None], send: Callable[[Page], None],
+                      count: int = BURST_COUNT, rate_per_sec: float = BURST_RATE_PER_SEC) -> Dict:
+    """
+    메시지 count 건을 초당 rate_per_sec 속도로 연달아 보내고,
+    ES 에 메시지별 문서가 몇 건 들어왔는지(손실률)와 메시지별 로그 도착 시간을 잰다.
+
+    - 모든 메시지에 같은 burst 토큰 + 메시지별 토큰을 넣는다
+      → burst 토큰 한 번 조회로 전체 문서를 받고, 메시지 토큰으로 어느 메시지인지 구분
+    - 전송 요청(SEND_REQUEST_MATCHERS) 완료 건수도 세서 "브라우저가 안 보냄" 과 "DUT 가 안 남김" 을 구분
+    - 로그 도착 시간 = 전송 시각 ~ 그 메시지 문서가 처음 조회된 시각 (BURST_POLL_SEC 해상도)
+    - 손실률이 BURST_MAX_LOSS_RATE 를 넘으면 AssertionError
+
+    사용 예)
+        run_message_burst(
+            page, "dooray_messenger", SERVICE_NAMES_DOORAY_MESSENGER,
+            fill=lambda p, text: p.locator("textarea").fill(text),
+            send=lambda p: p.locator("textarea").press("Enter"),
+        )
+    """
+    burst_token = make_dlp_token()
+    message_tokens = [make_dlp_token() for _ in range(count)]
+    interval = 1.0 / rate_per_sec if rate_per_sec > 0 else 0
+
+    matcher = SEND_REQUEST_MATCHERS.get(service)
+    send_requests: List[str] = []
+
+    def on_request_finished(req):
+        if is_send_request(matcher, req):
+            send_requests.append(req.url)
+
+    # 1) 일정 속도로 연속 전송
+    sent_at: Dict[str, float] = {}
+    context = page.context
+    context.on("requestfinished", on_request_finished)
+    try:
+        with allure.step(f"[BURST] {service} {count}건 전송 ({rate_per_sec}/s, burst={burst_token})"):
+            next_send = time.monotonic()
+            for token in message_tokens:
+                delay = next_send - time.monotonic()
+                if delay > 0:
+                    page.wait_for_timeout(delay * 1000)
+                fill(page, "\n".join(DLP_NORMAL + [burst_token, token]))
+                send(page)
+                sent_at[token] = time.monotonic()
+                next_send += interval
+
+            # 마지막 전송 요청까지 끝나기를 잠시 대기
+            deadline = time.monotonic() + 10
+            while matcher and len(send_requests) < count and time.monotonic() < deadline:
+                page.wait_for_timeout(200)
+    finally:
+        context.remove_listener("requestfinished", on_request_finished)
+
+    send_duration = max(sent_at.values()) - min(sent_at.values()) if sent_at else 0
+    print(f"[BURST] {service}: {count}건 전송 {send_duration:.1f}s, 전송 요청 감지 {len(send_requests)}건")
+
+    # 2) ES 에 메시지별 문서가 모두 들어오거나 제한 시간이 지날 때까지 조회
+    first_seen: Dict[str, float] = {}
+    docs_per_token: Dict[str, int] = {}
+    deadline = time.monotonic() + BURST_LOG_TIMEOUT_SEC
+    with allure.step(f"[BURST] {service} ES 문서 수집 (최대 {BURST_LOG_TIMEOUT_SEC}s)"):
+        while True:
+            try:
+                hits = search_logs_from_es(service_names, size=count * 2, token=burst_token)
+            except requests.RequestException as e:
+                print(f"[BURST] ES 조회 실패 (재시도): {e}")
+                hits = []
+
+            now = time.monotonic()
+            docs_per_token = {}
+            for hit in hits:
+                source = json.dumps(hit.get("_source", {}), ensure_ascii=False)
+                for token in message_tokens:
+                    if token in source:
+                        docs_per_token[token] = docs_per_token.get(token, 0) + 1
+                        first_seen.setdefault(token, now)
+                        break
+
+            if len(first_seen) >= count or now >= deadline:
+                break
+            time.sleep(BURST_POLL_SEC)
+
+    # 3) 손실률 / 로그 도착 시간 분포
+    latencies = [int((first_seen[t] - sent_at[t]) * 1000) for t in message_tokens if t in first_seen]
+    lost = [i for i, t in enumerate(message_tokens, start=1) if t not in first_seen]
+    result = {
+        "service": service,
+        "burst_token": burst_token,
+        "count": count,
+        "rate_per_sec": rate_per_sec,
+        "send_duration_sec": round(send_duration, 1),
+        "send_requests": len(send_requests) if matcher else None,
+        "logged": len(first_seen),
+        "lost": len(lost),
+        "loss_rate": round(len(lost) / count, 3) if count else 0.0,
+        "lost_message_numbers": lost,
+        "duplicates": sum(n - 1 for n in docs_per_token.values() if n > 1),
+        "latency_ms": {
+            "min": min(latencies) if latencies else None,
+            "p50": _percentile(latencies, 0.5),
+            "p90": _percentile(latencies, 0.9),
+            "p99": _percentile(latencies, 0.99),
+            "max": max(latencies) if latencies else None,
+        },
+        "latencies_ms": latencies,
+    }
+    BURST_RESULTS.append(result)
+
+    print(f"[BURST] {service}: 로그 {result['logged']}/{count}건 (손실률 {result['loss_rate']:.1%}), "
+          f"도착 시간 p50={result['latency_ms']['p50']}ms p90={result['latency_ms']['p90']}ms "
+          f"max={result['latency_ms']['max']}ms")
+    allure.attach(
+        json.dumps(result, ensure_ascii=False, indent=2),
+        name=f"{service}_burst_result",
+        attachment_type=allure.attachment_type.JSON,
+    )
+
+    assert result["loss_rate"] <= BURST_MAX_LOSS_RATE, (
+        f"{service} burst 로그 손실: {result['lost']}/{count}건 누락 (메시지 번호 {lost}), "
+        f"손실률 {result['loss_rate']:.1%} > 허용 {BURST_MAX_LOSS_RATE:.1%}"
+    )
+    return result
+
+
+def summarize_burst() -> List[str]:
+    """
+    세션 종료 시 호출. 서비스별 손실률 / 로그 도착 시간 한 줄 요약.
+    """
+    lines = []
+    for r in BURST_RESULTS:
+        lat = r["latency_ms"]
+        lines.append(f"[BURST] {r['service']:<20} {r['logged']}/{r['count']}건 "
+                     f"손실 {r['loss_rate']:.1%} 중복 {r['duplicates']}  "
+                     f"도착 p50={lat['p50']}ms p90={lat['p90']}ms max={lat['max']}ms")
+    return lines
@@ -43,6 +43,61 @@ DLP_BASE_URL = f"https://{DUT_IP}:8443"
 # ES_URL = os.getenv("ES_URL", "http://xxx.xxx.xxx.xxx:xxxx")
 ES_URL = f"http://{DUT_IP}:xxxx"
 ES_INDEX_PATTERN = os.getenv("ES_INDEX_PATTERN", "log-*/session")
+# 테스트별 상관 토큰(dlp_token)을 찾을 ES 필드 (쉼표 구분, 기본: 전체 필드)
+ES_TOKEN_FIELDS = os.getenv("ES_TOKEN_FIELDS", "*").split(",")
+
+# ============================
+# 로그인 세션(storageState) 재사용 설정
+# ============================
+# storageState 파일 저장 폴더 (실행 위치 기준 상대 경로)
+SESSION_DIR = os.getenv("SESSION_DIR", "session")
+# 쿠키 만료까지 이 시간(초)보다 적게 남았으면 재로그인
+SESSION_EXPIRY_MARGIN_SEC = int(os.getenv("SESSION_EXPIRY_MARGIN_SEC", "600"))
+# storageState 저장 후 이 시간(초)이 지나면 쿠키와 상관없이 재로그인
+SESSION_MAX_AGE_SEC = int(os.getenv("SESSION_MAX_AGE_SEC", str(6 * 60 * 60)))
+
+# ============================
+# 병렬 실행 설정
+# ============================
+# 1 이면 기존처럼 pytest 1개로 순차 실행, 2 이상이면 ServiceName 그룹 단위로 나눠서 병렬 실행
+PARALLEL_WORKERS = int(os.getenv("PARALLEL_WORKERS", "1"))
+# pytest : 기존 pytest 실행 / async : base.async_runner 로 여러 서비스 플로우를 한 이벤트 루프에서 동시 실행
+EXECUTION_MODE = os.getenv("EXECUTION_MODE", "pytest").lower()
+# async 모드에서 동시에 진행할 플로우(브라우저 컨텍스트) 최대 개수
+ASYNC_CONCURRENCY = int(os.getenv("ASYNC_CONCURRENCY", "4"))
+# 테스트 1개(setup~teardown)의 벽시계 제한(초). 넘기면 Chromium 프로세스를 강제 종료하고 broken 처리 (0 이면 끔)
+TEST_DEADLINE_SEC = int(os.getenv("TEST_DEADLINE_SEC", "300"))
+# 브라우저 종료 후에도 테스트가 이 시간(초) 안에 안 끝나면 테스트 스레드에 예외를 넣어 중단
+TEST_DEADLINE_GRACE_SEC = int(os.getenv("TEST_DEADLINE_GRACE_SEC", "30"))
+
+# ============================
+# 브라우저 실행 / 네트워크 차단 설정
+# ============================
+# true 면 전체 실행을 headless 로 (디스플레이 없는 리눅스 장비용)
+HEADLESS = os.getenv("HEADLESS", "false").lower() in ("1", "true", "yes")
+# true 면 ROUTE_POLICIES 에 따라 DLP 와 무관한 3rd-party 정적 리소스를 차단
+ROUTE_BLOCKING = os.getenv("ROUTE_BLOCKING", "false").lower() in ("1", "true", "yes")
+# true 면 모듈의 *_login 테스트가 실패했을 때 같은 모듈의 나머지 케이스를 바로 skip
+LOGIN_GATING = os.getenv("LOGIN_GATING", "true").lower() in ("1", "true", "yes")
+# true 면 ES 검증을 기다리는 동안 같은 모듈의 다음 케이스 컨텍스트/시작 페이지를 미리 열어 둠
+CONTEXT_PREWARM = os.getenv("CONTEXT_PREWARM", "false").lower() in ("1", "true", "yes")
+# true 면 메신저 기본/패턴/키워드 케이스를 한 컨텍스트의 여러 탭에서 동시에 전송 (test_*_multitab)
+MULTI_TAB_SENDS = os.getenv("MULTI_TAB_SENDS", "false").lower() in ("1", "true", "yes")
+# true 면 open_service_page 가 서비스별 영구 프로필(launch_persistent_context)로 띄워서 HTTP 디스크 캐시를 재사용
+# (Playwright 라우팅은 캐시를 끄므로 이 모드에서는 ROUTE_BLOCKING 을 적용하지 않음)
+# 적용 범위: open_service_page 를 쓰는 모듈(현재 dooray_board, dooray_messenger, outlook_mail, naverworks_mail, naverworks_messenger)만.
+# 나머지 storageState 모듈은 browser.new_context(storage_state=...) 를 직접 쓰므로 이 값과 무관
+PERSISTENT_PROFILES = os.getenv("PERSISTENT_PROFILES", "false").lower() in ("1", "true", "yes")
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+# 프로필별 캐시 상한(MB) — 넘으면 다음 실행 전에 캐시 디렉터리 삭제
+PROFILE_CACHE_MAX_MB = int(os.getenv("PROFILE_CACHE_MAX_MB", "300"))
+# 프로필 생성 후 이 일수가 지나면 프로필 전체를 새로 만든다
+PROFILE_MAX_AGE_DAYS = int(os.getenv("PROFILE_MAX_AGE_DAYS", "7"))
+# true 면 모든 컨텍스트에 Playwright tracing 을 걸어 두고, 실패한 테스트의 trace 만 zip 으로 저장/첨부
+# 통과하는 테스트도 기록 비용을 내므로 기본 off (재현이 안 되는 실패를 쫓을 때만 켠다)
+TRACE_ON_FAILURE = os.getenv("TRACE_ON_FAILURE", "false").lower() in ("1", "true", "yes")
+# trace 에 스크린캐스트 프레임까지 남길지. 비용 대부분이 여기서 나오므로 기본 off (DOM 스냅샷만 기록)
+TRACE_SCREENSHOTS = os.getenv("TRACE_SCREENSHOTS", "false").lower() in ("1", "true", "yes")
 
 # ============================
 # allure Test Server 접속 URL
@@ -246,6 +301,144 @@ NAVERWORKS_MESSENGER_URL = os.getenv("NAVERWORKS_MESSENGER_URL", "https://talk.w
 NAVERWORKS_DRIVE_URL = os.getenv("NAVERWORKS_DRIVE_URL", "https://drive.worksmobile.com/drive/web/share/root")
 NAVERWORKS_SURVEY_URL = os.getenv("NAVERWORKS_SURVEY_URL", "https://form.worksmobile.com")
 
+# ============================
+# 서비스별 리소스 차단 정책 (ROUTE_BLOCKING=true 일 때만 적용)
+# ============================
+# 키: 서비스 키(예: "daum_mail") 또는 벤더 접두어(예: "daum"). 서비스 키가 우선.
+# - first_party : 이 도메인의 리소스는 절대 차단하지 않음
+# - allow_hosts : 3rd-party 라도 차단하지 않을 호스트
+# - deny_hosts  : 리소스 종류와 상관없이 차단할 호스트 (광고/분석)
+# - block_types : 3rd-party 일 때 차단할 resource_type
+# GET 이외의 요청과 ROUTE_NEVER_BLOCK_KEYWORDS 가 URL 에 포함된 요청은 항상 통과한다.
+ROUTE_NEVER_BLOCK_KEYWORDS = ["compose", "write", "upload", "send", "attach", "file"]
+
+ROUTE_POLICIES = {
+    "default": {
+        "first_party": [],
+        "allow_hosts": [],
+        "deny_hosts": [
+            "google-analytics.com",
+            "googletagmanager.com",
+            "doubleclick.net",
+            "googlesyndication.com",
+            "scorecardresearch.com",
+            "facebook.net",
+            "criteo.com",
+            "clarity.ms",
+        ],
+        "block_types": ["image", "media", "font"],
+    },
+    "dooray": {
+        "first_party": ["dooray.com"],
+    },
+    "naverworks": {
+        "first_party": ["worksmobile.com", "pstatic.net"],
+    },
+    "daum": {
+        "first_party": ["daum.net", "daumcdn.net", "kakao.com", "kakaocdn.net"],
+    },
+    "nate": {
+        "first_party": ["nate.com", "nateimg.co.kr"],
+    },
+    "outlook": {
+        "first_party": ["live.com", "office.com", "office.net", "microsoft.com", "msauth.net"],
+        "deny_hosts": ["browser.events.data.microsoft.com"],
+    },
+    "copilot": {
+        "first_party": ["microsoft.com", "bing.com", "live.com"],
+        "deny_hosts": ["browser.events.data.microsoft.com"],
+    },
+}
+
+# ============================
+# 서비스별 '전송 요청' matcher (send_and_wait_for_request 용)
+# ============================
+# 보내기/저장 클릭 후 이 URL 정규식 + method 에 맞는 요청의 응답이 끝나면 바로 다음 단계로 넘어간다.
+# - exclude : URL 이 이 정규식에 맞으면 전송으로 보지 않는다 (없으면 SEND_REQUEST_EXCLUDE)
+# - body    : 본문(본문이 없으면 헤더 값)에 이 정규식이 있어야 전송으로 인정 (임시저장과 URL 을 공유하는 서비스)
+# 출처: 각 웹 클라이언트의 전송 요청을 URL 이름으로 추정해 좁힌 값이며 트래픽 캡처로 검증된 값이 아니다.
+#       첫 실행 후 PROTOCOL_BASELINE_DIR/{service}.json 의 "send" 서명(실제로 잡힌 전송 요청)과 대조해 교정한다.
+# 안 잡히면 SEND_REQUEST_TIMEOUT_MS 만큼만 기다리고 ES 재시도 로직에 맡긴다. (PROTOCOL CHANGED 로도 보고)
+# 여기 등록 안 된 서비스는 고정 대기.
+SEND_REQUEST_EXCLUDE = r"(?i)(draft|tempsave|temp_save|autosave|auto-save|typing|presence)"
+SEND_REQUEST_MATCHERS = {
+    # 메일
+    "daum_mail": {"url": r"mail\.daum\.net/.*/send", "methods": ["POST"]},
+    "nate_mail": {"url": r"mail\d*\.nate\.com/.*send", "methods": ["POST"]},
+    "dooray_mail": {"url": r"dooray\.com/.*/mails(/send)?/?(\?|$)", "methods": ["POST"]},
+    "naverworks_mail": {"url": r"mail\.worksmobile\.com/.*send", "methods": ["POST"]},
+    "naverworks_memo": {"url": r"mail\.worksmobile\.com/.*memo", "methods": ["POST", "PUT"]},
+    # OWA 는 임시저장도 CreateItem(SaveOnly) → 보내기(SendAndSaveCopy / SendItem)만 인정
+    "outlook_mail": {"url": r"outlook\.(live|office)\.com/.*action=(CreateItem|SendItem)", "methods": ["POST"],
+                     "body": r"SendAndSaveCopy|SendItem"},
+    # 메신저 (채널 목록/읽음 처리 등은 제외하고 채널의 메시지 로그 등록만)
+    "dooray_messenger": {"url": r"dooray\.com/.*/channels/[^/]+/(logs|messages)/?(\?|$)", "methods": ["POST"]},
+    "naverworks_messenger": {"url": r"talk\.worksmobile\.com/.*(message|send)", "methods": ["POST"]},
+    # SNS / 댓글
+    "dooray_board": {"url": r"dooray\.com/.*(articles|posts)", "methods": ["POST"]},
+    "dooray_calendar": {"url": r"dooray\.com/.*(events|schedules)", "methods": ["POST"]},
+    "dooray_wiki": {"url": r"dooray\.com/.*(wikis|pages)", "methods": ["POST", "PUT"]},
+    "dooray_board_comment": {"url": r"dooray\.com/.*comments", "methods": ["POST"]},
+    "dooray_wiki_comment": {"url": r"dooray\.com/.*comments", "methods": ["POST"]},
+    "naverworks_board": {"url": r"board\.worksmobile\.com/.*(article|post)", "methods": ["POST"]},
+    "naverworks_board_comment": {"url": r"board\.worksmobile\.com/.*comment", "methods": ["POST"]},
+    "naverworks_calendar": {"url": r"calendar\.worksmobile\.com/.*(schedule|event)", "methods": ["POST", "PUT"]},
+    # 웹하드 / 업무공유
+    "dooray_drive": {"url": r"dooray\.com/.*(files|upload)", "methods": ["POST", "PUT"]},
+    "naverworks_drive": {"url": r"drive\.worksmobile\.com/.*upload", "methods": ["POST", "PUT"]},
+    "naverworks_survey": {"url": r"form\.worksmobile\.com/.*(survey|form)", "methods": ["POST", "PUT"]},
+    "dooray_workshare": {"url": r"dooray\.com/.*posts", "methods": ["POST"]},
+}
+# 전송 요청 대기 한도. 못 잡으면 이만큼만 기다리고 넘어가므로 예전 고정 대기(5초)보다 길지 않게 둔다.
+SEND_REQUEST_TIMEOUT_MS = int(os.getenv("SEND_REQUEST_TIMEOUT_MS", "5000"))
+
+# 첨부 파일 전송 확인: 첨부 단계에서 나간 요청 본문 합계가 (파일 크기 × 이 비율) 이상이어야 전송된 것으로 본다
+UPLOAD_MIN_RATIO = float(os.getenv("UPLOAD_MIN_RATIO", "0.9"))
+# 첨부 후 이 시간(ms) 안에 파일 크기만큼의 요청이 안 나가면 "file never left the browser" 로 즉시 실패
+UPLOAD_TIMEOUT_MS = int(os.getenv("UPLOAD_TIMEOUT_MS", "10000"))
+
+# 전송 요청 서명(host/경로 템플릿/method/본문 형식/크기 구간) 기준선 저장 위치
+PROTOCOL_BASELINE_DIR = os.getenv("PROTOCOL_BASELINE_DIR", "protocol_baseline")
+# true 면 기준선과 다른 서명을 기준선에 합친다 (서비스 변경을 확인하고 받아들일 때)
+PROTOCOL_UPDATE_BASELINE = os.getenv("PROTOCOL_UPDATE_BASELINE", "false").lower() in ("1", "true", "yes")
+
+# 작성 화면/첨부 화면 스크린샷의 perceptual hash 를 기준선과 비교 (UI 개편 조기 감지)
+UI_DRIFT_CHECK = os.getenv("UI_DRIFT_CHECK", "true").lower() in ("1", "true", "yes")
+UI_BASELINE_DIR = os.getenv("UI_BASELINE_DIR", "ui_baseline")
+# 해시 256비트 중 다른 비트 비율이 이 값을 넘으면 drift 로 보고
+UI_DRIFT_THRESHOLD = float(os.getenv("UI_DRIFT_THRESHOLD", "0.1"))
+# true 면 drift 난 화면을 새 기준선으로 저장 (UI 개편을 확인하고 받아들일 때)
+UI_DRIFT_UPDATE_BASELINE = os.getenv("UI_DRIFT_UPDATE_BASELINE", "false").lower() in ("1", "true", "yes")
+
+# ============================
+# 서비스별 '페이지 준비 완료' 조건 (goto_and_wait / click_and_wait_navigation 용)
+# ============================
+# networkidle 은 long-polling 하는 웹메일/협업툴에서 거의 오지 않으므로,
+# 이동한 URL 이 url 로 시작하면 아래 조건이 충족되는 시점을 '준비 완료' 로 본다.
+# - ready   : 보이면 준비 완료인 selector (로그인 전/후 화면을 모두 쓰는 경우 콤마로 나열)
+# - request : 이 정규식에 맞는 응답을 받으면 준비 완료 (ready 와 같이 쓰면 둘 다 기다림)
+# - exact   : True 면 url 과 정확히 같을 때만 적용 (로그인/홈 전용 selector 가 하위 경로 전체에 걸리지 않도록)
+# 등록되지 않은 URL 은 load 이벤트까지만 기다린다.
+READY_CONDITIONS = {
+    "daum": {"url": DAUM_BASE_URL, "ready": "a:has-text('카카오계정으로 로그인'), a:has-text('로그아웃')"},
+    "daum_mail": {"url": DAUM_MAIL_URL, "ready": "button:has-text('내게쓰기'), button:has-text('카카오로 로그인')"},
+    "nate": {"url": NATE_BASE_URL, "ready": "input[type='password'], a:has-text('로그아웃')"},
+    "nate_mail": {"url": NATE_MAIL_URL, "ready": "a:has-text('내게쓰기')"},
+    "outlook": {"url": OUTLOOK_BASE_URL, "ready": "input[type='email'], input[type='password'], button:has-text('새 메일')"},
+    "outlook_mail": {"url": OUTLOOK_MAIL_URL, "ready": "button:has-text('새 메일')"},
+    "dooray_messenger": {"url": f"{DOORAY_BASE_URL}/messenger", "ready": "textarea"},
+    "dooray": {"url": DOORAY_BASE_URL, "exact": True, "ready": "input[placeholder='아이디'], [data-testid='HomeLnb_ContainedButton']"},
+    "dooray_home": {"url": f"{DOORAY_BASE_URL}/home", "ready": "input[placeholder='아이디'], [data-testid='HomeLnb_ContainedButton']"},
+    "naverworks": {"url": NAVERWORKS_BASE_URL, "ready": "a:has-text('로그인')"},
+    # 메일 / 메모는 같은 NAVERWORKS_MAIL_URL 에서 시작
+    "naverworks_mail": {"url": NAVERWORKS_MAIL_URL, "ready": "a:has-text('메일쓰기'), a:has-text('메모쓰기')"},
+    "naverworks_messenger": {"url": NAVERWORKS_MESSENGER_URL, "ready": "#message-input"},
+    "naverworks_drive": {"url": NAVERWORKS_DRIVE_URL, "ready": "button:has-text('새로 만들기')"},
+}
+# 준비 실패 시 재시도 대기: READY_RETRY_BACKOFF_SEC * 2^(n-1), 최대 READY_RETRY_BACKOFF_MAX_SEC
+READY_RETRY_BACKOFF_SEC = float(os.getenv("READY_RETRY_BACKOFF_SEC", "1"))
+READY_RETRY_BACKOFF_MAX_SEC = float(os.getenv("READY_RETRY_BACKOFF_MAX_SEC", "8"))
+
 # NOTION_BASE_URL = os.getenv("NOTION_BASE_URL", "https://www.notion.com")
 # YAHOO_BASE_URL = os.getenv("YAHOO_BASE_URL", "https://mail.yahoo.com") 홈페이지 자동화 브라우저로 로그인 시 사용 불가
 # ============================
@@ -305,6 +498,78 @@ DLP_FILES = [
     str(TEST_FILES_DIR / "evernote.pdf"),
 ]
 
+# ============================
+# 대용량 본문(MB 단위) 모드
+# ============================
+# true 면 *_large_body 케이스 실행 (기본 회귀에서는 skip)
+LARGE_BODY_MODE = os.getenv("LARGE_BODY_MODE", "false").lower() in ("1", "true", "yes")
+# 생성할 본문 크기(KB) 목록 (쉼표 구분)
+LARGE_BODY_SIZES_KB = [int(s) for s in os.getenv("LARGE_BODY_SIZES_KB", "512,2048,5120").split(",")]
+# 패턴/키워드 블록을 몇 KB 마다 한 번 넣을지 (나머지는 DLP_NORMAL 로 채움)
+LARGE_BODY_UNIT_EVERY_KB = int(os.getenv("LARGE_BODY_UNIT_EVERY_KB", "64"))
+
+# ============================
+# 첨부파일 크기 스윕 모드
+# ============================
+# true 면 *_attach_sweep 케이스 실행 (기본 회귀에서는 skip)
+ATTACH_SWEEP_MODE = os.getenv("ATTACH_SWEEP_MODE", "false").lower() in ("1", "true", "yes")
+# 생성할 첨부 크기(KB) 목록 (서비스 한도를 넘는 크기는 그 서비스에서 제외)
+ATTACH_SWEEP_SIZES_KB = [int(s) for s in os.getenv("ATTACH_SWEEP_SIZES_KB", "1,64,512,1024,5120,10240,20480").split(",")]
+# 생성할 파일 종류 (txt: 일반 텍스트, bin: 난수, jpg: test.jpeg 뒤에 난수 덧붙임)
+ATTACH_SWEEP_TYPES = os.getenv("ATTACH_SWEEP_TYPES", "txt,bin,jpg").split(",")
+# 업로드 대기 시간 계산용 최소 업로드 속도 (KB/s) — 이보다 느리면 file never left the browser 로 실패
+ATTACH_SWEEP_MIN_KBPS = int(os.getenv("ATTACH_SWEEP_MIN_KBPS", "256"))
+# 서비스별 일반 첨부 한도 (KB). 넘으면 대용량 첨부(별도 업로드 경로)로 바뀌므로 스윕 상한으로 사용
+ATTACH_SIZE_LIMITS_KB = {
+    "daum_mail": 10 * 1024,
+    "nate_mail": 10 * 1024,
+    "dooray_mail": 20 * 1024,
+    "naverworks_mail": 20 * 1024,
+    "outlook_mail": 20 * 1024,
+}
+
+# ============================
+# DLP 검사 오버헤드 A/B 벤치마크 (드라이브 업로드)
+# ============================
+# true 면 *_drive_upload_bench 케이스 실행 (기본 회귀에서는 skip)
+BENCH_MODE = os.getenv("BENCH_MODE", "false").lower() in ("1", "true", "yes")
+# 경로별 브라우저 프록시. 빈 값이면 프록시 없이 직접 연결 (인라인 DUT 를 지나는 기본 경로)
+BENCH_DUT_PROXY = os.getenv("BENCH_DUT_PROXY", "")
+# DUT 를 거치지 않는 우회 경로 프록시 (예: http://xxx.xxx.xxx.xxx:3128). 비어 있으면 bypass 케이스 skip
+BENCH_BYPASS_PROXY = os.getenv("BENCH_BYPASS_PROXY", "")
+# 업로드 파일 크기(KB) 목록과 크기별 반복 횟수
+# (업로드한 bench_* 파일은 케이스가 끝날 때 드라이브 UI 로 삭제. 삭제에 실패하면 그 서비스의 남은 벤치 케이스는 실패)
+BENCH_SIZES_KB = [int(s) for s in os.getenv("BENCH_SIZES_KB", "1024,10240,30720").split(",")]
+BENCH_REPEATS = int(os.getenv("BENCH_REPEATS", "5"))
+
+# ============================
+# 메신저 연속 전송(burst) 모드
+# ============================
+# true 면 *_messenger_burst 케이스 실행 (기본 회귀에서는 skip)
+BURST_MODE = os.getenv("BURST_MODE", "false").lower() in ("1", "true", "yes")
+# 한 번에 보낼 메시지 수와 초당 전송 속도
+BURST_COUNT = int(os.getenv("BURST_COUNT", "30"))
+BURST_RATE_PER_SEC = float(os.getenv("BURST_RATE_PER_SEC", "2"))
+# 마지막 전송 후 ES 에 로그가 다 들어올 때까지 기다리는 최대 시간과 조회 간격(초)
+BURST_LOG_TIMEOUT_SEC = int(os.getenv("BURST_LOG_TIMEOUT_SEC", "120"))
+BURST_POLL_SEC = float(os.getenv("BURST_POLL_SEC", "1"))
+# 허용 손실률 (0.0 이면 한 건이라도 로그가 없으면 실패)
+BURST_MAX_LOSS_RATE = float(os.getenv("BURST_MAX_LOSS_RATE", "0.0"))
+
+# ============================
+# Copilot 프롬프트 크기 스윕 모드
+# ============================
+# true 면 test_copilot_free_prompt_sweep 케이스 실행 (기본 회귀에서는 skip)
+COPILOT_SWEEP_MODE = os.getenv("COPILOT_SWEEP_MODE", "false").lower() in ("1", "true", "yes")
+# 생성할 프롬프트 크기(KB) 목록 (쉼표 구분)
+COPILOT_SWEEP_SIZES_KB = [int(s) for s in os.getenv("COPILOT_SWEEP_SIZES_KB", "1,4,16,64").split(",")]
+# 민감정보 밀도: 패턴/키워드 블록을 몇 KB 마다 한 번 넣을지 (작을수록 밀도 높음, 프롬프트보다 큰 값은 제외)
+COPILOT_SWEEP_UNIT_EVERY_KB = [int(s) for s in os.getenv("COPILOT_SWEEP_UNIT_EVERY_KB", "1,4,16").split(",")]
+# 입력창 글자 수 한도. 넘는 프롬프트는 잘려서 기대값이 맞지 않으므로 skip
+# 실행 중 입력창(composer-input)의 maxlength 를 우선 읽고, 속성이 없을 때만 이 값을 쓴다.
+# 0 = 한도 모름 (설정값으로는 skip 하지 않음. 입력이 잘리면 insert_text_fast 가 "본문 입력 실패" 로 실패)
+COPILOT_PROMPT_MAX_CHARS = int(os.getenv("COPILOT_PROMPT_MAX_CHARS", "0"))
+
 
 
 
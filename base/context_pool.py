@@ -0,0 +1,118 @@
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from playwright.sync_api import BrowserContext, Page
+
+from base.config import CONTEXT_PREWARM, PERSISTENT_PROFILES
+from base.function import ES_WAIT_HOOKS
+from base.network import apply_route_policy
+from base.profile import launch_service_profile
+from base.session import get_session_path
+from base.tracing import start_failure_trace
+
+
+class ContextPool:
+    """
+    ES 검증을 기다리는 동안 같은 모듈 다음 케이스의 컨텍스트를 미리 만들어 두는 풀.
+
+    - 케이스는 open_service_page() 로 컨텍스트/페이지를 받는다
+      (미리 열어 둔 것이 있으면 그대로, 없으면 새로 생성)
+    - assert_es_logs_with_retry 가 ES 를 기다리기 직전(ES_WAIT_HOOKS)에 prewarm_next() 가 호출되어
+      방금 케이스와 같은 (벤더, 서비스, 시작 URL) 로 컨텍스트를 만들고 이동만 시작(commit)해 둔다
+      → 브라우저가 다음 페이지를 로드하는 동안 파이썬은 ES 를 기다린다
+    - 다음 케이스가 같은 모듈의 일반 케이스일 때만 미리 연다 (conftest 가 next_allowed 설정)
+    """
+
+    def __init__(self):
+        self._warm: Dict[Tuple[str, str, str], Tuple[BrowserContext, Page, float]] = {}
+        self.browser = None
+        self.current_spec: Optional[Tuple[str, str, str]] = None
+        self.next_allowed = False
+        # conftest 가 설정: 풀이 보관 중인 컨텍스트를 테스트 종료 정리 대상에서 빼고/넣는 함수
+        self.on_keep: Optional[Callable[[BrowserContext], None]] = None
+        self.on_release: Optional[Callable[[BrowserContext], None]] = None
+
+    def _new_context(self, browser, vendor: str, service: str, start_url: str):
+        if PERSISTENT_PROFILES:
+            context = launch_service_profile(browser.browser_type, vendor, service)
+            start_failure_trace(context)
+            page = context.pages[0] if context.pages else context.new_page()
+        else:
+            context = browser.new_context(storage_state=get_session_path(vendor))
+            apply_route_policy(context, service)
+            page = context.new_page()
+        page.goto(start_url, wait_until="commit")
+        return context, page
+
+    def open(self, browser, vendor: str, service: str, start_url: str) -> Tuple[BrowserContext, Page]:
+        """
+        (context, page) 를 돌려준다. page 는 start_url 로 이동을 시작한 상태이므로
+        케이스에서 wait_for_ready(page) 로 준비 완료까지 기다린 뒤 사용한다.
+        """
+        self.browser = browser
+        self.current_spec = (vendor, service, start_url)
+
+        warm = self._warm.pop(self.current_spec, None)
+        if warm is not None:
+            context, page, created = warm
+            if self.on_release:
+                self.on_release(context)
+            if not page.is_closed():
+                print(f"[POOL] {service}: 미리 열어 둔 컨텍스트 사용 ({time.monotonic() - created:.1f}s 전 생성)")
+                return context, page
+            context.close()
+
+        return self._new_context(browser, vendor, service, start_url)
+
+    def prewarm_next(self) -> None:
+        if not (CONTEXT_PREWARM and self.next_allowed and self.current_spec and self.browser):
+            return
+        if self.current_spec in self._warm or not self.browser.is_connected():
+            return
+        # 영구 프로필은 같은 디렉터리를 두 번 열 수 없으므로 미리 열지 않는다
+        if PERSISTENT_PROFILES:
+            return
+
+        vendor, service, start_url = self.current_spec
+        context, page = self._new_context(self.browser, vendor, service, start_url)
+        if self.on_keep:
+            self.on_keep(context)
+        self._warm[self.current_spec] = (context, page, time.monotonic())
+        print(f"[POOL] {service}: 다음 케이스용 컨텍스트 미리 생성 → {start_url}")
+
+    def discard(self) -> None:
+        """
+        모듈이 바뀌거나 세션이 끝날 때 쓰지 않은 컨텍스트를 닫는다.
+        현재 케이스 정보도 지워서, 다음 acquire 전 ES 대기 hook 이 이전 모듈 서비스를 다시 열지 않게 한다.
+        """
+        for context, _, _ in self._warm.values():
+            if self.on_release:
+                self.on_release(context)
+            try:
+                context.close()
+            except Exception as e:
+                print(f"[WARN] 미리 열어 둔 컨텍스트 정리 실패: {e}")
+        self._warm.clear()
+        self.current_spec = None
+
+
+CONTEXT_POOL = ContextPool()
+ES_WAIT_HOOKS.append(CONTEXT_POOL.prewarm_next)
+
+
+def open_service_page(browser, vendor: str, service: str, start_url: str) -> Tuple[BrowserContext, Page]:
+    """
+    케이스 시작용 (context, page). CONTEXT_PREWARM=false 면 매번 새로 만든다.
+    PERSISTENT_PROFILES=true 면 서비스별 영구 프로필로 띄운다. (context.close() 시 그 브라우저도 종료)
+    미리 열기 / 영구 프로필은 이 함수로 컨텍스트를 여는 모듈에만 적용된다. (현재 dooray_board, dooray_messenger, outlook_mail, naverworks_mail, naverworks_messenger)
+    다른 모듈에 적용하려면 new_context + goto 를 이 함수 + wait_for_ready(page) 로 바꾼다.
+
+    사용 예)
+        context, page = open_service_page(browser, "dooray", "dooray_board", f"{DOORAY_BASE_URL}/home")
+        try:
+            wait_for_ready(page)
+            ...
+        finally:
+            context.close()
+    """
+    return CONTEXT_POOL.open(browser, vendor, service, start_url)
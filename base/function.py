@@ -1,31 +1,132 @@
 from typing import List, Dict, Sequence, Union
 import requests
 import allure
-from base.config import ES_URL, ES_INDEX_PATTERN
+from base.config import ES_URL, ES_INDEX_PATTERN, ES_TOKEN_FIELDS, SEND_REQUEST_MATCHERS
+from base.config import SEND_REQUEST_EXCLUDE, SEND_REQUEST_TIMEOUT_MS
+from base.config import READY_CONDITIONS, READY_RETRY_BACKOFF_SEC, READY_RETRY_BACKOFF_MAX_SEC
+from base.config import UPLOAD_MIN_RATIO, UPLOAD_TIMEOUT_MS
+from base.tracing import save_failure_trace
+from base.protocol import record_protocol, request_signature
 import time
+import re
+import json
+import random
+import string
+import weakref
+from contextlib import contextmanager
 from requests.exceptions import ConnectionError, ReadTimeout
 from playwright.sync_api import Page, BrowserContext, TimeoutError
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 import os
 from datetime import datetime
+from urllib.parse import unquote
 
 
 
-def goto_and_wait(page: Page, url: str, timeout: int = 15000, retries: int = 2):
+# assert_es_logs_with_retry 가 ES 를 기다리기 직전에 호출하는 함수 목록
+ES_WAIT_HOOKS: List = []
+
+# 네비게이션별 준비 완료 시간 기록 (세션 종료 시 conftest 가 allure-results 에 저장)
+READY_TIMINGS: List[Dict] = []
+
+
+def resolve_ready_condition(url: str, ready=None):
+    """
+    url 에 적용할 준비 완료 조건. (ready 를 직접 넘기면 그것을 우선 사용)
+    READY_CONDITIONS 중 url 접두어가 가장 긴 항목을 고른다. (exact 항목은 끝의 "/" 를 빼고 같을 때만)
+    """
+    if ready is not None:
+        return "custom", {"ready": ready}
+
+    def matches(cond) -> bool:
+        if cond.get("exact"):
+            return url.rstrip("/") == cond["url"].rstrip("/")
+        return url.startswith(cond["url"])
+
+    matched = [(name, cond) for name, cond in READY_CONDITIONS.items() if matches(cond)]
+    if not matched:
+        return None, None
+    return max(matched, key=lambda item: len(item[1]["url"]))
+
+
+def _wait_until_ready(page: Page, navigate, cond, timeout: int):
+    """
+    navigate() 를 실행하고 cond(request/ready) 가 충족될 때까지 기다린다.
+    """
+    if cond and cond.get("request"):
+        request_re = re.compile(cond["request"])
+        with page.expect_response(lambda r: request_re.search(r.url) is not None, timeout=timeout):
+            navigate()
+    else:
+        navigate()
+
+    ready = cond.get("ready") if cond else None
+    if ready is not None:
+        # ready 는 selector 문자열 또는 page → Locator 함수
+        locator = ready(page) if callable(ready) else page.locator(ready)
+        locator.first.wait_for(state="visible", timeout=timeout)
+
+
+def record_ready_time(service, url: str, elapsed_ms: int, attempt: int, ok: bool):
+    READY_TIMINGS.append({
+        "service": service or "unregistered",
+        "url": url,
+        "elapsed_ms": elapsed_ms,
+        "attempt": attempt,
+        "ok": ok,
+    })
+    status = "준비 완료" if ok else "준비 실패"
+    print(f"[READY] {service or 'unregistered'}: {status} {elapsed_ms}ms (시도 {attempt}) {url}")
+
+
+def wait_for_ready(page: Page, url: str = None, timeout: int = 15000, ready=None, started: float = None):
     """
-    URL 이동 후 networkidle까지 대기.
-    실패하면 지정된 횟수만큼 재시도.
+    이미 이동을 시작한 페이지(예: 미리 열어 둔 컨텍스트)가 준비될 때까지 대기.
+    url 을 생략하면 현재 page.url 기준으로 READY_CONDITIONS 를 고른다.
+    started(time.monotonic) 를 넘기면 그 시점부터의 시간을 준비 시간으로 기록한다.
     """
+    url = url or page.url
+    service, cond = resolve_ready_condition(url, ready)
+    started = time.monotonic() if started is None else started
+
+    try:
+        if cond:
+            _wait_until_ready(page, lambda: None, cond, timeout)
+        else:
+            page.wait_for_load_state("load", timeout=timeout)
+    except TimeoutError:
+        record_ready_time(service, url, int((time.monotonic() - started) * 1000), 1, False)
+        raise
+
+    record_ready_time(service, url, int((time.monotonic() - started) * 1000), 1, True)
+    return page
+
+
+def goto_and_wait(page: Page, url: str, timeout: int = 15000, retries: int = 2, ready=None):
+    """
+    URL 이동 후 서비스별 준비 완료 조건(READY_CONDITIONS)까지 대기.
+    실패하면 지수 백오프로 지정된 횟수만큼 재시도.
+
+    - ready 로 selector 문자열 / page → Locator 함수를 넘기면 등록된 조건 대신 사용
+    - 등록된 조건이 없으면 load 이벤트까지만 대기
+    - 시도별 준비 시간은 READY_TIMINGS 에 기록
+    """
+    service, cond = resolve_ready_condition(url, ready)
+    wait_until = "domcontentloaded" if cond else "load"
     attempt = 0
 
     while attempt <= retries:
+        started = time.monotonic()
         try:
             print(f"[goto_and_wait] 페이지 이동 시도 {attempt+1}/{retries+1}: {url}")
-            page.goto(url, wait_until="networkidle", timeout=timeout)
+            _wait_until_ready(page, lambda: page.goto(url, wait_until=wait_until, timeout=timeout),
+                              cond, timeout)
+            record_ready_time(service, url, int((time.monotonic() - started) * 1000), attempt + 1, True)
             print("[goto_and_wait] 페이지 로드 성공")
             return page
 
         except TimeoutError:
+            record_ready_time(service, url, int((time.monotonic() - started) * 1000), attempt + 1, False)
             attempt += 1
             print(f"[goto_and_wait] 로드 실패 (Timeout). 재시도: {attempt}/{retries}")
 
@@ -33,21 +134,28 @@ def goto_and_wait(page: Page, url: str, timeout: int = 15000, retries: int = 2):
                 print("[goto_and_wait] 모든 재시도 실패 → 예외 발생")
                 raise
 
-            # 재시도 전 잠깐 대기
-            time.sleep(2)
+            # 재시도 전 백오프 대기
+            backoff = min(READY_RETRY_BACKOFF_SEC * (2 ** (attempt - 1)), READY_RETRY_BACKOFF_MAX_SEC)
+            print(f"[goto_and_wait] {backoff:.1f}초 후 재시도")
+            time.sleep(backoff)
 
 def click_and_wait_navigation(page: Page, selector=None, role=None, name=None,
-                              timeout: int = 15000):
+                              timeout: int = 15000, ready=None):
     """
-    클릭 → 같은 탭에서 페이지 이동(expect_navigation) → 로드될 때까지 대기.
+    클릭 → 같은 탭에서 페이지 이동(expect_navigation) → 준비 완료 조건까지 대기.
     새 창(pop-up)이 아니라, 현재 탭에서 리디렉션되는 경우에 사용.
+
+    - ready 를 넘기면 그 조건, 아니면 이동한 URL 의 READY_CONDITIONS 로 판단
     """
-    with page.expect_navigation(wait_until="networkidle", timeout=timeout):
+    started = time.monotonic()
+
+    with page.expect_navigation(wait_until="domcontentloaded", timeout=timeout):
         if selector:
             page.locator(selector).click()
         else:
             page.get_by_role(role, name=name).click()
 
+    wait_for_ready(page, timeout=timeout, ready=ready, started=started)
     return page  # 같은 Page 그대로 반환
 
 def click_confirm_if_popup_exists(page, timeout=3000):
@@ -59,59 +167,499 @@ def click_confirm_if_popup_exists(page, timeout=3000):
     - role=button name='확인'
     - 텍스트 '확인'
     - data-testid 등 fallback locator
+
+    세 패턴을 or_ 로 묶어서 한 번만 기다린다. (팝업이 없으면 timeout 1회분만 소모)
     """
 
     confirm_locators = [
-        page.get_by_role("button", name="확인"),
-        page.locator("button:has-text('확인')"),
-        page.locator("text=확인"),  # fallback
+        ("role=button[name='확인']", page.get_by_role("button", name="확인")),
+        ("button:has-text('확인')", page.locator("button:has-text('확인')")),
+        ("text=확인", page.locator("text=확인")),  # fallback
     ]
 
-    for locator in confirm_locators:
+    combined = confirm_locators[0][1]
+    for _, locator in confirm_locators[1:]:
+        combined = combined.or_(locator)
+
+    try:
+        combined.first.wait_for(state="visible", timeout=timeout)
+    except TimeoutError:
+        print("▶ [DEBUG] 팝업 없음 또는 '확인' 버튼 미발견 → 스킵")
+        return False
+
+    # 어떤 패턴으로 잡혔는지 확인해서 그 locator 로 클릭 (앞쪽 패턴 우선)
+    for label, locator in confirm_locators:
         try:
-            locator.wait_for(timeout=timeout)
-            locator.click()
-            print("✔ [DEBUG] 팝업 '확인' 버튼 클릭됨")
-            return True
-        except TimeoutError:
-            continue
+            if locator.first.is_visible():
+                locator.first.click()
+                print(f"✔ [DEBUG] 팝업 '확인' 버튼 클릭됨 (패턴: {label})")
+                return True
         except Exception:
             continue
 
-    print("▶ [DEBUG] 팝업 없음 또는 '확인' 버튼 미발견 → 스킵")
+    print("▶ [DEBUG] 팝업이 클릭 전에 사라짐 → 스킵")
     return False
 
-def safe_send_with_popup_retry(page, max_retry=3, wait_sec=3):
+# 페이지에 '확인' 버튼이 새로 보이면 파이썬 쪽으로 알려 주는 MutationObserver
+# - 표시 여부를 바꾸는 속성만 보고, 변경 묶음은 프레임당 한 번만 검사 (검사마다 layout 이 일어나므로)
+# - safe_send_with_popup_retry 가 끝나면 _POPUP_OBSERVER_STOP_JS 로 해제
+_POPUP_OBSERVER_JS = """
+() => {
+    if (window.__dlpPopupObserver) return;
+    const visibleConfirm = () => Array.from(document.querySelectorAll("button, [role='button']"))
+        .some(b => b.offsetParent !== null && (b.innerText || "").trim() === "확인");
+    let shown = false;
+    let scheduled = false;
+    window.__dlpPopupObserver = new MutationObserver(() => {
+        if (scheduled) return;
+        scheduled = true;
+        requestAnimationFrame(() => {
+            scheduled = false;
+            const now = visibleConfirm();
+            if (now && !shown) window.__dlpPopupSeen();
+            shown = now;
+        });
+    });
+    window.__dlpPopupObserver.observe(document.body, {
+        childList: true,
+        subtree: true,
+        attributeFilter: ["style", "class", "hidden", "aria-hidden"],
+    });
+}
+"""
+
+_POPUP_OBSERVER_STOP_JS = """
+() => {
+    if (!window.__dlpPopupObserver) return;
+    window.__dlpPopupObserver.disconnect();
+    delete window.__dlpPopupObserver;
+}
+"""
+
+# 페이지별 팝업 감지 횟수 (expose_function 은 페이지당 한 번만 등록 가능)
+_popup_seen_counts = weakref.WeakKeyDictionary()
+
+
+def _watch_confirm_popup(page) -> None:
+    if page not in _popup_seen_counts:
+        _popup_seen_counts[page] = 0
+
+        def on_popup_seen():
+            _popup_seen_counts[page] = _popup_seen_counts.get(page, 0) + 1
+
+        page.expose_function("__dlpPopupSeen", on_popup_seen)
+
+    page.evaluate(_POPUP_OBSERVER_JS)
+
+
+def _unwatch_confirm_popup(page) -> None:
+    # 오래 유지되는 페이지(service_page)에서 다음 케이스 / 에디터 입력까지 감시가 남지 않게 해제
+    try:
+        if not page.is_closed():
+            page.evaluate(_POPUP_OBSERVER_STOP_JS)
+    except Exception as e:
+        print(f"[WARN] 팝업 감시 스크립트 해제 실패 (무시): {e}")
+
+
+def _wait_send_outcome(page, state, timeout_ms: int, popup_seen_before: int, dialogs_before: int) -> str:
+    """
+    전송 요청 완료 / DOM 팝업 / JS dialog 중 먼저 일어난 것을 돌려준다.
+    (리스너가 채운 state 를 보면서 100ms 단위로 이벤트를 처리)
+    """
+    deadline = time.monotonic() + timeout_ms / 1000
+    while time.monotonic() < deadline:
+        if state["sent"]:
+            return "sent"
+        if _popup_seen_counts.get(page, 0) > popup_seen_before:
+            return "popup"
+        if len(state["dialogs"]) > dialogs_before:
+            return "dialog"
+        page.wait_for_timeout(100)
+    return "timeout"
+
+
+def safe_send_with_popup_retry(page, max_retry=3, wait_sec=3, service=None, timeout=10000):
     """
     '보내기' 버튼을 누르고, 팝업이 뜨면 '확인' 클릭 후 다시 시도.
     최대 max_retry 회 반복.
+
+    - 클릭 전에 dialog / DOM 팝업(MutationObserver) / 전송 요청 리스너를 걸어 두고,
+      셋 중 먼저 일어난 이벤트에 바로 반응한다. (고정 대기 없음)
+    - service 가 SEND_REQUEST_MATCHERS 에 있으면 전송 요청이 끝나는 즉시 성공으로 종료
+    - service 가 없으면 팝업 대기 창(2.5초) 동안 팝업이 없으면 성공으로 간주 (기존 동작)
+    - 시도별 결과는 Allure step 으로 남는다
+    - 반환값: 전송 확인(또는 matcher 없는 서비스의 팝업 없음) True,
+      matcher 가 있는데 timeout 동안 전송 요청이 안 잡혔거나 재시도 소진이면 False
+      (False 여도 예외는 없음. 실제 전송 여부는 호출 측 ES 검증이 판정)
     """
-    for attempt in range(1, max_retry + 1):
-        print(f"▶ [DEBUG] 보내기 시도 {attempt}/{max_retry}")
+    matcher = SEND_REQUEST_MATCHERS.get(service) if service else None
+    window_ms = timeout if matcher else 2500
+
+    state = {"sent": None, "dialogs": []}
+
+    def on_request_finished(req):
+        if is_send_request(matcher, req):
+            state["sent"] = req.url
+
+    def on_dialog(dialog):
+        state["dialogs"].append(dialog.message)
+        print(f"▶ [DEBUG] dialog 감지 → 수락: {dialog.message}")
+        dialog.accept()
+
+    page.context.on("requestfinished", on_request_finished)
+    page.on("dialog", on_dialog)
 
-        # 1) 보내기 버튼 클릭
+    try:
+        try:
+            _watch_confirm_popup(page)
+        except Exception as e:
+            print(f"[WARN] 팝업 감시 스크립트 설치 실패 (dialog/요청 감지만 사용): {e}")
+
+        for attempt in range(1, max_retry + 1):
+            print(f"▶ [DEBUG] 보내기 시도 {attempt}/{max_retry}")
+
+            with allure.step(f"보내기 시도 {attempt}/{max_retry}"):
+                popup_seen_before = _popup_seen_counts.get(page, 0)
+                dialogs_before = len(state["dialogs"])
+
+                # 1) 보내기 버튼 클릭
+                try:
+                    page.get_by_label("보내기", exact=True).click(timeout=2000)
+                    print("✔ [DEBUG] '보내기' 버튼 클릭")
+                except Exception:
+                    if state["sent"]:
+                        print("✔ [DEBUG] 전송 요청 완료 후 '보내기' 버튼 사라짐 → 성공")
+                        return True
+                    print("▶ [DEBUG] '보내기' 버튼 없음 → 종료")
+                    return False
+
+                # 2) 전송 / 팝업 / dialog 중 먼저 일어난 것 처리
+                outcome = _wait_send_outcome(page, state, window_ms, popup_seen_before, dialogs_before)
+
+                with allure.step(f"결과: {outcome}"):
+                    if outcome == "sent":
+                        print(f"✔ [DEBUG] 전송 요청 완료 감지 → 보내기 성공 ({state['sent']})")
+                        return True
+
+                    if outcome == "timeout":
+                        if matcher:
+                            print(f"▶ [DEBUG] {timeout}ms 동안 전송 요청/팝업 없음 → 전송 미확인, ES 재시도에 맡김")
+                            return False
+                        print("✔ [DEBUG] 팝업 없음 → 보내기 성공 완료")
+                        return True
+
+                    # 팝업(dialog 는 이미 수락됨) 처리 후, 그 사이 전송이 나가는지 wait_sec 동안 확인
+                    if outcome == "popup":
+                        click_confirm_if_popup_exists(page, timeout=1000)
+
+                    if _wait_send_outcome(page, state, wait_sec * 1000,
+                                          _popup_seen_counts.get(page, 0), len(state["dialogs"])) == "sent":
+                        print(f"✔ [DEBUG] 팝업 처리 후 전송 요청 완료 감지 ({state['sent']})")
+                        return True
+                    # → 다시 보내기 버튼 누름
+
+        print("❗ [DEBUG] 최대 재시도 도달 → 종료")
+        return False
+
+    finally:
+        page.context.remove_listener("requestfinished", on_request_finished)
+        page.remove_listener("dialog", on_dialog)
+        _unwatch_confirm_popup(page)
+
+def is_send_request(matcher, req) -> bool:
+    """
+    요청이 SEND_REQUEST_MATCHERS 항목(method + url, exclude / body)에 맞는지.
+    sync / async Request 모두 사용 가능 (속성만 읽음)
+    """
+    if not matcher or req.method not in matcher["methods"]:
+        return False
+    if re.search(matcher["url"], req.url) is None:
+        return False
+    if re.search(matcher.get("exclude", SEND_REQUEST_EXCLUDE), req.url):
+        return False
+    if matcher.get("body"):
         try:
-            page.get_by_label("보내기", exact=True).click(timeout=2000)
-            print("✔ [DEBUG] '보내기' 버튼 클릭")
+            payload = req.post_data or ""
         except Exception:
-            print("▶ [DEBUG] '보내기' 버튼 없음 → 종료")
-            return False
+            payload = ""
+        if not payload:
+            # OWA 처럼 요청 내용을 헤더(x-owa-urlpostdata 등)에 URL 인코딩해서 보내는 경우
+            payload = " ".join(unquote(v) for v in req.headers.values())
+        return re.search(matcher["body"], payload) is not None
+    return True
 
-        # 2) 팝업 확인 처리
-        popup_clicked = click_confirm_if_popup_exists(page, timeout=2500)
 
-        # 팝업이 있었다면 wait
-        if popup_clicked:
-            print(f"⏳ [DEBUG] 팝업 처리 후 {wait_sec}초 대기")
-            page.wait_for_timeout(wait_sec * 1000)
-            continue  # → 다시 보내기 버튼 누름
+def send_and_wait_for_request(page, service, send_action, timeout: int = None,
+                              fallback_ms: int = 5000, files=None):
+    """
+    보내기/저장 동작(send_action)을 서비스별 '전송 요청' matcher 로 감싸서,
+    그 요청의 응답이 끝나는 즉시 반환한다. (보내기 후 고정 wait_for_timeout 대체)
+
+    - matcher 는 SEND_REQUEST_MATCHERS[service] (is_send_request 로 판정)
+    - 동작 시작 ~ 전송 완료 사이에 나간 GET 이외 요청의 본문 크기를 합산해 업로드 바이트로 기록
+    - matcher 가 없는 서비스는 기존처럼 fallback_ms 만큼 고정 대기 후 None
+    - matcher 가 timeout(기본 SEND_REQUEST_TIMEOUT_MS) 안에 안 잡히면 경고 + 프로토콜 변경 보고 후 None
+      (ES 재시도 로직에 맡김)
+    - files 를 넘기면 (matcher 미감지여도) 전송 구간 업로드 바이트가 파일 크기 × UPLOAD_MIN_RATIO 미만일 때
+      "file never left the browser" 로 바로 실패
+
+    사용 예)
+        send_and_wait_for_request(page, "daum_mail", page.get_by_role("button", name="보내기").click)
+    """
+    matcher = SEND_REQUEST_MATCHERS.get(service)
+    if matcher is None:
+        send_action()
+        print(f"[SEND] {service}: 전송 요청 matcher 없음 → {fallback_ms}ms 고정 대기")
+        page.wait_for_timeout(fallback_ms)
+        return None
 
-        # 팝업이 없으면 성공으로 간주
-        print("✔ [DEBUG] 팝업 없음 → 보내기 성공 완료")
-        return True
+    timeout = SEND_REQUEST_TIMEOUT_MS if timeout is None else timeout
+
+    # 전송 구간에 나간 업로드성 요청 수집
+    outgoing = []
+
+    def on_request(req):
+        if req.method != "GET":
+            outgoing.append(req)
+
+    context = page.context
+    context.on("request", on_request)
+    started = time.monotonic()
+
+    try:
+        with context.expect_event("requestfinished", predicate=lambda req: is_send_request(matcher, req),
+                                  timeout=timeout) as finished_info:
+            send_action()
+        send_request = finished_info.value
+
+    except PlaywrightTimeoutError:
+        print(f"[SEND] {service}: {timeout}ms 안에 전송 요청({matcher['url']}) 미감지 → ES 재시도에 맡김")
+        # 전송 URL 이 바뀐 가장 흔한 증상이므로, 구간에 나간 요청 서명으로 프로토콜 변경을 남긴다
+        upload_bytes, other_signatures = _outgoing_body_signatures(outgoing)
+        try:
+            record_protocol(service, None, other_signatures)
+        except Exception as e:
+            print(f"[WARN] {service}: 프로토콜 기준선 비교 실패 (무시): {e}")
+        if files is not None:
+            _assert_files_left(service, files, upload_bytes)
+        return None
+
+    finally:
+        context.remove_listener("request", on_request)
+
+    elapsed_ms = int((time.monotonic() - started) * 1000)
+
+    upload_bytes, other_signatures = _outgoing_body_signatures(outgoing, exclude=send_request)
+
+    # 전송 요청 서명을 서비스별 기준선과 비교 (프로토콜 변경 감지)
+    send_signature = request_signature(
+        send_request.method, send_request.url,
+        send_request.headers.get("content-type", ""),
+        _request_body_size(send_request),
+    )
+    try:
+        protocol_findings = record_protocol(service, send_signature, other_signatures)
+    except Exception as e:
+        print(f"[WARN] {service}: 프로토콜 기준선 비교 실패 (무시): {e}")
+        protocol_findings = []
+
+    response = send_request.response()
+    result = {
+        "service": service,
+        "url": send_request.url,
+        "method": send_request.method,
+        "status": response.status if response else None,
+        "request_body_bytes": send_request.sizes().get("requestBodySize", 0),
+        "upload_bytes": upload_bytes,
+        "outgoing_requests": len(outgoing),
+        "elapsed_ms": elapsed_ms,
+        "signature": send_signature,
+        "protocol_findings": protocol_findings,
+    }
+
+    print(f"[SEND] {service}: {result['method']} {result['url']} → {result['status']} "
+          f"({elapsed_ms}ms, upload {upload_bytes} bytes)")
+    allure.attach(
+        json.dumps(result, ensure_ascii=False, indent=2),
+        name=f"{service}_send_request",
+        attachment_type=allure.attachment_type.JSON,
+    )
+
+    if files is not None:
+        _assert_files_left(service, files, upload_bytes, send_seen=True)
+
+    return result
+
+
+def _assert_files_left(service, files, upload_bytes: int, send_seen: bool = False) -> None:
+    expected = _expected_upload_bytes(files)
+    if upload_bytes == 0 and send_seen:
+        # 전송 요청은 잡혔는데 본문 크기를 하나도 못 읽음 → 크기 측정 실패로 보고 ES 검증에 맡김
+        print(f"[WARN] {service}: 전송 요청은 감지됐지만 업로드 바이트를 측정하지 못함 "
+              f"(파일 {expected} bytes) → 파일 전송 확인 생략")
+        allure.attach(
+            f"send request seen, upload bytes not measurable (0 / {expected} bytes)",
+            name=f"{service}_upload_bytes_unmeasured",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+        return
+    assert upload_bytes >= int(expected * UPLOAD_MIN_RATIO), (
+        f"file never left the browser: {service} 전송 구간 업로드 {upload_bytes} bytes "
+        f"< 파일 {expected} bytes × {UPLOAD_MIN_RATIO}"
+    )
+
+def _outgoing_body_signatures(outgoing, exclude=None):
+    # 전송 구간에 나간 요청들의 본문 합계와 (exclude 를 뺀) 요청 서명 목록
+    upload_bytes = 0
+    signatures = []
+    for req in outgoing:
+        body_size = _request_body_size(req)
+        upload_bytes += body_size
+        if req is not exclude:
+            signatures.append(
+                request_signature(req.method, req.url, req.headers.get("content-type", ""), body_size)
+            )
+    return upload_bytes, signatures
+
+
+def _request_body_size(req) -> int:
+    """
+    요청 본문 크기 (bytes).
+    디스크 파일 / Blob 을 multipart 로 올리면 requestBodySize / post_data_buffer 에는
+    파일 내용이 빠진 multipart 틀만 잡힐 수 있으므로, Content-Length 헤더가 더 크면 그 값을 쓴다.
+    """
+    body_size = 0
+    try:
+        body_size = req.sizes().get("requestBodySize", 0)
+    except Exception:
+        try:
+            body_size = len(req.post_data_buffer or b"")
+        except Exception:
+            pass
+
+    try:
+        content_length = int(req.all_headers().get("content-length") or 0)
+    except Exception:
+        content_length = 0
+    return max(body_size, content_length)
+
+
+def _as_file_list(files) -> list:
+    # 경로 1개 / 경로 목록 / set_files 용 payload({"name", "mimeType", "buffer"}) 모두 허용
+    return [files] if isinstance(files, (str, os.PathLike, dict)) else list(files)
+
+
+def _expected_upload_bytes(files) -> int:
+    return sum(len(f["buffer"]) if isinstance(f, dict) else os.path.getsize(f) for f in _as_file_list(files))
+
+
+def _request_end_epoch_ms(req):
+    # 요청 응답이 끝난 시각 (epoch ms). timing 이 없으면 None
+    try:
+        timing = req.timing
+        if timing.get("responseEnd", -1) < 0:
+            return None
+        return timing["startTime"] + timing["responseEnd"]
+    except Exception:
+        return None
+
+
+@contextmanager
+def expect_file_transmitted(page, files, timeout: int = None, min_ratio: float = None,
+                            wait_settled: bool = False):
+    """
+    첨부 단계를 감싸서, 그 사이 브라우저에서 나간 요청(GET 제외)의 본문 크기를 모은다.
+    with 블록이 끝난 뒤 timeout 안에 본문 합계가 파일 크기 × min_ratio 에 못 미치면
+    ES 를 기다리지 않고 바로 "file never left the browser" 로 실패시킨다.
+    (분할 업로드도 합계로 판단)
+    as 로 받은 dict 는 블록이 끝나면 전송 기록(transmitted_bytes, elapsed_ms 등)으로 채워진다.
+
+    - wait_settled=True 면 기준 바이트 도달 후에도 구간 안에서 시작된 GET 이외 요청이
+      모두 응답을 받을 때까지 기다린다. (남은 청크 / 업로드 완료 요청까지 포함한 시간이 필요한 벤치마크용,
+      timeout 까지 안 끝난 요청은 pending_requests 로 기록)
+
+    사용 예)
+        with expect_file_transmitted(page, DLP_FILE) as upload:
+            file_chooser.set_files(DLP_FILE)
+        print(upload["elapsed_ms"])
+    """
+    timeout = UPLOAD_TIMEOUT_MS if timeout is None else timeout
+    min_ratio = UPLOAD_MIN_RATIO if min_ratio is None else min_ratio
+    expected = _expected_upload_bytes(files)
+    threshold = int(expected * min_ratio)
+
+    finished = []
+    sizes = {}
+    record = {}
+    pending = {}
+
+    def on_request(req):
+        if req.method != "GET":
+            pending[id(req)] = req
+
+    def on_finished(req):
+        if req.method != "GET":
+            finished.append(req)
+            pending.pop(id(req), None)
+
+    def on_failed(req):
+        pending.pop(id(req), None)
+
+    def transmitted() -> int:
+        for req in finished:
+            if id(req) not in sizes:
+                sizes[id(req)] = _request_body_size(req)
+        return sum(sizes.values())
+
+    context = page.context
+    context.on("request", on_request)
+    context.on("requestfinished", on_finished)
+    context.on("requestfailed", on_failed)
+    started = time.monotonic()
+    started_epoch_ms = time.time() * 1000
+
+    try:
+        yield record
+        deadline = started + timeout / 1000
+        while transmitted() < threshold and time.monotonic() < deadline:
+            page.wait_for_timeout(200)
+        while wait_settled and pending and time.monotonic() < deadline:
+            page.wait_for_timeout(200)
+    finally:
+        context.remove_listener("request", on_request)
+        context.remove_listener("requestfinished", on_finished)
+        context.remove_listener("requestfailed", on_failed)
+
+    total = transmitted()
+    # 마지막 업로드 요청이 끝난 시점까지 (폴링 간격과 무관한 실제 업로드 시간)
+    ends = [end for end in (_request_end_epoch_ms(r) for r in finished) if end is not None]
+    record.update({
+        "files": [f["name"] if isinstance(f, dict) else f for f in _as_file_list(files)],
+        "file_bytes": expected,
+        "threshold_bytes": threshold,
+        "transmitted_bytes": total,
+        "elapsed_ms": int((time.monotonic() - started) * 1000),
+        "upload_ms": int(max(ends) - started_epoch_ms) if ends else None,
+        "requests": [
+            {"url": r.url, "method": r.method, "body_bytes": sizes.get(id(r), 0)} for r in finished
+        ],
+    })
+    if wait_settled:
+        record["pending_requests"] = [{"url": r.url, "method": r.method} for r in pending.values()]
+        if pending:
+            print(f"[UPLOAD] {timeout}ms 안에 응답을 못 받은 요청 {len(pending)}건 → 업로드 시간에서 제외")
+    allure.attach(
+        json.dumps(record, ensure_ascii=False, indent=2),
+        name="upload_requests",
+        attachment_type=allure.attachment_type.JSON,
+    )
+
+    assert total >= threshold, (
+        f"file never left the browser: 첨부 후 {timeout}ms 동안 전송된 본문 {total} bytes "
+        f"< 파일 {expected} bytes × {min_ratio} (요청 {len(finished)}건)"
+    )
+    print(f"[UPLOAD] 파일 전송 확인: {total}/{expected} bytes ({record['elapsed_ms']}ms, 요청 {len(finished)}건)")
 
-    print("❗ [DEBUG] 최대 재시도 도달 → 종료")
-    return False
 
 def get_screenshot_path(test_name):
     screenshot_dir = os.path.join(os.getcwd(), "report", "screenshots")
@@ -121,7 +669,7 @@ def get_screenshot_path(test_name):
 
 def capture_failure_screenshot(page, request, timeout: int = 5000):
     """
-    실패 시 스크린샷 + allure 첨부를 한 번에 처리하는 헬퍼.
+    실패 시 스크린샷 + trace(zip) + allure 첨부를 한 번에 처리하는 헬퍼.
 
     - 테스트 함수 시그니처에 `request` fixture 만 추가해 두면
       request.node.name 으로 현재 테스트 이름을 자동 사용한다.
@@ -155,8 +703,19 @@ def capture_failure_screenshot(page, request, timeout: int = 5000):
         # 그 외 스크린샷 관련 예외
         print(f"[WARN] Screenshot capture failed for {test_name}: {e}")
 
+    # 통과한 테스트는 trace 를 저장하지 않고, 실패한 경우에만 현재 구간을 저장
+    if page is not None:
+        save_failure_trace(page.context, test_name)
+
     return screenshot_path
 
+def make_dlp_token(length: int = 12) -> str:
+    """
+    ES 문서를 정확히 찾기 위한 테스트별 고유 토큰.
+    숫자가 섞이면 DLP 패턴(전화번호/계좌 등)으로 카운트될 수 있어 영문 소문자만 사용한다.
+    """
+    return "dlpqa" + "".join(random.choices(string.ascii_lowercase, k=length))
+
 def search_logs_from_es(
     service_name: Union[str, Sequence[str]],
     size: int = 1,
@@ -165,11 +724,13 @@ def search_logs_from_es(
     timeout: int = 10,
     max_retries: int = 3,          # ✅ 재시도 횟수 추가
     retry_interval: float = 1.0,   # ✅ 재시도 간격(초)
+    token: str | None = None,
 ):
     """
         service_name: str  또는 [str, str, ...]
           - str     : 한 개 서비스명
           - list/tuple : 여러 서비스명(한글/영어 등)을 OR 조건으로 검색
+        token: 지정하면 해당 토큰이 들어있는 문서만 검색 (제목/본문에 넣은 dlp_token)
         """
 
     # 항상 리스트 형태로 맞추기
@@ -183,12 +744,25 @@ def search_logs_from_es(
         for name in service_names
     ]
 
+    bool_query = {
+        "should": should_clauses,
+        "minimum_should_match": 1,
+    }
+
+    if token:
+        bool_query["must"] = [
+            {
+                "query_string": {
+                    "query": f'"{token}"',
+                    "fields": ES_TOKEN_FIELDS,
+                    "lenient": True,
+                }
+            }
+        ]
+
     query = {
         "query": {
-            "bool": {
-                "should": should_clauses,
-                "minimum_should_match": 1,
-            }
+            "bool": bool_query
         },
         "sort": [
             {"@timestamp": {"order": "desc"}}
@@ -319,10 +893,16 @@ def assert_es_logs(
     test_cases: List[Dict],
     size: int | None = None,   # ← 기본값 None 으로 변경
     # size: int = 1, # 1개만 볼 때
+    token: str | None = None,
+    allow_fallback: bool = True,
 ):
     """
     공통 ES 검증 진입점.
 
+    token 을 주면 그 토큰이 들어있는 문서 기준으로 hit_index 를 센다.
+    토큰 문서가 부족하고 allow_fallback=True 면 기존처럼 ServiceName 최신 문서로 검증한다.
+    (이 경우 Allure 에 "es-fallback" 태그 + "verified by fallback, token not found" 첨부)
+
     test_cases 예시:
     [
         {
@@ -333,10 +913,30 @@ def assert_es_logs(
         ...
     ]
     """
-    hits = search_logs_from_es(service_name=service_name, size=size)
-
     # 필요한 최소 hit 수 자동 계산
     min_hits = max(case["hit_index"] for case in test_cases) + 1
+
+    if token:
+        hits = search_logs_from_es(service_name=service_name, size=size, token=token)
+        if len(hits) < min_hits:
+            assert allow_fallback, (
+                f"토큰({token})이 포함된 ES 문서가 {min_hits}건 미만입니다. "
+                f"hits={len(hits)}, service_name={service_name}"
+            )
+            print(f"[ES] 토큰({token}) 문서 없음 → ServiceName 최신 문서로 대체 검증")
+            # 대체 검증으로 통과한 결과가 토큰 검증 통과와 구분되도록 리포트에 표시
+            allure.dynamic.tag("es-fallback")
+            allure.attach(
+                f"verified by fallback, token not found\n"
+                f"token={token}, token hits={len(hits)} < {min_hits}, service_name={service_name}\n"
+                f"→ ServiceName 최신 문서로 검증 (이 테스트가 남긴 문서라는 보장 없음)",
+                name="ES fallback verification",
+                attachment_type=allure.attachment_type.TEXT,
+            )
+            hits = search_logs_from_es(service_name=service_name, size=size)
+    else:
+        hits = search_logs_from_es(service_name=service_name, size=size)
+
     assert len(hits) >= min_hits, (
         f"ES 검색 결과가 {min_hits}건 미만입니다. "
         f"hits={len(hits)}, service_name={service_name}"
@@ -362,15 +962,26 @@ def assert_es_logs_with_retry(
     test_cases,
     size=1,
     max_attempts=3,       # 최대 재시도 횟수
-    interval_sec=5        # 재시도 간격(초)
+    interval_sec=5,       # 재시도 간격(초)
+    token=None,           # 테스트별 상관 토큰 (dlp_token)
+    allow_fallback=True,  # False 면 마지막 시도에서도 토큰 문서로만 검증
 ):
     """
     ES 인덱싱 지연을 고려해 최대 max_attempts 회 재시도하여 검증한다.
     - 한 번이라도 성공하면 PASS
     - 모두 실패하면 마지막 에러를 raise
+    - token 이 있으면 토큰 문서가 나타날 때까지 재시도하고,
+      마지막 시도에서만 ServiceName 최신 문서로 대체 검증한다. (allow_fallback=True 일 때)
     """
     last_err = None
 
+    # ES 대기 시간 동안 할 일 (예: 다음 케이스 컨텍스트 미리 열기)
+    for hook in ES_WAIT_HOOKS:
+        try:
+            hook()
+        except Exception as e:
+            print(f"[WARN] ES 대기 hook 실패 (무시): {e}")
+
     for attempt in range(1, max_attempts + 1):
         try:
             print(f"[ES 검증] {attempt}/{max_attempts}차 시도 중...")
@@ -380,6 +991,8 @@ def assert_es_logs_with_retry(
                 service_name=service_name,
                 test_cases=test_cases,
                 size=size,
+                token=token,
+                allow_fallback=allow_fallback and attempt == max_attempts,
             )
 
             print(f"[ES 검증] {attempt}회째에 성공")
@@ -0,0 +1,118 @@
+import json
+import time
+from typing import Dict, List, Tuple
+
+import allure
+from playwright.sync_api import Locator
+
+from base.config import DLP_NORMAL, LARGE_BODY_UNIT_EVERY_KB
+
+# 에디터에 들어간 글자 수가 이 비율 미만이면 다음 입력 방식으로 넘어간다 (줄바꿈 정규화 오차 허용)
+_INSERT_MIN_RATIO = 0.9
+
+_EDITOR_TEXT_LENGTH_JS = "el => (el.value !== undefined ? el.value : el.innerText).length"
+
+# 입력 이벤트 없이 DOM 에 바로 넣는 마지막 수단 (textarea/input 은 value, contenteditable 은 innerText)
+_SET_EDITOR_TEXT_JS = """
+(el, text) => {
+    if (el.value !== undefined) {
+        el.value = text;
+    } else {
+        el.innerText = text;
+    }
+    el.dispatchEvent(new InputEvent('input', { bubbles: true, inputType: 'insertFromPaste' }));
+}
+"""
+
+
+def build_large_body(size_kb: int, unit_lines: List[str], unit_expected: Dict[str, int],
+                     unit_every_kb: int = LARGE_BODY_UNIT_EVERY_KB) -> Tuple[str, Dict[str, str]]:
+    """
+    size_kb 크기(UTF-8 기준)의 본문과 ES 기대값을 만든다.
+
+    - unit_every_kb 마다 unit_lines 블록을 한 번 넣고, 나머지는 DLP_NORMAL 로 채운다
+    - 기대값 = unit_expected(블록 1개를 보냈을 때의 검출 수) × 블록 수
+      예) 패턴 블록 1개 = 14, 키워드 블록 1개 = 6 → 5MB / 64KB = 80블록 → 1120 / 480
+    - 반환값: (본문, {"pattern_count": "...", "keyword_count": "...", "file_count": "0"})
+    """
+    unit = "\n".join(unit_lines) + "\n"
+    filler = "\n".join(DLP_NORMAL) + "\n"
+    unit_bytes = len(unit.encode("utf-8"))
+    filler_bytes = len(filler.encode("utf-8"))
+
+    target_bytes = size_kb * 1024
+    chunk_bytes = unit_every_kb * 1024
+    fillers_per_chunk = max((chunk_bytes - unit_bytes) // filler_bytes, 0)
+    chunk = unit + filler * fillers_per_chunk
+
+    repeats = max(target_bytes // len(chunk.encode("utf-8")), 1)
+    body = chunk * repeats
+
+    expected = {"pattern_count": "0", "keyword_count": "0", "file_count": "0"}
+    for key, count in unit_expected.items():
+        expected[key] = str(count * repeats)
+
+    print(f"[LARGE_BODY] {size_kb}KB 본문 생성: 블록 {repeats}개, "
+          f"{len(body.encode('utf-8'))} bytes, 기대값 {expected}")
+    return body, expected
+
+
+def insert_text_fast(editor: Locator, text: str) -> Dict:
+    """
+    키 입력 단위 fill 대신 가장 빠른 방식으로 본문을 넣는다.
+
+    1) insertText : 포커스된 에디터에 CDP Input.insertText 한 번 (input 이벤트 1회)
+    2) dom        : 에디터가 insertText 를 받지 않으면 value/innerText 를 직접 설정 + input 이벤트
+    - 반환값: {"method", "insert_ms", "chars", "inserted_chars"}
+    """
+    started = time.monotonic()
+    expected_chars = len(text)
+
+    editor.click()
+    editor.page.keyboard.insert_text(text)
+    inserted = editor.evaluate(_EDITOR_TEXT_LENGTH_JS)
+    method = "insertText"
+
+    if inserted < expected_chars * _INSERT_MIN_RATIO:
+        print(f"[LARGE_BODY] insertText 로 {inserted}/{expected_chars}자만 입력됨 → DOM 직접 설정")
+        editor.evaluate(_SET_EDITOR_TEXT_JS, text)
+        inserted = editor.evaluate(_EDITOR_TEXT_LENGTH_JS)
+        method = "dom"
+
+    result = {
+        "method": method,
+        "insert_ms": int((time.monotonic() - started) * 1000),
+        "chars": expected_chars,
+        "inserted_chars": inserted,
+    }
+    print(f"[LARGE_BODY] 본문 입력 {result['method']} {result['insert_ms']}ms "
+          f"({result['inserted_chars']}/{result['chars']}자)")
+
+    assert inserted >= expected_chars * _INSERT_MIN_RATIO, (
+        f"본문 입력 실패: {inserted}/{expected_chars}자만 에디터에 들어감"
+    )
+    return result
+
+
+def attach_large_body_timing(service: str, size_kb: int, insert: Dict, send, log_ms: int) -> Dict:
+    """
+    본문 입력 / 전송 / DUT 로그 도착 시간을 한 건으로 모아 Allure 에 첨부한다.
+    send 는 send_and_wait_for_request 결과 (matcher 미감지면 None)
+    """
+    timing = {
+        "service": service,
+        "size_kb": size_kb,
+        "insert_method": insert["method"],
+        "insert_ms": insert["insert_ms"],
+        "send_ms": send["elapsed_ms"] if send else None,
+        "request_body_bytes": send["request_body_bytes"] if send else None,
+        "log_ms": log_ms,
+    }
+    print(f"[LARGE_BODY] {service} {size_kb}KB: 입력 {timing['insert_ms']}ms, "
+          f"전송 {timing['send_ms']}ms, 로그 {log_ms}ms")
+    allure.attach(
+        json.dumps(timing, ensure_ascii=False, indent=2),
+        name=f"{service}_large_body_{size_kb}KB_timing",
+        attachment_type=allure.attachment_type.JSON,
+    )
+    return timing
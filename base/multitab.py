@@ -0,0 +1,96 @@
+import time
+from typing import Dict, List
+
+import allure
+from playwright.sync_api import BrowserContext, Page
+
+from base.config import SEND_REQUEST_MATCHERS
+from base.function import is_send_request, assert_es_logs_with_retry, make_dlp_token, wait_for_ready
+
+
+def run_multi_tab_sends(context: BrowserContext, service: str, start_url: str, service_names,
+                        cases: List[Dict], send_timeout: int = 20000) -> Dict[str, str]:
+    """
+    같은 로그인 컨텍스트에서 케이스마다 탭을 하나씩 열고, 입력을 모두 끝낸 뒤 전송을 연달아 눌러
+    전송 요청과 ES 인덱싱 대기를 한 번으로 겹친다.
+
+    cases 예시:
+    [
+        {
+            "label": "패턴 로깅",
+            "test_cases": PATTERN_LOGGING_CASE,
+            "prepare": lambda page, token: page.locator("textarea").fill(...),   # 토큰 포함 입력
+            "send": lambda page: page.locator("textarea").press("Enter"),
+        },
+        ...
+    ]
+
+    - 케이스마다 dlp 토큰을 새로 만들어 prepare 에 넘긴다 → ES 문서를 케이스별로 다시 찾을 수 있음
+    - 같은 ServiceName 문서가 동시에 쌓이므로 ES 검증은 토큰 문서로만 (최신 문서 대체 검증 없음)
+    - 실패한 케이스를 모아서 마지막에 한 번에 AssertionError
+    - 반환값: {label: token}
+    """
+    matcher = SEND_REQUEST_MATCHERS.get(service)
+    sent: List[str] = []
+
+    def on_request_finished(req):
+        if is_send_request(matcher, req):
+            sent.append(req.url)
+
+    tabs: List[Page] = []
+    tokens: Dict[str, str] = {}
+
+    # 1) 탭 열기 + 이동은 한꺼번에 시작하고, 준비/입력은 순서대로
+    for case in cases:
+        page = context.new_page()
+        page.goto(start_url, wait_until="commit")
+        tabs.append(page)
+
+    for page, case in zip(tabs, cases):
+        with allure.step(f"[MULTI_TAB] {case['label']} 입력"):
+            wait_for_ready(page)
+            token = make_dlp_token()
+            tokens[case["label"]] = token
+            case["prepare"](page, token)
+            print(f"[MULTI_TAB] {service} {case['label']} 입력 완료 (token={token})")
+
+    # 2) 전송을 연달아 누르고, 전송 요청이 케이스 수만큼 끝날 때까지 한 번만 대기
+    context.on("requestfinished", on_request_finished)
+    started = time.monotonic()
+    try:
+        with allure.step(f"[MULTI_TAB] {service} 전송 {len(cases)}건"):
+            for page, case in zip(tabs, cases):
+                case["send"](page)
+
+            deadline = started + send_timeout / 1000
+            if matcher:
+                while len(sent) < len(cases) and time.monotonic() < deadline:
+                    tabs[0].wait_for_timeout(100)
+            else:
+                tabs[0].wait_for_timeout(5000)
+    finally:
+        context.remove_listener("requestfinished", on_request_finished)
+
+    print(f"[MULTI_TAB] {service}: 전송 요청 {len(sent)}/{len(cases)}건 감지 "
+          f"({int((time.monotonic() - started) * 1000)}ms)")
+
+    # 3) 토큰별 ES 검증 (첫 케이스가 인덱싱 대기를 부담하고, 나머지는 대부분 바로 통과)
+    errors = []
+    for case in cases:
+        label = case["label"]
+        with allure.step(f"[MULTI_TAB] {label} ES 검증 (token={tokens[label]})"):
+            try:
+                assert_es_logs_with_retry(
+                    service_name=service_names,
+                    test_cases=case["test_cases"],
+                    token=tokens[label],
+                    size=1,
+                    max_attempts=3,
+                    interval_sec=5,
+                    allow_fallback=False,
+                )
+            except AssertionError as e:
+                errors.append(f"{label}: {e}")
+
+    assert not errors, "멀티 탭 전송 검증 실패\n" + "\n".join(errors)
+    return tokens
@@ -0,0 +1,85 @@
+from typing import Dict, List
+from urllib.parse import urlparse
+
+from playwright.sync_api import BrowserContext, Route, Request
+
+from base.config import ROUTE_BLOCKING, ROUTE_POLICIES, ROUTE_NEVER_BLOCK_KEYWORDS
+
+
+def _host_matches(host: str, domains: List[str]) -> bool:
+    return any(host == d or host.endswith(f".{d}") for d in domains)
+
+
+def get_route_policy(service: str) -> Dict[str, list]:
+    """
+    서비스 키(예: "daum_mail")에 적용할 차단 정책.
+    default → 벤더 접두어("daum") → 서비스 키 순서로 덮어쓴다.
+    (도메인 목록은 합치고, block_types 는 마지막에 지정한 값을 사용)
+    """
+    policy = {key: list(value) for key, value in ROUTE_POLICIES["default"].items()}
+
+    vendor = service.split("_")[0]
+    for key in (vendor, service):
+        override = ROUTE_POLICIES.get(key)
+        if not override or key == "default":
+            continue
+        for field in ("first_party", "allow_hosts", "deny_hosts"):
+            policy[field] += override.get(field, [])
+        if "block_types" in override:
+            policy["block_types"] = list(override["block_types"])
+
+    return policy
+
+
+def should_block_request(request: Request, policy: Dict[str, list]) -> bool:
+    """
+    요청 하나를 차단할지 판단한다.
+
+    1) deny_hosts(광고/분석) → 항상 차단
+    2) GET 이 아닌 요청(작성/업로드/전송) → 절대 차단하지 않음
+    3) URL 에 compose/upload/send 등 키워드 포함 → 차단하지 않음
+    4) first_party / allow_hosts → 차단하지 않음
+    5) 나머지 3rd-party 중 block_types(이미지/폰트/미디어) → 차단
+    """
+    host = urlparse(request.url).hostname or ""
+
+    if _host_matches(host, policy["deny_hosts"]):
+        return True
+
+    if request.method != "GET":
+        return False
+
+    url = request.url.lower()
+    if any(keyword in url for keyword in ROUTE_NEVER_BLOCK_KEYWORDS):
+        return False
+
+    if _host_matches(host, policy["first_party"] + policy["allow_hosts"]):
+        return False
+
+    return request.resource_type in policy["block_types"]
+
+
+def apply_route_policy(context: BrowserContext, service: str) -> None:
+    """
+    컨텍스트에 서비스별 리소스 차단 정책을 건다. (ROUTE_BLOCKING=false 면 아무것도 하지 않음)
+
+    사용 예)
+        context = browser.new_context(storage_state=session_path)
+        apply_route_policy(context, "daum_mail")
+    """
+    if not ROUTE_BLOCKING:
+        return
+
+    policy = get_route_policy(service)
+    blocked = {"count": 0}
+
+    def handle(route: Route, request: Request):
+        if should_block_request(request, policy):
+            blocked["count"] += 1
+            route.abort("blockedbyclient")
+        else:
+            route.fallback()
+
+    context.route("**/*", handle)
+    context.on("close", lambda _: print(f"[ROUTE] {service}: 차단한 요청 {blocked['count']}건"))
+    print(f"[ROUTE] {service}: 리소스 차단 정책 적용")
@@ -0,0 +1,94 @@
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Set
+
+import base.config as config
+
+SERVICE_NAMES_RE = re.compile(r"\bSERVICE_NAMES_[A-Z_]+\b")
+TEST_FUNC_RE = re.compile(r"^def test_\w+\(", re.M)
+
+
+def collect_test_modules(root: str = "test_services") -> List[str]:
+    """
+    pytest 가 수집하는 test_*.py 모듈 목록 (정렬된 상대 경로).
+    """
+    return sorted(p.as_posix() for p in Path(root).rglob("test_*.py"))
+
+
+def get_module_service_names(module_path: str) -> Set[str]:
+    """
+    모듈이 ES 검증에 쓰는 SERVICE_NAMES_* 상수를 찾아서
+    실제 ServiceName 값(한글/영문)의 집합으로 돌려준다.
+    """
+    source = Path(module_path).read_text(encoding="utf-8")
+
+    names: Set[str] = set()
+    for const in set(SERVICE_NAMES_RE.findall(source)):
+        values = getattr(config, const, None)
+        if values is None:
+            print(f"[PARALLEL] {module_path}: 알 수 없는 상수 {const} → 무시")
+            continue
+        names.update(values)
+
+    return names
+
+
+def group_modules_by_service(modules: List[str]) -> List[List[str]]:
+    """
+    ServiceName 을 하나라도 공유하는 모듈끼리 한 그룹으로 묶는다.
+
+    assert_es_logs 는 ServiceName 별 최신 문서(hit_index 0)를 보므로,
+    같은 ServiceName 을 쓰는 모듈은 반드시 같은 워커에서 순서대로 돌아야 한다.
+    (예: 네이버웍스 메일/메모는 '네이버웍스' 를 공유)
+    """
+    parent: Dict[str, str] = {m: m for m in modules}
+
+    def find(m: str) -> str:
+        while parent[m] != m:
+            parent[m] = parent[parent[m]]
+            m = parent[m]
+        return m
+
+    owner: Dict[str, str] = {}
+    for module in modules:
+        for name in get_module_service_names(module):
+            if name in owner:
+                parent[find(module)] = find(owner[name])
+            else:
+                owner[name] = module
+
+    groups: Dict[str, List[str]] = {}
+    for module in modules:
+        groups.setdefault(find(module), []).append(module)
+
+    return list(groups.values())
+
+
+def count_tests(module_path: str) -> int:
+    return len(TEST_FUNC_RE.findall(Path(module_path).read_text(encoding="utf-8")))
+
+
+def build_service_shards(modules: List[str], workers: int) -> List[List[str]]:
+    """
+    ServiceName 그룹 단위로 모듈을 workers 개 샤드에 나눈다.
+
+    - 한 그룹은 절대 쪼개지 않는다 → 두 워커가 같은 ServiceName 을 동시에 쓰지 않음
+    - 그룹 내부 모듈 순서는 유지 → 모듈 안의 login → case 순서도 그대로
+    - 테스트 수가 많은 그룹부터 가장 한가한 샤드에 배치 (greedy)
+    """
+    groups = group_modules_by_service(modules)
+    groups.sort(key=lambda g: sum(count_tests(m) for m in g), reverse=True)
+
+    shards: List[List[str]] = [[] for _ in range(max(1, workers))]
+    loads = [0] * len(shards)
+
+    for group in groups:
+        idx = loads.index(min(loads))
+        shards[idx].extend(group)
+        loads[idx] += sum(count_tests(m) for m in group)
+
+    for i, shard in enumerate(shards):
+        print(f"[PARALLEL] worker {i}: tests={loads[i]} modules={[os.path.basename(m) for m in shard]}")
+
+    return [s for s in shards if s]
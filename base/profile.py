@@ -0,0 +1,93 @@
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+from playwright.sync_api import BrowserContext
+
+from base.config import (
+    HEADLESS,
+    ROUTE_BLOCKING,
+    PROFILE_DIR,
+    PROFILE_CACHE_MAX_MB,
+    PROFILE_MAX_AGE_DAYS,
+)
+from base.session import get_session_path
+
+# 프로필 안에서 캐시로 보고 정리해도 되는 디렉터리 (쿠키/로컬스토리지는 건드리지 않음)
+CACHE_SUBDIRS = [
+    "Default/Cache",
+    "Default/Code Cache",
+    "Default/GPUCache",
+    "Default/Service Worker/CacheStorage",
+]
+CREATED_MARKER = ".created"
+
+
+def get_profile_dir(service: str) -> str:
+    """
+    서비스별 영구 프로필 경로. (예: profiles/dooray_board)
+    서비스 모듈은 병렬 실행 시에도 한 워커에서만 돌기 때문에 디렉터리가 겹치지 않는다.
+    """
+    return os.path.join(PROFILE_DIR, service)
+
+
+def _dir_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+def cleanup_profile(service: str) -> None:
+    """
+    프로필을 열기 전에 캐시 정리 정책 적용.
+    - 프로필 생성 후 PROFILE_MAX_AGE_DAYS 가 지나면 프로필 전체 삭제 (새로 시작)
+    - 캐시 합계가 PROFILE_CACHE_MAX_MB 를 넘으면 캐시 디렉터리만 삭제
+    """
+    profile = Path(get_profile_dir(service))
+    marker = profile / CREATED_MARKER
+
+    if marker.exists():
+        age_days = (time.time() - marker.stat().st_mtime) / 86400
+        if age_days > PROFILE_MAX_AGE_DAYS:
+            print(f"[PROFILE] {service}: 생성 후 {age_days:.1f}일 경과 → 프로필 초기화")
+            shutil.rmtree(profile, ignore_errors=True)
+
+    profile.mkdir(parents=True, exist_ok=True)
+    if not marker.exists():
+        marker.touch()
+
+    cache_dirs = [profile / d for d in CACHE_SUBDIRS if (profile / d).exists()]
+    cache_mb = sum(_dir_size(d) for d in cache_dirs) / (1024 * 1024)
+    if cache_mb > PROFILE_CACHE_MAX_MB:
+        print(f"[PROFILE] {service}: 캐시 {cache_mb:.0f}MB > {PROFILE_CACHE_MAX_MB}MB → 캐시 삭제")
+        for d in cache_dirs:
+            shutil.rmtree(d, ignore_errors=True)
+
+
+def launch_service_profile(browser_type, vendor: str, service: str) -> BrowserContext:
+    """
+    서비스별 영구 프로필로 컨텍스트를 띄운다. (HTTP 디스크 캐시 유지)
+
+    - 로그인 상태는 벤더 storageState 의 쿠키를 매번 주입해서 맞춘다
+    - Playwright 라우팅은 HTTP 캐시를 끄므로, 이 모드에서는 ROUTE_BLOCKING 을 적용하지 않는다
+    - 업로드/전송(POST 등)은 캐시 대상이 아니므로 그대로 DUT 를 지난다
+    """
+    cleanup_profile(service)
+
+    context = browser_type.launch_persistent_context(
+        get_profile_dir(service),
+        headless=HEADLESS,
+        # 크롬 자체 캐시 상한도 같은 값으로 제한
+        args=[f"--disk-cache-size={PROFILE_CACHE_MAX_MB * 1024 * 1024}"],
+    )
+
+    session_path = get_session_path(vendor)
+    if os.path.exists(session_path):
+        with open(session_path, "r", encoding="utf-8") as f:
+            context.add_cookies(json.load(f).get("cookies", []))
+
+    if ROUTE_BLOCKING:
+        print(f"[PROFILE] {service}: 영구 프로필 모드에서는 디스크 캐시를 위해 리소스 차단(route)을 생략")
+
+    print(f"[PROFILE] {service}: 영구 프로필 사용 ({get_profile_dir(service)})")
+    return context
@@ -0,0 +1,195 @@
+import json
+import time
+from typing import Dict, List, Optional
+
+import allure
+import pytest
+from playwright.sync_api import Locator, Page
+
+from base.config import (
+    UPLOAD_MIN_RATIO,
+    UPLOAD_TIMEOUT_MS,
+    COPILOT_SWEEP_SIZES_KB,
+    COPILOT_SWEEP_UNIT_EVERY_KB,
+    COPILOT_PROMPT_MAX_CHARS,
+)
+from base.function import assert_es_logs_with_retry
+
+# 이번 실행의 프롬프트 스윕 결과 (conftest 가 세션 종료 시 저장/요약)
+PROMPT_SWEEP_RESULTS: List[Dict] = []
+
+
+def prompt_sweep_cases() -> List:
+    """
+    (프롬프트 크기, 블록 간격) 조합을 parametrize 용으로 돌려준다.
+    블록 간격이 프롬프트보다 크면 블록 1개짜리와 같아지므로 제외.
+
+    사용 예)
+        @pytest.mark.parametrize("size_kb, unit_every_kb", prompt_sweep_cases())
+    """
+    return [
+        pytest.param(size_kb, unit_every_kb, id=f"{size_kb}KB-every{unit_every_kb}KB")
+        for size_kb in COPILOT_SWEEP_SIZES_KB
+        for unit_every_kb in COPILOT_SWEEP_UNIT_EVERY_KB
+        if unit_every_kb <= size_kb
+    ]
+
+
+def input_char_limit(editor: Locator) -> Optional[int]:
+    """
+    입력창 글자 수 한도. maxlength 속성이 있으면 그 값, 없으면 COPILOT_PROMPT_MAX_CHARS (0 이면 None = 모름)
+    """
+    try:
+        maxlength = editor.first.get_attribute("maxlength")
+    except Exception as e:
+        print(f"[PROMPT_SWEEP] 입력창 maxlength 조회 실패 (설정값 사용): {e}")
+        maxlength = None
+
+    if maxlength and maxlength.strip().isdigit() and int(maxlength) > 0:
+        return int(maxlength)
+    return COPILOT_PROMPT_MAX_CHARS or None
+
+
+class OutgoingTracker:
+    """
+    페이지에서 나가는 데이터를 모은다. (HTTP 는 GET 제외 본문, WebSocket 은 보낸 프레임)
+    채팅형 서비스는 프롬프트를 WebSocket 으로 보내는 경우가 많아 HTTP 요청만으로는 크기를 알 수 없다.
+
+    - WebSocket 은 열릴 때 listener 를 붙여야 하므로 goto 전에 만든다
+    - mark() 로 구간 시작을 찍고, wait_transmitted() 로 그 뒤에 나간 양을 집계
+    """
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.http: List[Dict] = []
+        self.frames: List[Dict] = []
+        self._mark = (0, 0)
+        page.context.on("requestfinished", self._on_request_finished)
+        page.on("websocket", self._on_websocket)
+
+    def _on_request_finished(self, req) -> None:
+        if req.method == "GET":
+            return
+        try:
+            body_bytes = req.sizes().get("requestBodySize", 0)
+        except Exception:
+            body_bytes = len(req.post_data_buffer or b"")
+        self.http.append({"url": req.url, "method": req.method, "bytes": body_bytes})
+
+    def _on_websocket(self, ws) -> None:
+        def on_frame_sent(payload):
+            size = len(payload.encode("utf-8")) if isinstance(payload, str) else len(payload)
+            self.frames.append({"url": ws.url, "bytes": size})
+        ws.on("framesent", on_frame_sent)
+
+    def mark(self) -> None:
+        self._mark = (len(self.http), len(self.frames))
+
+    def _since_mark(self) -> Dict:
+        http = self.http[self._mark[0]:]
+        frames = self.frames[self._mark[1]:]
+        http_bytes = sum(r["bytes"] for r in http)
+        ws_bytes = sum(f["bytes"] for f in frames)
+        return {
+            "http_requests": len(http),
+            "http_bytes": http_bytes,
+            "ws_frames": len(frames),
+            "ws_bytes": ws_bytes,
+            "total_bytes": http_bytes + ws_bytes,
+            "largest_bytes": max([r["bytes"] for r in http] + [f["bytes"] for f in frames], default=0),
+            "urls": sorted({r["url"] for r in http} | {f["url"] for f in frames}),
+        }
+
+    def wait_transmitted(self, expected_bytes: int, timeout: int = None,
+                         min_ratio: float = None) -> Dict:
+        """
+        mark() 이후 나간 양이 expected_bytes × min_ratio 이상이 될 때까지 기다린다.
+        timeout 안에 못 미치면 ES 를 기다리지 않고 "prompt never left the browser" 로 실패.
+        """
+        timeout = UPLOAD_TIMEOUT_MS if timeout is None else timeout
+        min_ratio = UPLOAD_MIN_RATIO if min_ratio is None else min_ratio
+        threshold = int(expected_bytes * min_ratio)
+        started = time.monotonic()
+        deadline = started + timeout / 1000
+
+        while self._since_mark()["total_bytes"] < threshold and time.monotonic() < deadline:
+            self.page.wait_for_timeout(200)
+
+        outgoing = self._since_mark()
+        outgoing["wait_ms"] = int((time.monotonic() - started) * 1000)
+        print(f"[PROMPT_SWEEP] 전송 {outgoing['total_bytes']} bytes "
+              f"(HTTP {outgoing['http_requests']}건 {outgoing['http_bytes']}B, "
+              f"WS {outgoing['ws_frames']}프레임 {outgoing['ws_bytes']}B)")
+
+        assert outgoing["total_bytes"] >= threshold, (
+            f"prompt never left the browser: {timeout}ms 동안 전송 {outgoing['total_bytes']} bytes "
+            f"< 프롬프트 {expected_bytes} bytes × {min_ratio}"
+        )
+        return outgoing
+
+
+def verify_and_record_prompt_sweep(service: str, size_kb: int, unit_every_kb: int, prompt: str,
+                                   insert: Dict, outgoing: Dict, expected: Dict[str, str],
+                                   service_names, token: str) -> Dict:
+    """
+    DUT 로그가 기대 검출 수로 도착할 때까지 짧은 간격으로 확인하고,
+    프롬프트 크기 / 입력 / 전송량 / 로그 도착 시간을 한 건으로 기록한다.
+    (로그가 안 오거나 검출 수가 다르면 logged=False 로 기록 후 실패)
+    """
+    started = time.monotonic()
+    error: Optional[AssertionError] = None
+    try:
+        assert_es_logs_with_retry(
+            service_name=service_names,
+            test_cases=[{"hit_index": 0, "label": f"프롬프트 {size_kb}KB", "expected": expected}],
+            token=token,
+            size=1,
+            max_attempts=30,
+            interval_sec=2,
+            allow_fallback=False,
+        )
+    except AssertionError as e:
+        error = e
+
+    prompt_bytes = len(prompt.encode("utf-8"))
+    result = {
+        "service": service,
+        "size_kb": size_kb,
+        "unit_every_kb": unit_every_kb,
+        "prompt_chars": len(prompt),
+        "prompt_bytes": prompt_bytes,
+        "expected": expected,
+        "insert_method": insert["method"],
+        "insert_ms": insert["insert_ms"],
+        "outgoing_bytes": outgoing["total_bytes"],
+        "outgoing_ratio": round(outgoing["total_bytes"] / prompt_bytes, 2) if prompt_bytes else None,
+        "outgoing": outgoing,
+        "log_ms": int((time.monotonic() - started) * 1000),
+        "logged": error is None,
+    }
+    PROMPT_SWEEP_RESULTS.append(result)
+
+    print(f"[PROMPT_SWEEP] {service} {size_kb}KB (블록 {unit_every_kb}KB 간격): "
+          f"프롬프트 {prompt_bytes}B → 전송 {result['outgoing_bytes']}B (x{result['outgoing_ratio']}), "
+          f"로그 {result['log_ms']}ms, logged={result['logged']}")
+    allure.attach(
+        json.dumps(result, ensure_ascii=False, indent=2),
+        name=f"{service}_prompt_sweep_{size_kb}KB_every{unit_every_kb}KB",
+        attachment_type=allure.attachment_type.JSON,
+    )
+
+    if error is not None:
+        raise error
+    return result
+
+
+def summarize_prompt_sweep() -> List[str]:
+    """
+    세션 종료 시 호출. 서비스/크기/밀도별 한 줄 요약.
+    """
+    lines = []
+    for r in sorted(PROMPT_SWEEP_RESULTS, key=lambda r: (r["service"], r["size_kb"], r["unit_every_kb"])):
+        log = f"{r['log_ms']}ms" if r["logged"] else "미수신/불일치"
+        lines.append(f"[PROMPT_SWEEP] {r['service']:<10} {r['size_kb']:>5}KB every{r['unit_every_kb']:>3}KB "
+                     f"전송 {r['outgoing_bytes']}B (x{r['outgoing_ratio']})  로그 {log}")
+    return lines
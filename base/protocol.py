@@ -0,0 +1,158 @@
+import json
+import os
+import re
+from typing import Dict, List, Optional, Set
+from urllib.parse import urlparse
+
+import allure
+
+from base.config import PROTOCOL_BASELINE_DIR, PROTOCOL_UPDATE_BASELINE
+
+# 경로 조각 중 매번 바뀌는 값(숫자/uuid/hex/긴 토큰)은 {id} 로 치환
+_ID_SEGMENT_RES = [
+    re.compile(r"^\d+$"),
+    re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.I),
+    re.compile(r"^[0-9a-f]{16,}$", re.I),
+    re.compile(r"^(?=.*\d)[A-Za-z0-9_\-=]{20,}$"),
+]
+
+# 이번 실행에서 서비스별로 관측한 서명 {service: {"send": set, "other": set}}
+_observed: Dict[str, Dict[str, Set[str]]] = {}
+# 이번 실행에서 기준선을 새로 만든 서비스 (같은 실행의 다른 케이스 서명은 변경이 아니라 기준선에 합침)
+_created_this_run: Set[str] = set()
+
+
+def normalize_path(path: str) -> str:
+    segments = []
+    for seg in path.split("/"):
+        if any(r.match(seg) for r in _ID_SEGMENT_RES):
+            segments.append("{id}")
+        else:
+            segments.append(seg)
+    return "/".join(segments)
+
+
+def _content_kind(content_type: str) -> str:
+    ct = (content_type or "").lower()
+    if "multipart/" in ct:
+        return "multipart"
+    if "json" in ct:
+        return "json"
+    if "x-www-form-urlencoded" in ct:
+        return "form"
+    if not ct:
+        return "none"
+    return ct.split(";")[0].strip()
+
+
+def _size_bucket(size: int) -> str:
+    # 본문 크기는 자릿수 단위로만 비교 (내용 길이 차이로 인한 잡음 방지)
+    if size <= 0:
+        return "0"
+    if size < 1024:
+        return "<1KB"
+    if size < 100 * 1024:
+        return "<100KB"
+    if size < 10 * 1024 * 1024:
+        return "<10MB"
+    return ">=10MB"
+
+
+def request_signature(method: str, url: str, content_type: str, body_size: int) -> str:
+    """
+    요청 하나의 정규화된 서명. 예) "POST mail.daum.net/api/mails/{id}/send multipart <100KB"
+    """
+    parsed = urlparse(url)
+    return (f"{method} {parsed.hostname}{normalize_path(parsed.path)} "
+            f"{_content_kind(content_type)} {_size_bucket(body_size)}")
+
+
+def get_baseline_path(service: str) -> str:
+    return os.path.join(PROTOCOL_BASELINE_DIR, f"{service}.json")
+
+
+def _load_baseline(service: str) -> Optional[Dict[str, List[str]]]:
+    path = get_baseline_path(service)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _save_baseline(service: str, baseline: Dict[str, List[str]]) -> None:
+    os.makedirs(PROTOCOL_BASELINE_DIR, exist_ok=True)
+    path = get_baseline_path(service)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def record_protocol(service: str, send_signature: Optional[str], other_signatures: List[str]) -> List[str]:
+    """
+    전송 1회의 요청 서명을 기준선과 비교한다.
+
+    - 기준선이 없으면 이번 서명으로 생성
+    - 기준선에 없는 서명이 나오면 "protocol changed" 로 Allure 에 첨부 (테스트는 실패시키지 않음)
+    - send_signature 가 None 이면 전송 matcher 가 아무것도 못 잡은 경우
+      → "기준선 전송 서명 미관측" + 그 구간의 새 요청 서명(바뀐 전송 요청 후보)을 변경으로 보고
+    - PROTOCOL_UPDATE_BASELINE=true 면 새 서명을 기준선에 합친다
+    - 반환값: 발견한 변경 목록
+    """
+    sends = {send_signature} if send_signature else set()
+    observed = _observed.setdefault(service, {"send": set(), "other": set()})
+    observed["send"].update(sends)
+    observed["other"].update(other_signatures)
+
+    baseline = _load_baseline(service)
+    if baseline is None:
+        if not sends:
+            print(f"[PROTOCOL] {service}: 전송 요청 미감지 → 기준선 생성 보류")
+            return []
+        _save_baseline(service, {"send": [send_signature], "other": sorted(set(other_signatures))})
+        _created_this_run.add(service)
+        print(f"[PROTOCOL] {service}: 기준선 생성 ({get_baseline_path(service)})")
+        return []
+
+    if service in _created_this_run:
+        baseline["send"] = sorted(set(baseline["send"]) | sends)
+        baseline["other"] = sorted(set(baseline["other"]) | set(other_signatures))
+        _save_baseline(service, baseline)
+        return []
+
+    findings = []
+    if send_signature is None:
+        findings.append(f"기준선 전송 서명 미관측: 전송 matcher 가 요청을 못 잡음 (기준선: {baseline['send']})")
+    elif send_signature not in baseline["send"]:
+        findings.append(f"전송 요청 서명 변경: {send_signature} (기준선: {baseline['send']})")
+    for sig in sorted(set(other_signatures) - set(baseline["other"]) - set(baseline["send"])):
+        findings.append(f"새 요청 서명: {sig}")
+
+    if findings:
+        message = "\n".join(findings)
+        print(f"[PROTOCOL] {service}: protocol changed\n{message}")
+        allure.attach(message, name=f"PROTOCOL CHANGED: {service}", attachment_type=allure.attachment_type.TEXT)
+
+        if PROTOCOL_UPDATE_BASELINE:
+            baseline["send"] = sorted(set(baseline["send"]) | sends)
+            baseline["other"] = sorted(set(baseline["other"]) | set(other_signatures))
+            _save_baseline(service, baseline)
+            print(f"[PROTOCOL] {service}: 기준선 갱신")
+
+    return findings
+
+
+def collect_unseen_signatures() -> Dict[str, List[str]]:
+    """
+    세션 종료 시 호출. 이번 실행에서 전송을 관측한 서비스 중,
+    기준선의 전송 요청 서명이 한 번도 나타나지 않은 것을 돌려준다. (사라진 프로토콜)
+    """
+    unseen = {}
+    for service, observed in _observed.items():
+        baseline = _load_baseline(service)
+        if not baseline:
+            continue
+        missing = sorted(set(baseline["send"]) - observed["send"])
+        if missing:
+            unseen[service] = missing
+    return unseen
@@ -0,0 +1,140 @@
+import time
+from typing import Callable, Dict, Optional
+
+from playwright.sync_api import Browser, BrowserContext, Page
+
+from base.account import DAUM_ID, DAUM_PASSWORD
+from base.config import DAUM_MAIL_URL, NATE_MAIL_URL
+from base.function import goto_and_wait, click_and_wait_navigation, click_confirm_if_popup_exists
+from base.network import apply_route_policy
+from base.session import get_session_path
+from base.tracing import rotate_trace_chunk
+from base.ui_drift import check_ui_drift
+
+
+# ============================
+# 서비스별 "로그인된 첫 화면" / "새 작성 화면" 진입 절차
+# ============================
+def _open_daum_mail(page: Page) -> None:
+    goto_and_wait(page, f"{DAUM_MAIL_URL}/")
+
+    # 팝업이 있으면 확인 클릭, 없으면 스킵
+    click_confirm_if_popup_exists(page)
+
+    # 저장 세션이 살아있으면 로그인 버튼이 없으므로 기다리지 않고 바로 스킵
+    kakao_login_button = page.get_by_role("button", name="카카오로 로그인")
+    if kakao_login_button.is_visible():
+        kakao_login_button.click()
+        time.sleep(1)
+        page.get_by_role("textbox", name="계정정보 입력").click()
+        page.get_by_role("textbox", name="계정정보 입력").fill(DAUM_ID)
+        page.get_by_role("textbox", name="비밀번호 입력").click()
+        page.get_by_role("textbox", name="비밀번호 입력").fill(DAUM_PASSWORD)
+        time.sleep(1)
+        page.get_by_role("button", name="로그인", exact=True).click()
+        time.sleep(3)
+        print("정상적으로 로그인 하였습니다")
+    else:
+        print("로그인 필요 없음 → 스킵")
+
+    # 팝업이 있으면 확인 클릭, 없으면 스킵
+    click_confirm_if_popup_exists(page)
+
+
+def _compose_daum_mail(page: Page) -> None:
+    click_and_wait_navigation(page, role="button", name="내게쓰기",
+                              ready=lambda p: p.get_by_role("textbox", name="제목"))
+
+
+def _open_nate_mail(page: Page) -> None:
+    goto_and_wait(page, f"{NATE_MAIL_URL}/")
+    print("▶ 메일 페이지 로드 완료")
+
+
+def _compose_nate_mail(page: Page) -> None:
+    click_and_wait_navigation(page, role="link", name="내게쓰기",
+                              ready=lambda p: p.get_by_label("제목"))
+
+
+# - vendor  : storageState 벤더 키
+# - open    : 새 컨텍스트에서 로그인된 메일함까지 (모듈당 1회)
+# - compose : 현재 화면(메일함/전송 완료/작성 중)에서 새 작성 화면으로 (케이스마다)
+SERVICE_PAGE_FLOWS: Dict[str, dict] = {
+    "daum_mail": {"vendor": "daum", "open": _open_daum_mail, "compose": _compose_daum_mail},
+    "nate_mail": {"vendor": "nate", "open": _open_nate_mail, "compose": _compose_nate_mail},
+}
+
+
+class ServicePage:
+    """
+    모듈 안에서 로그인된 페이지 하나를 계속 쓰는 서비스 세션.
+
+    - 첫 compose() 때만 컨텍스트 생성 + 메일함 진입(팝업/로그인 처리)
+    - 이후 compose() 는 현재 페이지에서 '새 작성 화면' 으로만 이동 (작성 중이던 초안은 버림)
+    - compose 이동이 실패하거나 invalidate() 된 뒤에는 새 컨텍스트로 다시 연다
+    """
+
+    def __init__(self, browser: Browser, service: str,
+                 on_context: Optional[Callable[[BrowserContext], None]] = None):
+        flow = SERVICE_PAGE_FLOWS[service]
+        self.browser = browser
+        self.service = service
+        self.vendor = flow["vendor"]
+        self._open = flow["open"]
+        self._compose = flow["compose"]
+        self._on_context = on_context
+        self.context: Optional[BrowserContext] = None
+        self.page: Optional[Page] = None
+
+    def _reopen(self) -> None:
+        self.close()
+        self.context = self.browser.new_context(storage_state=get_session_path(self.vendor))
+        apply_route_policy(self.context, self.service)
+        if self._on_context:
+            self._on_context(self.context)
+
+        self.page = self.context.new_page()
+        # 작성 중 이탈 시 뜨는 '작성 중인 내용이 사라집니다' 류 dialog 는 수락 (= 초안 버림)
+        self.page.on("dialog", lambda dialog: dialog.accept())
+        self._open(self.page)
+        print(f"[SERVICE_PAGE] {self.service}: 로그인된 페이지 준비 완료")
+
+    def compose(self) -> Page:
+        """
+        새 작성 화면이 열린 페이지를 돌려준다.
+        (작성 화면은 실행당 1회 기준선 스크린샷 hash 와 비교 → check_ui_drift)
+        """
+        if self.page is None or self.page.is_closed():
+            self._reopen()
+            self._compose(self.page)
+            check_ui_drift(self.page, f"{self.service}_compose")
+            return self.page
+
+        # 이전 케이스의 trace 구간은 버리고 이번 케이스 구간만 남긴다
+        rotate_trace_chunk(self.context)
+
+        try:
+            self._compose(self.page)
+            print(f"[SERVICE_PAGE] {self.service}: 기존 페이지에서 새 작성 화면 진입")
+        except Exception as e:
+            print(f"[SERVICE_PAGE] {self.service}: 새 작성 화면 진입 실패 → 페이지 다시 열기 ({e})")
+            self._reopen()
+            self._compose(self.page)
+
+        check_ui_drift(self.page, f"{self.service}_compose")
+        return self.page
+
+    def invalidate(self) -> None:
+        """
+        케이스 실패 후 호출. 상태를 알 수 없는 페이지를 다음 케이스에 넘기지 않는다.
+        """
+        self.close()
+
+    def close(self) -> None:
+        if self.context is not None:
+            try:
+                self.context.close()
+            except Exception as e:
+                print(f"[WARN] {self.service} 컨텍스트 정리 실패: {e}")
+        self.context = None
+        self.page = None
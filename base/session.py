@@ -0,0 +1,202 @@
+import json
+import os
+import time
+from typing import Dict, Optional
+
+import allure
+from playwright.sync_api import Browser, BrowserContext
+
+from base.config import (
+    SESSION_DIR,
+    SESSION_EXPIRY_MARGIN_SEC,
+    SESSION_MAX_AGE_SEC,
+    DOORAY_BASE_URL,
+    NAVERWORKS_MAIL_URL,
+    DAUM_MAIL_URL,
+    NATE_MAIL_URL,
+    OUTLOOK_MAIL_URL,
+)
+
+# ============================
+# 벤더(계정)별 세션 정의
+# ============================
+# - file               : session/ 아래 storageState 파일명 (기존 파일명 그대로 사용)
+# - domains            : 이 벤더 로그인 쿠키로 간주할 도메인
+# - probe_url          : 세션이 살아있는지 한 번 열어볼 URL (None 이면 쿠키 만료만 확인)
+# - login_url_keywords : probe 후 URL 에 포함되면 로그아웃 상태로 판단
+# - logged_out_selector: probe 후 보이면 로그아웃 상태로 판단
+VENDOR_SESSIONS: Dict[str, dict] = {
+    "dooray": {
+        "file": "dooraystorageState.json",
+        "domains": ["dooray.com"],
+        "probe_url": f"{DOORAY_BASE_URL}/home",
+        "login_url_keywords": ["/login"],
+        "logged_out_selector": "input[type='password']",
+    },
+    "naverworks": {
+        "file": "naverworksstorageState.json",
+        "domains": ["worksmobile.com"],
+        "probe_url": NAVERWORKS_MAIL_URL,
+        "login_url_keywords": ["auth.worksmobile.com"],
+        "logged_out_selector": "input[type='password']",
+    },
+    "daum": {
+        "file": "daumstorageState.json",
+        "domains": ["daum.net", "kakao.com"],
+        "probe_url": f"{DAUM_MAIL_URL}/",
+        "login_url_keywords": ["accounts.kakao.com", "logins.daum.net"],
+        "logged_out_selector": "button:has-text('카카오로 로그인')",
+    },
+    "nate": {
+        "file": "natestorageState.json",
+        "domains": ["nate.com"],
+        "probe_url": NATE_MAIL_URL,
+        "login_url_keywords": ["/login"],
+        "logged_out_selector": "input[type='password']",
+    },
+    "outlook": {
+        "file": "outlookstorageState.json",
+        "domains": ["live.com", "office.com"],
+        "probe_url": OUTLOOK_MAIL_URL,
+        "login_url_keywords": ["login.live.com", "login.microsoftonline.com"],
+        "logged_out_selector": "input[type='password']",
+    },
+    "copilot": {
+        "file": "copilotfreestorageState.json",
+        "domains": ["copilot.microsoft.com", "live.com"],
+        # 코파일럿은 비로그인 상태로도 첫 화면이 열리므로 쿠키 만료만 본다.
+        "probe_url": None,
+        "login_url_keywords": [],
+        "logged_out_selector": None,
+    },
+}
+
+# 프로세스(워커) 안에서 이미 probe 를 통과한 벤더 목록
+_verified_vendors: Dict[str, bool] = {}
+
+
+def get_session_path(vendor: str) -> str:
+    """
+    벤더별 storageState 파일 경로. (예: session/dooraystorageState.json)
+    """
+    return os.path.join(SESSION_DIR, VENDOR_SESSIONS[vendor]["file"])
+
+
+def _cookie_matches(cookie: dict, domains) -> bool:
+    domain = cookie.get("domain", "").lstrip(".")
+    return any(domain == d or domain.endswith(f".{d}") for d in domains)
+
+
+def check_storage_state_expiry(vendor: str, now: Optional[float] = None) -> Optional[str]:
+    """
+    저장된 storageState 의 쿠키 만료 시각을 읽어서 재로그인이 필요한지 판단한다.
+
+    - 재사용 가능하면 None
+    - 재로그인이 필요하면 그 사유 문자열
+    """
+    now = time.time() if now is None else now
+    path = get_session_path(vendor)
+
+    if not os.path.exists(path):
+        return "storageState 파일 없음"
+
+    age = now - os.path.getmtime(path)
+    if age > SESSION_MAX_AGE_SEC:
+        return f"storageState 저장 후 {int(age)}초 경과 (최대 {SESSION_MAX_AGE_SEC}초)"
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError) as e:
+        return f"storageState 파싱 실패: {e}"
+
+    domains = VENDOR_SESSIONS[vendor]["domains"]
+    cookies = [c for c in state.get("cookies", []) if _cookie_matches(c, domains)]
+    if not cookies:
+        return f"{domains} 도메인 쿠키 없음"
+
+    # expires == -1 은 세션 쿠키 → 만료 시각으로는 판단 불가, probe 에 맡긴다.
+    persistent = [c["expires"] for c in cookies if c.get("expires", -1) > 0]
+    if persistent and max(persistent) < now + SESSION_EXPIRY_MARGIN_SEC:
+        return "로그인 쿠키 만료 (또는 만료 임박)"
+
+    return None
+
+
+def probe_vendor_session(browser: Browser, vendor: str, timeout: int = 15000) -> bool:
+    """
+    저장된 세션으로 probe_url 을 한 번 열어서 로그인 상태인지 확인한다.
+    """
+    vendor_cfg = VENDOR_SESSIONS[vendor]
+    if not vendor_cfg["probe_url"]:
+        return True
+
+    context = browser.new_context(storage_state=get_session_path(vendor))
+    page = context.new_page()
+
+    try:
+        page.goto(vendor_cfg["probe_url"], wait_until="domcontentloaded", timeout=timeout)
+        page.wait_for_timeout(1000)
+
+        if any(k in page.url for k in vendor_cfg["login_url_keywords"]):
+            print(f"[SESSION] {vendor} probe → 로그인 페이지로 이동됨 ({page.url})")
+            return False
+
+        selector = vendor_cfg["logged_out_selector"]
+        if selector and page.locator(selector).first.is_visible():
+            print(f"[SESSION] {vendor} probe → 로그인 화면 감지 ({selector})")
+            return False
+
+        return True
+
+    except Exception as e:
+        print(f"[SESSION] {vendor} probe 실패: {e}")
+        return False
+
+    finally:
+        context.close()
+
+
+def reuse_vendor_session(browser: Browser, vendor: str) -> bool:
+    """
+    *_login 테스트 맨 앞에서 호출.
+    저장된 세션이 아직 유효하면 True (UI 로그인 생략), 아니면 False.
+
+    쿠키 만료는 매번 확인하지만, 실제 페이지 probe 는 워커당 벤더별 1회만 수행한다.
+    """
+    with allure.step(f"[SESSION] {vendor} 저장 세션 재사용 여부 확인"):
+        reason = check_storage_state_expiry(vendor)
+        if reason:
+            print(f"[SESSION] {vendor} 재로그인 필요: {reason}")
+            _verified_vendors.pop(vendor, None)
+            return False
+
+        if _verified_vendors.get(vendor):
+            print(f"[SESSION] {vendor} 세션 재사용 (이미 확인됨)")
+            return True
+
+        if probe_vendor_session(browser, vendor):
+            _verified_vendors[vendor] = True
+            print(f"[SESSION] {vendor} 세션 재사용 (probe 통과)")
+            return True
+
+        print(f"[SESSION] {vendor} 재로그인 필요: probe 실패")
+        return False
+
+
+def save_vendor_session(context: BrowserContext, vendor: str) -> str:
+    """
+    UI 로그인 직후 호출. storageState 를 저장하고 확인된 세션으로 표시한다.
+    """
+    os.makedirs(SESSION_DIR, exist_ok=True)
+    session_path = get_session_path(vendor)
+
+    # 병렬 실행 시 다른 워커가 읽는 도중 반쯤 쓰인 파일을 보지 않도록 임시 파일 → 교체
+    tmp_path = f"{session_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(context.storage_state(), f)
+    os.replace(tmp_path, session_path)
+
+    _verified_vendors[vendor] = True
+    print(f"[SESSION] {vendor} 세션 저장: {session_path}")
+    return session_path
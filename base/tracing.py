@@ -0,0 +1,88 @@
+import os
+import weakref
+from datetime import datetime
+from typing import Optional
+
+import allure
+from playwright.sync_api import Browser, BrowserContext
+
+from base.config import TRACE_ON_FAILURE, TRACE_SCREENSHOTS
+
+# tracing 을 켠 컨텍스트 (닫히면 자동으로 빠짐)
+_traced_contexts = weakref.WeakSet()
+
+
+def start_failure_trace(context: BrowserContext) -> None:
+    """
+    컨텍스트 생성 직후 호출. 트레이스는 드라이버 임시 영역에만 쌓이고,
+    save_failure_trace() 를 부르지 않으면 context.close() 때 그대로 버려진다.
+    - 스크린캐스트 프레임은 TRACE_SCREENSHOTS 일 때만 (기본은 DOM 스냅샷만)
+    - 기록은 구간(chunk) 단위: 케이스가 바뀌거나 저장할 때마다 이전 구간은 버려진다
+    """
+    if not TRACE_ON_FAILURE:
+        return
+
+    try:
+        context.tracing.start(screenshots=TRACE_SCREENSHOTS, snapshots=True)
+        _traced_contexts.add(context)
+    except Exception as e:
+        print(f"[TRACE] tracing 시작 실패 (무시): {e}")
+
+
+def rotate_trace_chunk(context: BrowserContext) -> None:
+    """
+    오래 유지되는 컨텍스트(service_page)에서 케이스가 바뀔 때 호출.
+    이전 케이스 구간은 저장하지 않고 버리고 새 구간을 시작한다. (케이스 1개 크기의 링 버퍼)
+    """
+    if context not in _traced_contexts:
+        return
+
+    try:
+        context.tracing.stop_chunk()
+        context.tracing.start_chunk()
+    except Exception as e:
+        print(f"[TRACE] trace 구간 교체 실패 (무시): {e}")
+
+
+def save_failure_trace(context: Optional[BrowserContext], test_name: str) -> Optional[str]:
+    """
+    실패한 테스트의 현재 trace 구간을 zip 으로 저장하고 Allure 에 첨부한다.
+    (trace.playwright.dev 또는 `playwright show-trace` 로 열람)
+    """
+    if context is None or context not in _traced_contexts:
+        return None
+
+    trace_dir = os.path.join(os.getcwd(), "report", "traces")
+    os.makedirs(trace_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    trace_path = os.path.join(trace_dir, f"{test_name}_failed_{timestamp}.zip")
+
+    try:
+        context.tracing.stop_chunk(path=trace_path)
+        # 같은 컨텍스트를 계속 쓰는 경우를 위해 다음 구간을 바로 시작
+        context.tracing.start_chunk()
+    except Exception as e:
+        print(f"[WARN] Trace save failed for {test_name}: {e}")
+        return None
+
+    print(f"Trace saved at : {trace_path}")
+    allure.attach.file(trace_path, name=f"{test_name}_failure_trace", extension="zip")
+    return trace_path
+
+
+class TracingBrowser:
+    """
+    browser.new_context() 로 만든 모든 컨텍스트에 실패 대비 tracing 을 걸어 주는 얇은 래퍼.
+    나머지 속성/메서드는 원래 Browser 로 그대로 넘긴다.
+    """
+
+    def __init__(self, browser: Browser):
+        self._browser = browser
+
+    def new_context(self, **kwargs) -> BrowserContext:
+        context = self._browser.new_context(**kwargs)
+        start_failure_trace(context)
+        return context
+
+    def __getattr__(self, name):
+        return getattr(self._browser, name)
@@ -0,0 +1,200 @@
+import base64
+import json
+import os
+import time
+from typing import Dict, Optional, Set
+
+import allure
+from playwright.sync_api import Page
+
+from base.config import UI_DRIFT_CHECK, UI_BASELINE_DIR, UI_DRIFT_THRESHOLD, UI_DRIFT_UPDATE_BASELINE
+
+# plugin/screen-diff 의 첨부 뷰어가 처리하는 MIME (내용: {"expected", "actual", "diff"} 이미지 data URI)
+SCREEN_DIFF_MIME = "application/vnd.allure.image.diff"
+
+# 해시 크기: 17x16 으로 줄인 흑백 이미지에서 가로 이웃 밝기 비교 → 256비트 (dHash)
+HASH_WIDTH = 16
+HASH_HEIGHT = 16
+
+# 스크린샷 디코딩/축소/비교는 빈 탭(about:blank)의 canvas 에서 처리한다.
+# (파이썬 이미지 라이브러리 없이, 서비스 페이지의 CSP 영향도 받지 않음)
+_HASH_AND_DIFF_JS = """
+async ({ actual, expected, width, height }) => {
+    const load = (src) => new Promise((resolve, reject) => {
+        const img = new Image();
+        img.onload = () => resolve(img);
+        img.onerror = reject;
+        img.src = src;
+    });
+    const gray = (d, i) => d[i] * 0.299 + d[i + 1] * 0.587 + d[i + 2] * 0.114;
+
+    const dhash = (img) => {
+        const canvas = document.createElement('canvas');
+        canvas.width = width + 1;
+        canvas.height = height;
+        const ctx = canvas.getContext('2d');
+        ctx.drawImage(img, 0, 0, width + 1, height);
+        const d = ctx.getImageData(0, 0, width + 1, height).data;
+        let hex = '';
+        let nibble = 0;
+        let count = 0;
+        for (let y = 0; y < height; y++) {
+            for (let x = 0; x < width; x++) {
+                const i = (y * (width + 1) + x) * 4;
+                nibble = (nibble << 1) | (gray(d, i) > gray(d, i + 4) ? 1 : 0);
+                if (++count % 4 === 0) {
+                    hex += nibble.toString(16);
+                    nibble = 0;
+                }
+            }
+        }
+        return hex;
+    };
+
+    const actualImg = await load(actual);
+    const result = { hash: dhash(actualImg), diff: null };
+    if (!expected) {
+        return result;
+    }
+
+    // 차이 이미지: 실제 화면을 흐리게 깔고, 픽셀 차이가 큰 곳을 빨간색으로 표시
+    const expectedImg = await load(expected);
+    const w = Math.max(actualImg.width, expectedImg.width);
+    const h = Math.max(actualImg.height, expectedImg.height);
+    const read = (img) => {
+        const canvas = document.createElement('canvas');
+        canvas.width = w;
+        canvas.height = h;
+        const ctx = canvas.getContext('2d');
+        ctx.drawImage(img, 0, 0);
+        return ctx.getImageData(0, 0, w, h);
+    };
+    const a = read(actualImg);
+    const e = read(expectedImg).data;
+    const out = a.data;
+    for (let i = 0; i < out.length; i += 4) {
+        const changed = Math.abs(gray(out, i) - gray(e, i)) > 32;
+        if (changed) {
+            out[i] = 255; out[i + 1] = 0; out[i + 2] = 0;
+        } else {
+            out[i] = 255 - (255 - out[i]) / 4;
+            out[i + 1] = 255 - (255 - out[i + 1]) / 4;
+            out[i + 2] = 255 - (255 - out[i + 2]) / 4;
+        }
+        out[i + 3] = 255;
+    }
+    const canvas = document.createElement('canvas');
+    canvas.width = w;
+    canvas.height = h;
+    canvas.getContext('2d').putImageData(a, 0, 0);
+    result.diff = canvas.toDataURL('image/png');
+    return result;
+}
+"""
+
+# 이번 실행에서 이미 비교한 화면 (화면별 1회만 비교)
+_checked: Set[str] = set()
+# 이번 실행에서 drift 로 보고한 화면 {screen: distance}
+UI_DRIFTS: Dict[str, float] = {}
+
+
+def _data_uri(png: bytes) -> str:
+    return "data:image/png;base64," + base64.b64encode(png).decode("ascii")
+
+
+def _hamming_ratio(hash_a: str, hash_b: str) -> float:
+    if len(hash_a) != len(hash_b):
+        return 1.0
+    bits = bin(int(hash_a, 16) ^ int(hash_b, 16)).count("1")
+    return bits / (len(hash_a) * 4)
+
+
+def get_ui_baseline_paths(screen: str):
+    return (os.path.join(UI_BASELINE_DIR, f"{screen}.png"),
+            os.path.join(UI_BASELINE_DIR, f"{screen}.json"))
+
+
+def _save_ui_baseline(screen: str, png: bytes, phash: str) -> None:
+    os.makedirs(UI_BASELINE_DIR, exist_ok=True)
+    png_path, meta_path = get_ui_baseline_paths(screen)
+    with open(png_path, "wb") as f:
+        f.write(png)
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump({"hash": phash, "saved_at": time.strftime("%Y-%m-%d %H:%M:%S")}, f, indent=2)
+
+
+def _hash_and_diff(page: Page, actual: bytes, expected: Optional[bytes]) -> dict:
+    helper = page.context.new_page()
+    try:
+        return helper.evaluate(_HASH_AND_DIFF_JS, {
+            "actual": _data_uri(actual),
+            "expected": _data_uri(expected) if expected else None,
+            "width": HASH_WIDTH,
+            "height": HASH_HEIGHT,
+        })
+    finally:
+        helper.close()
+
+
+def check_ui_drift(page: Page, screen: str, timeout: int = 5000) -> Optional[float]:
+    """
+    주요 화면(작성 화면, 첨부 후 화면 등)의 perceptual hash 를 기준선과 비교한다.
+
+    - 기준선(UI_BASELINE_DIR/{screen}.png/.json)이 없으면 현재 화면으로 생성
+    - 다른 비트 비율이 UI_DRIFT_THRESHOLD 를 넘으면 "UI DRIFT" 로 출력하고
+      기준선/현재/차이 이미지를 screen-diff 뷰어용 첨부로 남긴다 (테스트는 실패시키지 않음)
+    - 화면별로 실행당 1회만 비교, 어떤 오류도 테스트 흐름에 영향을 주지 않는다
+    - 반환값: 기준선과의 차이 비율 (비교하지 않았으면 None)
+
+    사용 예)
+        check_ui_drift(page, "daum_mail_compose")
+    """
+    if not UI_DRIFT_CHECK or screen in _checked:
+        return None
+    _checked.add(screen)
+
+    started = time.monotonic()
+    try:
+        actual = page.screenshot(timeout=timeout, animations="disabled", caret="hide")
+
+        png_path, meta_path = get_ui_baseline_paths(screen)
+        if not os.path.exists(meta_path):
+            phash = _hash_and_diff(page, actual, None)["hash"]
+            _save_ui_baseline(screen, actual, phash)
+            print(f"[UI_DRIFT] {screen}: 기준선 생성 ({png_path})")
+            return None
+
+        with open(meta_path, "r", encoding="utf-8") as f:
+            baseline_hash = json.load(f)["hash"]
+
+        phash = _hash_and_diff(page, actual, None)["hash"]
+        distance = _hamming_ratio(phash, baseline_hash)
+        elapsed_ms = int((time.monotonic() - started) * 1000)
+
+        if distance <= UI_DRIFT_THRESHOLD:
+            print(f"[UI_DRIFT] {screen}: 기준선과 일치 (차이 {distance:.1%}, {elapsed_ms}ms)")
+            return distance
+
+        # drift 일 때만 차이 이미지 생성 (느린 경로)
+        with open(png_path, "rb") as f:
+            expected = f.read()
+        diff = _hash_and_diff(page, actual, expected)["diff"]
+
+        UI_DRIFTS[screen] = distance
+        print(f"[UI_DRIFT] {screen}: 화면 변경 감지 (차이 {distance:.1%} > {UI_DRIFT_THRESHOLD:.1%})")
+        allure.attach(
+            json.dumps({"expected": _data_uri(expected), "actual": _data_uri(actual), "diff": diff}),
+            name=f"UI DRIFT: {screen} ({distance:.1%})",
+            attachment_type=SCREEN_DIFF_MIME,
+            extension="imagediff",
+        )
+
+        if UI_DRIFT_UPDATE_BASELINE:
+            _save_ui_baseline(screen, actual, phash)
+            print(f"[UI_DRIFT] {screen}: 기준선 갱신")
+
+        return distance
+
+    except Exception as e:
+        print(f"[WARN] {screen}: UI drift 비교 실패 (무시): {e}")
+        return None
@@ -0,0 +1,162 @@
+import ctypes
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, Optional, Set
+
+from playwright.sync_api import Browser
+
+from base.config import TEST_DEADLINE_SEC, TEST_DEADLINE_GRACE_SEC
+
+
+class DeadlineExceeded(Exception):
+    """
+    테스트가 TEST_DEADLINE_SEC 를 넘겨 watchdog 이 브라우저를 종료했음을 나타낸다.
+    (AssertionError / pytest.fail 이 아니므로 Allure 에서 broken 으로 분류됨)
+    """
+
+
+def get_browser_pid(browser: Browser) -> Optional[int]:
+    """
+    Chromium 브라우저 프로세스 pid. (CDP SystemInfo.getProcessInfo 의 browser 항목)
+    """
+    try:
+        cdp = browser.new_browser_cdp_session()
+        try:
+            info = cdp.send("SystemInfo.getProcessInfo")
+        finally:
+            cdp.detach()
+        return next((p["id"] for p in info.get("processInfo", []) if p.get("type") == "browser"), None)
+    except Exception as e:
+        print(f"[WATCHDOG] 브라우저 pid 조회 실패 (강제 종료 불가): {e}")
+        return None
+
+
+def kill_process_tree(pid: int) -> None:
+    """
+    브라우저 프로세스와 자식(renderer/GPU 등)을 강제 종료한다.
+    """
+    if os.name == "nt":
+        subprocess.run(["taskkill", "/F", "/T", "/PID", str(pid)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return
+
+    try:
+        # playwright 는 브라우저를 별도 프로세스 그룹으로 띄우므로 그룹 전체 종료
+        os.killpg(os.getpgid(pid), signal.SIGKILL)
+    except (ProcessLookupError, PermissionError, OSError):
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+
+class TestWatchdog:
+    """
+    테스트 1개에 벽시계 제한을 거는 감시 스레드.
+
+    - start() 후 budget_sec(테스트별 deadline 마커가 있으면 그 값) 안에 stop() 이 안 불리면
+      1) 메인 스레드 스택 + 경과 시간 기록
+      2) 등록된 브라우저 프로세스 트리 강제 종료 → 멈춰 있던 Playwright 호출이 예외로 풀림
+         (다음 테스트의 browser fixture 가 브라우저를 다시 띄움)
+      3) 그 뒤 grace_sec 안에도 안 끝나면 메인 스레드에 DeadlineExceeded 를 넣어 중단
+    - 기록(fired)은 conftest 가 메인 스레드에서 Allure 첨부 + broken 처리에 사용
+    """
+    __test__ = False
+
+    def __init__(self, budget_sec: int = TEST_DEADLINE_SEC, grace_sec: int = TEST_DEADLINE_GRACE_SEC):
+        self.default_budget_sec = budget_sec
+        self.budget_sec = budget_sec
+        self.grace_sec = grace_sec
+        self.browser_pids: Set[int] = set()
+        self.phase = "setup"
+        self.fired: Optional[Dict] = None
+        self._nodeid: Optional[str] = None
+        self._started = 0.0
+        self._timer: Optional[threading.Timer] = None
+        self._main_ident = threading.main_thread().ident
+        self._lock = threading.Lock()
+
+    def register_browser(self, browser: Browser) -> None:
+        pid = get_browser_pid(browser)
+        if pid is not None:
+            self.browser_pids.add(pid)
+            print(f"[WATCHDOG] 감시 대상 브라우저 pid={pid}")
+
+    def start(self, nodeid: str, budget_sec: Optional[int] = None) -> None:
+        """
+        budget_sec 를 넘기면 이 테스트만 기본 제한(TEST_DEADLINE_SEC) 대신 그 값을 쓴다.
+        (대용량 벤치마크/스윕처럼 원래 오래 걸리는 케이스용, deadline 마커)
+        """
+        budget = self.default_budget_sec if budget_sec is None else budget_sec
+        if self.default_budget_sec <= 0 or budget <= 0:
+            return
+        with self._lock:
+            self._nodeid = nodeid
+            self._started = time.monotonic()
+            self.budget_sec = budget
+            self.phase = "setup"
+            self.fired = None
+            self._schedule(self.budget_sec, self._on_deadline)
+
+    def stop(self) -> None:
+        with self._lock:
+            self._nodeid = None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _schedule(self, delay: float, func) -> None:
+        self._timer = threading.Timer(delay, func, args=(self._nodeid,))
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _on_deadline(self, nodeid: str) -> None:
+        with self._lock:
+            if self._nodeid != nodeid:
+                return
+
+            elapsed = time.monotonic() - self._started
+            frame = sys._current_frames().get(self._main_ident)
+            stack = "".join(traceback.format_stack(frame)) if frame else ""
+            killed = sorted(self.browser_pids)
+
+            self.fired = {
+                "nodeid": nodeid,
+                "phase": self.phase,
+                "budget_sec": self.budget_sec,
+                "elapsed_sec": round(elapsed, 1),
+                "killed_browser_pids": killed,
+                "stack": stack,
+            }
+            print(f"\n[WATCHDOG] {nodeid}: {self.phase} 단계에서 {elapsed:.0f}s 경과 "
+                  f"(제한 {self.budget_sec}s) → 브라우저 강제 종료 {killed}")
+
+            for pid in killed:
+                kill_process_tree(pid)
+            self.browser_pids.clear()
+
+            if self.grace_sec > 0:
+                self._schedule(self.grace_sec, self._on_grace_expired)
+
+    def _on_grace_expired(self, nodeid: str) -> None:
+        with self._lock:
+            if self._nodeid != nodeid:
+                return
+            self.fired["interrupted"] = True
+            print(f"[WATCHDOG] {nodeid}: 브라우저 종료 후 {self.grace_sec}s 내 미종료 → 테스트 스레드 중단")
+            ctypes.pythonapi.PyThreadState_SetAsyncExc(
+                ctypes.c_ulong(self._main_ident), ctypes.py_object(DeadlineExceeded)
+            )
+
+    def message(self) -> str:
+        f = self.fired
+        return (f"test deadline exceeded: {f['phase']} 단계 {f['elapsed_sec']}s "
+                f"(제한 {f['budget_sec']}s), 브라우저 강제 종료 {f['killed_browser_pids']}")
+
+
+WATCHDOG = TestWatchdog()
@@ -1,6 +1,35 @@
 # conftest.py
 import os
-from base.config import HOST_IP, DUT_IP, DLP_BASE_URL, ES_URL
+import json
+import allure
+import pytest
+from playwright.sync_api import sync_playwright
+from base.config import HOST_IP, DUT_IP, DLP_BASE_URL, ES_URL, HEADLESS, TRACE_ON_FAILURE, LOGIN_GATING
+from base.config import TEST_DEADLINE_SEC
+from base.function import make_dlp_token, READY_TIMINGS
+from base.protocol import collect_unseen_signatures
+from base.ui_drift import UI_DRIFTS
+from base.attach_sweep import SWEEP_RESULTS, summarize_sweep
+from base.bench import BENCH_RESULTS, summarize_bench, launch_route_browser
+from base.burst import BURST_RESULTS, summarize_burst
+from base.prompt_sweep import PROMPT_SWEEP_RESULTS, summarize_prompt_sweep
+from base.service_page import ServicePage
+from base.tracing import TracingBrowser, start_failure_trace
+from base.context_pool import CONTEXT_POOL
+from base.watchdog import WATCHDOG, DeadlineExceeded
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "deadline(sec): 이 케이스만 TEST_DEADLINE_SEC 대신 sec 초 벽시계 제한 (대용량 벤치마크/스윕용)",
+    )
+
+
+def _deadline_sec(item):
+    # deadline 마커가 여러 개면(parametrize + 함수) 가장 가까운 것 사용
+    marker = item.get_closest_marker("deadline")
+    return int(marker.args[0]) if marker and marker.args else None
 
 
 def pytest_sessionstart(session):
@@ -21,5 +50,311 @@ def pytest_sessionstart(session):
         f.write(f"DUT_IP={DUT_IP}\n")
         f.write(f"DLP_BASE_URL={DLP_BASE_URL}\n")
         f.write(f"ES_URL={ES_URL}\n")
+        f.write(f"HEADLESS={HEADLESS}\n")
+        f.write(f"TRACE_ON_FAILURE={TRACE_ON_FAILURE}\n")
+        f.write(f"TEST_DEADLINE_SEC={TEST_DEADLINE_SEC}\n")
 
     print(f"[PYTEST] Allure environment file written to: {env_path}")
+
+
+# 모듈(서비스)별 로그인 실패 사유 {모듈 nodeid: "test_xxx_login: 사유"}
+_failed_logins = {}
+
+
+def _is_login_test(item) -> bool:
+    return item.name.endswith("_login")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    *_login 테스트가 실패하면 모듈 단위로 기록한다.
+    xfail 로그인(다음)은 report.failed 가 아니므로 게이트에 걸리지 않는다.
+    """
+    outcome = yield
+    report = outcome.get_result()
+
+    # setup/teardown 단계에서 watchdog 이 동작한 경우 (call 단계는 pytest_runtest_call 에서 처리)
+    if report.when != "call" and WATCHDOG.fired and not WATCHDOG.fired.get("attached"):
+        _attach_deadline_report()
+
+    if LOGIN_GATING and _is_login_test(item) and report.failed and report.when in ("setup", "call"):
+        reason = str(call.excinfo.value).splitlines()[0] if call.excinfo else report.outcome
+        _failed_logins[item.module.__name__] = f"{item.name}: {reason}"
+        print(f"\n[GATE] {item.module.__name__} 로그인 실패 → 같은 모듈의 나머지 케이스 skip")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """
+    다음 케이스가 같은 모듈의 일반 케이스일 때만 ES 대기 중 컨텍스트를 미리 열게 하고,
+    모듈이 끝나면 쓰지 않은 컨텍스트를 닫는다.
+    """
+    same_module = nextitem is not None and nextitem.module is item.module
+    CONTEXT_POOL.next_allowed = same_module and not _is_login_test(nextitem)
+
+    # setup~teardown 전체에 벽시계 제한 (TEST_DEADLINE_SEC, deadline 마커가 있으면 그 값)
+    WATCHDOG.start(item.nodeid, _deadline_sec(item))
+
+    yield
+
+    WATCHDOG.stop()
+
+    if not same_module:
+        CONTEXT_POOL.discard()
+
+
+def _attach_deadline_report() -> None:
+    fired = WATCHDOG.fired
+    fired["attached"] = True
+    timing = {k: v for k, v in fired.items() if k not in ("stack", "attached")}
+    allure.attach(json.dumps(timing, ensure_ascii=False, indent=2),
+                  name="test_deadline_timing", attachment_type=allure.attachment_type.JSON)
+    if fired["stack"]:
+        allure.attach(fired["stack"], name="test_deadline_stack", attachment_type=allure.attachment_type.TEXT)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """
+    watchdog 이 테스트 도중 브라우저를 종료했으면, 테스트가 잡아서 pytest.fail 로 바꾼 예외 대신
+    DeadlineExceeded 로 결과를 바꿔 Allure 에서 broken 으로 보이게 한다. (경과 시간/스택 첨부)
+    """
+    WATCHDOG.phase = "call"
+    outcome = yield
+
+    if WATCHDOG.fired:
+        _attach_deadline_report()
+        original = outcome.excinfo[1] if outcome.excinfo else None
+        message = WATCHDOG.message()
+        if original is not None and not isinstance(original, DeadlineExceeded):
+            message += f"\n원래 예외: {original}"
+        outcome.force_exception(DeadlineExceeded(message))
+
+
+def pytest_runtest_teardown(item):
+    WATCHDOG.phase = "teardown"
+
+
+def pytest_runtest_setup(item):
+    """
+    같은 모듈의 로그인이 실패했으면 브라우저/ES 재시도 없이 바로 skip.
+    """
+    if not LOGIN_GATING or _is_login_test(item) or item.module is None:
+        return
+
+    reason = _failed_logins.get(item.module.__name__)
+    if reason:
+        pytest.skip(f"로그인 실패로 건너뜀 ({reason})")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    - 기준선에서 사라진 전송 요청 서명 요약
+    - 기준선과 달라진 화면(UI drift) 요약
+    - 첨부파일 크기 스윕 결과 저장/요약
+    - 드라이브 업로드 벤치마크 결과 저장/오버헤드 요약
+    - 메신저 burst 결과 저장/손실률 요약
+    - Copilot 프롬프트 스윕 결과 저장/요약
+    - goto_and_wait / click_and_wait_navigation 의 서비스별 준비 완료 시간을 저장하고 요약 출력.
+    (병렬 실행 시 워커끼리 덮어쓰지 않도록 파일명에 pid 포함)
+    """
+    results_dir = os.getenv("ALLURE_RESULTS_DIR", "allure-results")
+    os.makedirs(results_dir, exist_ok=True)
+
+    # 기준선에 있던 전송 요청 서명이 이번 실행에서 한 번도 안 나온 서비스 (프로토콜 변경 후보)
+    unseen = collect_unseen_signatures()
+    for service, signatures in unseen.items():
+        print(f"[PROTOCOL] {service}: 기준선 전송 서명 미관측 {signatures}")
+    if unseen:
+        with open(os.path.join(results_dir, f"protocol_unseen_{os.getpid()}.json"), "w", encoding="utf-8") as f:
+            json.dump(unseen, f, ensure_ascii=False, indent=2)
+
+    # 기준선과 달라진 화면 (UI 개편 후보)
+    for screen, distance in UI_DRIFTS.items():
+        print(f"[UI_DRIFT] {screen}: 기준선 대비 {distance:.1%} 변경")
+    if UI_DRIFTS:
+        with open(os.path.join(results_dir, f"ui_drift_{os.getpid()}.json"), "w", encoding="utf-8") as f:
+            json.dump(UI_DRIFTS, f, ensure_ascii=False, indent=2)
+
+    # 첨부파일 크기 스윕 결과 (크기별 업로드 시간 / 로그 도착 시간)
+    if SWEEP_RESULTS:
+        print("\n".join(summarize_sweep()))
+        with open(os.path.join(results_dir, f"attach_sweep_{os.getpid()}.json"), "w", encoding="utf-8") as f:
+            json.dump(SWEEP_RESULTS, f, ensure_ascii=False, indent=2)
+
+    # 드라이브 업로드 A/B 벤치마크 (dut 대비 bypass 중앙값 → DLP 검사 오버헤드)
+    if BENCH_RESULTS:
+        summary = summarize_bench()
+        for s in summary:
+            print(f"[BENCH] {s['service']} {s['size_kb']}KB: dut {s['dut_median_ms']}ms / "
+                  f"bypass {s['bypass_median_ms']}ms → 오버헤드 {s['overhead_pct']}%")
+        with open(os.path.join(results_dir, f"bench_{os.getpid()}.json"), "w", encoding="utf-8") as f:
+            json.dump({"summary": summary, "results": BENCH_RESULTS}, f, ensure_ascii=False, indent=2)
+
+    # 메신저 연속 전송 (burst 별 로그 손실률 / 도착 시간 분포)
+    if BURST_RESULTS:
+        print("\n".join(summarize_burst()))
+        with open(os.path.join(results_dir, f"burst_{os.getpid()}.json"), "w", encoding="utf-8") as f:
+            json.dump(BURST_RESULTS, f, ensure_ascii=False, indent=2)
+
+    # Copilot 프롬프트 크기/밀도 스윕 (전송량 / 로그 도착 시간)
+    if PROMPT_SWEEP_RESULTS:
+        print("\n".join(summarize_prompt_sweep()))
+        with open(os.path.join(results_dir, f"prompt_sweep_{os.getpid()}.json"), "w", encoding="utf-8") as f:
+            json.dump(PROMPT_SWEEP_RESULTS, f, ensure_ascii=False, indent=2)
+
+    if not READY_TIMINGS:
+        return
+    path = os.path.join(results_dir, f"ready_timings_{os.getpid()}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(READY_TIMINGS, f, ensure_ascii=False, indent=2)
+
+    by_service = {}
+    for t in READY_TIMINGS:
+        by_service.setdefault(t["service"], []).append(t)
+
+    print("=" * 60)
+    for service, items in sorted(by_service.items()):
+        ok = sorted(t["elapsed_ms"] for t in items if t["ok"])
+        failed = len(items) - len(ok)
+        if ok:
+            print(f"[READY] {service}: n={len(ok)} p50={ok[len(ok) // 2]}ms max={ok[-1]}ms 실패={failed}")
+        else:
+            print(f"[READY] {service}: 성공 없음 실패={failed}")
+    print(f"[READY] timings written to: {path}")
+
+
+@pytest.fixture(scope="session")
+def playwright_session():
+    """
+    워커 프로세스당 playwright 드라이버를 한 번만 띄운다.
+    """
+    with sync_playwright() as p:
+        yield p
+
+
+@pytest.fixture(scope="session")
+def shared_browser_state(playwright_session):
+    """
+    워커 프로세스 전체가 공유하는 Chromium 인스턴스 보관용.
+    세션 종료 시 한 번만 브라우저를 닫는다.
+    """
+    state = {"browser": None, "kept_contexts": set()}
+    yield state
+
+    shared = state["browser"]
+    if shared is not None and shared.is_connected():
+        shared.close()
+
+
+def _ensure_shared_browser(playwright_session, shared_browser_state):
+    shared = shared_browser_state["browser"]
+    if shared is None or not shared.is_connected():
+        print(f"[PYTEST] 공유 Chromium 실행 (headless={HEADLESS})")
+        shared = playwright_session.chromium.launch(headless=HEADLESS)
+        shared_browser_state["browser"] = shared
+        # 테스트가 제한 시간을 넘기면 watchdog 이 이 브라우저 프로세스 트리를 종료
+        WATCHDOG.register_browser(shared)
+    return shared
+
+
+@pytest.fixture
+def browser(playwright_session, shared_browser_state):
+    """
+    워커당 한 번만 띄운 Chromium 을 테스트에 넘겨준다.
+
+    - 테스트는 browser.new_context(...) 로 자기 전용 컨텍스트를 만들고
+      finally 에서 context.close() 만 호출한다. (browser.close() 금지)
+    - 이전 테스트에서 브라우저가 죽었으면 여기서 다시 띄운다.
+    - 테스트가 닫지 않은 컨텍스트는 종료 시 정리해서 다음 테스트에 넘기지 않는다.
+      (service_page 가 모듈 동안 유지하는 컨텍스트는 제외)
+    """
+    shared = _ensure_shared_browser(playwright_session, shared_browser_state)
+
+    # 미리 열어 둔 컨텍스트는 아래 정리 대상에서 제외
+    CONTEXT_POOL.on_keep = shared_browser_state["kept_contexts"].add
+    CONTEXT_POOL.on_release = shared_browser_state["kept_contexts"].discard
+
+    # new_context() 마다 실패 대비 tracing 시작 (통과하면 저장 없이 버려짐)
+    yield TracingBrowser(shared)
+
+    if shared.is_connected():
+        for context in list(shared.contexts):
+            if context in shared_browser_state["kept_contexts"]:
+                continue
+            try:
+                context.close()
+            except Exception as e:
+                print(f"[WARN] 컨텍스트 정리 실패: {e}")
+
+
+@pytest.fixture(scope="module")
+def service_page(playwright_session, shared_browser_state):
+    """
+    모듈 단위로 서비스별 로그인된 페이지를 유지한다.
+
+    사용 예)
+        def test_daum_mail_normal(request, service_page, dlp_token):
+            session = service_page("daum_mail")
+            page = session.compose()   # 새 작성 화면
+            ...
+            실패 시 session.invalidate()  (context.close() 는 하지 않음)
+    """
+    kept = shared_browser_state["kept_contexts"]
+    sessions = {}
+
+    def on_context(context):
+        kept.add(context)
+        start_failure_trace(context)
+
+    def get(service):
+        session = sessions.get(service)
+        if session is None or not session.browser.is_connected():
+            browser = _ensure_shared_browser(playwright_session, shared_browser_state)
+            session = ServicePage(browser, service, on_context=on_context)
+            sessions[service] = session
+        return session
+
+    yield get
+
+    for session in sessions.values():
+        if session.context is not None:
+            kept.discard(session.context)
+        session.close()
+
+
+@pytest.fixture(scope="session")
+def bench_browser(playwright_session):
+    """
+    벤치마크 경로(dut / bypass)별 전용 Chromium 을 세션 동안 하나씩 유지한다.
+
+    사용 예)
+        context = bench_browser(route).new_context(storage_state=get_session_path("dooray"))
+    """
+    browsers = {}
+
+    def get(route):
+        browser = browsers.get(route)
+        if browser is None or not browser.is_connected():
+            browser = launch_route_browser(playwright_session, route)
+            browsers[route] = browser
+        return browser
+
+    yield get
+
+    for browser in browsers.values():
+        if browser.is_connected():
+            browser.close()
+
+
+@pytest.fixture
+def dlp_token(request):
+    """
+    테스트별 고유 토큰. 제목/본문에 넣어 두고 assert_es_logs_with_retry(token=...) 로 넘기면
+    ServiceName 최신 문서 대신 이 테스트가 보낸 문서만 검증한다.
+    """
+    token = make_dlp_token()
+    print(f"[PYTEST] {request.node.name} dlp_token = {token}")
+    allure.attach(token, name="dlp_token", attachment_type=allure.attachment_type.TEXT)
+    return token
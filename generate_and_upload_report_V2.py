@@ -13,6 +13,30 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 os.chdir(BASE_DIR)
 
 
+def run_pytest_parallel(result_dir, env, workers):
+    """
+    ServiceName 그룹 단위로 테스트 모듈을 나눠서 pytest 를 workers 개 동시에 실행한다.
+
+    - 같은 ServiceName 을 쓰는 모듈은 항상 같은 pytest 프로세스에서 순서대로 실행
+    - 각 프로세스는 같은 result_dir 에 Allure 결과를 쓴다 (파일명이 uuid 라 충돌 없음)
+    - 하나라도 실패하면 0 이 아닌 returncode 를 돌려준다
+    """
+    shards = build_service_shards(collect_test_modules(), workers)
+
+    procs = []
+    for idx, modules in enumerate(shards):
+        print(f"[PARALLEL] worker {idx} 시작 (모듈 {len(modules)}개)")
+        procs.append(subprocess.Popen(
+            [sys.executable, "-m", "pytest", "-v", f"--alluredir={result_dir}", *modules],
+            env=env
+        ))
+
+    returncodes = [proc.wait() for proc in procs]
+    print(f"[PARALLEL] worker returncodes = {returncodes}")
+
+    return next((rc for rc in returncodes if rc != 0), 0)
+
+
 def run_tests_and_generate_report():
     env = os.environ.copy()
     env["PATH"] += ";C:\\allure\\allure-2.32.0\\bin"
@@ -28,13 +52,22 @@ def run_tests_and_generate_report():
             result_dir = f"{results_dir}/run_{i}"
             os.makedirs(result_dir, exist_ok=True)
 
-            proc = subprocess.run(
-                [sys.executable, "-m", "pytest", "-v", f"--alluredir={result_dir}"],
-                env=env
-            )
-
-            if proc.returncode != 0:
-                print(f"{i}번째 테스트에서 오류 발생(returncode={proc.returncode}). 반복을 중단합니다.")
+            if EXECUTION_MODE == "async":
+                # 한 프로세스 / 한 이벤트 루프에서 여러 서비스 플로우를 동시에 실행
+                from test_services.Common.async_flows import ASYNC_FLOWS
+                results = run_async_flows(ASYNC_FLOWS, ASYNC_CONCURRENCY, result_dir)
+                returncode = 0 if all(r["status"] in ("passed", "skipped") for r in results) else 1
+            elif PARALLEL_WORKERS > 1:
+                returncode = run_pytest_parallel(result_dir, env, PARALLEL_WORKERS)
+            else:
+                proc = subprocess.run(
+                    [sys.executable, "-m", "pytest", "-v", f"--alluredir={result_dir}"],
+                    env=env
+                )
+                returncode = proc.returncode
+
+            if returncode != 0:
+                print(f"{i}번째 테스트에서 오류 발생(returncode={returncode}). 반복을 중단합니다.")
                 break
 
         # ===============================================================
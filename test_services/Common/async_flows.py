@@ -0,0 +1,134 @@
+"""
+EXECUTION_MODE=async 일 때 base.async_runner 로 동시에 돌리는 플로우 목록.
+
+- pytest 수집 대상이 아니다 (test_*.py 아님)
+- 로그인은 pytest 의 *_login 테스트가 저장한 storageState 를 그대로 사용
+- 각 run 함수는 페이지 조작 ~ 전송까지만 담당하고, ES 검증은 러너가 토큰으로 수행
+"""
+from base import *
+from base.async_runner import async_send_and_wait_for_request
+
+# 기대값은 pytest 모듈의 *_LOGGING_CASE 를 그대로 사용 (두 실행 경로의 기대값이 어긋나지 않도록)
+import test_services.SNS.dooray_board.test_dooray_board_compare as dooray_board_cases
+import test_services.messenger.dooray_messenger.test_dooray_messenger_compare as dooray_messenger_cases
+import test_services.messenger.naverworks_messenger.test_naverworks_messenger_compare as naverworks_messenger_cases
+import test_services.messenger.copilot.test_copilot_free_compare as copilot_cases
+
+
+# ============================
+# 서비스별 전송 플로우
+# ============================
+def dooray_board_flow(title, lines):
+    async def run(page, token):
+        await page.goto(f"{DOORAY_BASE_URL}/home")
+        await page.wait_for_timeout(3000)
+
+        await page.get_by_test_id("HomeLnb_ContainedButton").click()
+        await page.wait_for_timeout(1000)
+
+        await page.get_by_test_id("HomeBoardWritePageTitleField_BottomLinedTextField").fill(f"{title} {token}")
+
+        editor_box = page.get_by_test_id("DoorayMDEditor").get_by_role("textbox")
+        await editor_box.click()
+        await editor_box.fill("\n".join(lines))
+        await page.wait_for_timeout(1000)
+
+        return await async_send_and_wait_for_request(
+            page, "dooray_board",
+            page.get_by_test_id("HomeBoardArticleEditorSaveButton_ButtonComponent").click,
+        )
+    return run
+
+
+def dooray_messenger_flow(lines):
+    async def run(page, token):
+        await page.goto(f"{DOORAY_BASE_URL}/messenger")
+        await page.wait_for_timeout(3000)
+
+        await page.locator("textarea").fill("\n".join(lines + [token]))
+        await page.wait_for_timeout(1000)
+
+        return await async_send_and_wait_for_request(
+            page, "dooray_messenger", lambda: page.locator("textarea").press("Enter"),
+        )
+    return run
+
+
+def naverworks_messenger_flow(lines):
+    async def run(page, token):
+        await page.goto(f"{NAVERWORKS_MESSENGER_URL}/")
+        await page.wait_for_timeout(3000)
+
+        await page.locator("#message-input").fill("\n".join(lines + [token]))
+
+        return await async_send_and_wait_for_request(
+            page, "naverworks_messenger", lambda: page.keyboard.press("Enter"),
+        )
+    return run
+
+
+def copilot_flow(lines):
+    async def run(page, token):
+        await page.goto(f"{COPILOT_BASE_URL}")
+        await page.wait_for_timeout(3000)
+
+        await page.get_by_role("button", name="새로운 채팅 시작").click()
+        await page.wait_for_timeout(1000)
+
+        await page.get_by_test_id("composer-input").fill("\n".join(lines + [token]))
+        await page.wait_for_timeout(1000)
+
+        return await async_send_and_wait_for_request(
+            page, "copilot", page.get_by_test_id("submit-button").click, fallback_ms=10000,
+        )
+    return run
+
+
+# ============================
+# 실행 목록
+# ============================
+ASYNC_FLOWS = [
+    # 두레이 게시판
+    {"name": "test_dooray_board_normal", "suite": "dooray_board", "vendor": "dooray",
+     "service_names": SERVICE_NAMES_DOORAY_BOARD, "test_cases": dooray_board_cases.NORMAL_LOGGING_CASE,
+     "run": dooray_board_flow("기본로깅테스트", DLP_NORMAL)},
+    {"name": "test_dooray_board_pattern", "suite": "dooray_board", "vendor": "dooray",
+     "service_names": SERVICE_NAMES_DOORAY_BOARD, "test_cases": dooray_board_cases.PATTERN_LOGGING_CASE,
+     "run": dooray_board_flow("개인정보로깅테스트", DLP_PATTERNS)},
+    {"name": "test_dooray_board_keyword", "suite": "dooray_board", "vendor": "dooray",
+     "service_names": SERVICE_NAMES_DOORAY_BOARD, "test_cases": dooray_board_cases.KEYWORD_LOGGING_CASE,
+     "run": dooray_board_flow("키워드로깅테스트", DLP_KEYWORDS)},
+
+    # 두레이 메신저
+    {"name": "test_dooray_messenger_normal", "suite": "dooray_messenger", "vendor": "dooray",
+     "service_names": SERVICE_NAMES_DOORAY_MESSENGER, "test_cases": dooray_messenger_cases.NORMAL_LOGGING_CASE,
+     "run": dooray_messenger_flow(DLP_NORMAL)},
+    {"name": "test_dooray_messenger_pattern", "suite": "dooray_messenger", "vendor": "dooray",
+     "service_names": SERVICE_NAMES_DOORAY_MESSENGER, "test_cases": dooray_messenger_cases.PATTERN_LOGGING_CASE,
+     "run": dooray_messenger_flow(DLP_PATTERNS)},
+    {"name": "test_dooray_messenger_keyword", "suite": "dooray_messenger", "vendor": "dooray",
+     "service_names": SERVICE_NAMES_DOORAY_MESSENGER, "test_cases": dooray_messenger_cases.KEYWORD_LOGGING_CASE,
+     "run": dooray_messenger_flow(DLP_KEYWORDS)},
+
+    # 네이버웍스 메신저
+    {"name": "test_naverworks_messenger_normal", "suite": "naverworks_messenger", "vendor": "naverworks",
+     "service_names": SERVICE_NAMES_NAVERWORKS_MESSENGER, "test_cases": naverworks_messenger_cases.NORMAL_LOGGING_CASE,
+     "run": naverworks_messenger_flow(DLP_NORMAL)},
+    {"name": "test_naverworks_messenger_pattern", "suite": "naverworks_messenger", "vendor": "naverworks",
+     "service_names": SERVICE_NAMES_NAVERWORKS_MESSENGER, "test_cases": naverworks_messenger_cases.PATTERN_LOGGING_CASE,
+     "run": naverworks_messenger_flow(DLP_PATTERN)},
+    {"name": "test_naverworks_messenger_keyword", "suite": "naverworks_messenger", "vendor": "naverworks",
+     "service_names": SERVICE_NAMES_NAVERWORKS_MESSENGER, "test_cases": naverworks_messenger_cases.KEYWORD_LOGGING_CASE,
+     "run": naverworks_messenger_flow(DLP_KEYWORDS)},
+
+    # 코파일럿
+    {"name": "test_copilot_free_normal", "suite": "copilot", "vendor": "copilot",
+     "service_names": SERVICE_NAMES_COPILOT, "test_cases": copilot_cases.NORMAL_LOGGING_CASE,
+     "run": copilot_flow(DLP_NORMAL)},
+    {"name": "test_copilot_free_pattern", "suite": "copilot", "vendor": "copilot",
+     "service_names": SERVICE_NAMES_COPILOT, "test_cases": copilot_cases.PATTERN_LOGGING_CASE,
+     "run": copilot_flow(DLP_PATTERNS)},
+    {"name": "test_copilot_free_keyword", "suite": "copilot", "vendor": "copilot",
+     "service_names": SERVICE_NAMES_COPILOT, "test_cases": copilot_cases.KEYWORD_LOGGING_CASE,
+     "run": copilot_flow(DLP_KEYWORDS)},
+]
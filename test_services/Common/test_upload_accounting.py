@@ -0,0 +1,96 @@
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import allure
+import pytest
+from base import *
+
+# 로컬 업로드 페이지: 파일을 고르면 fetch(FormData) 또는 form submit(multipart) 으로 /upload 에 POST
+UPLOAD_PAGE = """<!doctype html>
+<html><body>
+<form id="form" action="/upload" method="post" enctype="multipart/form-data">
+    <input type="file" id="file" name="file">
+</form>
+<script>
+const mode = new URLSearchParams(location.search).get("mode");
+document.getElementById("file").addEventListener("change", e => {
+    if (mode === "form") {
+        document.getElementById("form").submit();
+        return;
+    }
+    const body = new FormData();
+    body.append("file", e.target.files[0]);
+    fetch("/upload", {method: "POST", body});
+});
+</script>
+</body></html>
+"""
+
+UPLOAD_FILE_BYTES = 2 * 1024 * 1024
+
+
+class _UploadHandler(BaseHTTPRequestHandler):
+    received = []
+
+    def do_GET(self):
+        body = UPLOAD_PAGE.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        _UploadHandler.received.append(length)
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def upload_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _UploadHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@allure.severity(allure.severity_level.NORMAL)
+@allure.step("Upload accounting: file from disk")
+@pytest.mark.parametrize("mode", ["fetch", "form"])
+def test_expect_file_transmitted_disk_file(request, browser, upload_server, tmp_path, mode):
+    # 디스크 파일 multipart 업로드도 파일 크기만큼 전송으로 잡혀야 한다 (Content-Length 기준 포함)
+    file_path = tmp_path / f"upload_{mode}.bin"
+    file_path.write_bytes(os.urandom(UPLOAD_FILE_BYTES))
+    _UploadHandler.received.clear()
+
+    context = browser.new_context()
+    page = context.new_page()
+
+    try:
+        goto_and_wait(page, f"{upload_server}/?mode={mode}", ready="#file")
+
+        with expect_file_transmitted(page, str(file_path), timeout=15000) as upload:
+            page.set_input_files("#file", str(file_path))
+
+        assert _UploadHandler.received and max(_UploadHandler.received) >= UPLOAD_FILE_BYTES, (
+            f"서버가 받은 본문 {_UploadHandler.received} < 파일 {UPLOAD_FILE_BYTES} bytes"
+        )
+        assert upload["transmitted_bytes"] >= UPLOAD_FILE_BYTES, (
+            f"전송 집계 {upload['transmitted_bytes']} bytes < 파일 {UPLOAD_FILE_BYTES} bytes"
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
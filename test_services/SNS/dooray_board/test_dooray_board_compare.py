@@ -2,7 +2,7 @@ import os
 import time
 import allure
 import pytest
-from playwright.sync_api import sync_playwright,BrowserContext,TimeoutError
+from playwright.sync_api import BrowserContext,TimeoutError
 from base import *
 
 
@@ -42,266 +42,243 @@ FILE_LOGGING_CASE = [
 @allure.step("Dooray Login Test")
 #@pytest.mark.order("first")
 @pytest.mark.dependency(name="dooray_login")
-def test_dooray_login(request):
-    with sync_playwright() as p:
-        # 브라우저 및 컨텍스트 생성
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context()
-        page = context.new_page()
-
-        try:
-            # 두레이 홈페이지 진입
-            page.goto(f"{DOORAY_BASE_URL}/")
-            time.sleep(3)
-
-
-            # 아이디 및 패스워드 입력
-            page.get_by_placeholder("아이디").click()
-            page.get_by_placeholder("아이디").fill(DOORAY_ID)
-            page.get_by_placeholder("비밀번호").click()
-            page.get_by_placeholder("비밀번호").fill(DOORAY_PASSWORD)
-            time.sleep(1)
-            page.get_by_role("button", name="로그인").click()
-            time.sleep(3)
-
-            # 세션 상태 저장
-            os.makedirs("session", exist_ok=True)
-            session_path = os.path.join("session", "dooraystorageState.json")
-            context.storage_state(path=session_path)
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_dooray_login(request, browser):
+    # 저장된 벤더 세션이 아직 유효하면 UI 로그인 생략
+    if reuse_vendor_session(browser, "dooray"):
+        return
+
+    # 브라우저 및 컨텍스트 생성
+    context = browser.new_context()
+    apply_route_policy(context, "dooray_board")
+    page = context.new_page()
+
+    try:
+        # 두레이 홈페이지 진입
+        page.goto(f"{DOORAY_BASE_URL}/")
+        time.sleep(3)
+
+
+        # 아이디 및 패스워드 입력
+        page.get_by_placeholder("아이디").click()
+        page.get_by_placeholder("아이디").fill(DOORAY_ID)
+        page.get_by_placeholder("비밀번호").click()
+        page.get_by_placeholder("비밀번호").fill(DOORAY_PASSWORD)
+        time.sleep(1)
+        page.get_by_role("button", name="로그인").click()
+        time.sleep(3)
+
+        # 세션 상태 저장
+        save_vendor_session(context, "dooray")
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.NORMAL)
 @allure.step("Dooray board Normal Test")
 @pytest.mark.dependency(name="dooray_board_normal")
-def test_dooray_board_normal(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "dooraystorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
+def test_dooray_board_normal(request, browser, dlp_token):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "dooray", "dooray_board", f"{DOORAY_BASE_URL}/home")
 
-        try:
+    try:
 
-            # 세션 유지한 채로 게시판 페이지로 이동
-            page.goto(f"{DOORAY_BASE_URL}/home")
-            time.sleep(3)
+        # 세션 유지한 채로 게시판 페이지로 이동
+        wait_for_ready(page)
 
 
-            # 새글쓰기 클릭 시 새 창이 열리는 것을 대기
-            page.get_by_test_id("HomeLnb_ContainedButton").click()
-            time.sleep(1)
+        # 새글쓰기 클릭 시 새 창이 열리는 것을 대기
+        page.get_by_test_id("HomeLnb_ContainedButton").click()
+        time.sleep(1)
 
-            # 제목 입력
-            page.get_by_test_id("HomeBoardWritePageTitleField_BottomLinedTextField").click()
-            page.get_by_test_id("HomeBoardWritePageTitleField_BottomLinedTextField").fill("기본로깅테스트")
+        # 제목 입력
+        page.get_by_test_id("HomeBoardWritePageTitleField_BottomLinedTextField").click()
+        page.get_by_test_id("HomeBoardWritePageTitleField_BottomLinedTextField").fill(f"기본로깅테스트 {dlp_token}")
 
-            # 본문 입력
-            editor_box = page.get_by_test_id("DoorayMDEditor").get_by_role("textbox")
-            editor_box.click()
-            editor_box.fill("\n".join(DLP_NORMAL))
-            time.sleep(1)
+        # 본문 입력
+        editor_box = page.get_by_test_id("DoorayMDEditor").get_by_role("textbox")
+        editor_box.click()
+        editor_box.fill("\n".join(DLP_NORMAL))
+        time.sleep(1)
 
-            # 저장 클릭
-            page.get_by_test_id("HomeBoardArticleEditorSaveButton_ButtonComponent").click()
+        # 저장 클릭 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page, "dooray_board", page.get_by_test_id("HomeBoardArticleEditorSaveButton_ButtonComponent").click)
 
-            # 대기
-            page.wait_for_timeout(5000)
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DOORAY_BOARD,
+            test_cases=NORMAL_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
 
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_DOORAY_BOARD,
-                test_cases=NORMAL_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Dooray board Pattern Test")
 @pytest.mark.dependency(name="dooray_board_pattern")
-def test_dooray_board_pattern(request):
-    with (sync_playwright() as p):
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "dooraystorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
+def test_dooray_board_pattern(request, browser, dlp_token):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "dooray", "dooray_board", f"{DOORAY_BASE_URL}/home")
 
-            # 세션 유지한 채로 메일 페이지로 이동
-            page.goto(f"{DOORAY_BASE_URL}/home")
-            time.sleep(3)
+    try:
 
+        # 세션 유지한 채로 메일 페이지로 이동
+        wait_for_ready(page)
 
-            # 새글쓰기 클릭 시 새 창이 열리는 것을 대기
-            page.get_by_test_id("HomeLnb_ContainedButton").click()
-            time.sleep(1)
 
-            # 제목 입력
-            page.get_by_test_id("HomeBoardWritePageTitleField_BottomLinedTextField").click()
-            page.get_by_test_id("HomeBoardWritePageTitleField_BottomLinedTextField").fill("개인정보로깅테스트")
+        # 새글쓰기 클릭 시 새 창이 열리는 것을 대기
+        page.get_by_test_id("HomeLnb_ContainedButton").click()
+        time.sleep(1)
 
-            # 본문 입력
-            editor_box = page.get_by_test_id("DoorayMDEditor").get_by_role("textbox")
-            editor_box.click()
-            editor_box.fill("\n".join(DLP_PATTERNS))
-            time.sleep(2)
+        # 제목 입력
+        page.get_by_test_id("HomeBoardWritePageTitleField_BottomLinedTextField").click()
+        page.get_by_test_id("HomeBoardWritePageTitleField_BottomLinedTextField").fill(f"개인정보로깅테스트 {dlp_token}")
 
-            # 저장 클릭
-            page.get_by_test_id("HomeBoardArticleEditorSaveButton_ButtonComponent").click()
+        # 본문 입력
+        editor_box = page.get_by_test_id("DoorayMDEditor").get_by_role("textbox")
+        editor_box.click()
+        editor_box.fill("\n".join(DLP_PATTERNS))
+        time.sleep(2)
 
-            # 대기
-            page.wait_for_timeout(5000)
+        # 저장 클릭 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page, "dooray_board", page.get_by_test_id("HomeBoardArticleEditorSaveButton_ButtonComponent").click)
 
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_DOORAY_BOARD,
-                test_cases=PATTERN_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DOORAY_BOARD,
+            test_cases=PATTERN_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
 
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
-        finally:
-            browser.close()
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Dooray board Keyword Test")
 @pytest.mark.dependency(name="dooray_board_keyword")
-def test_dooray_board_keyword(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "dooraystorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
+def test_dooray_board_keyword(request, browser, dlp_token):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "dooray", "dooray_board", f"{DOORAY_BASE_URL}/home")
 
-        try:
+    try:
 
-            # 세션 유지한 채로 메일 페이지로 이동
-            page.goto(f"{DOORAY_BASE_URL}/home")
-            time.sleep(3)
+        # 세션 유지한 채로 메일 페이지로 이동
+        wait_for_ready(page)
 
 
-            # 새글쓰기 클릭 시 새 창이 열리는 것을 대기
-            page.get_by_test_id("HomeLnb_ContainedButton").click()
-            time.sleep(1)
+        # 새글쓰기 클릭 시 새 창이 열리는 것을 대기
+        page.get_by_test_id("HomeLnb_ContainedButton").click()
+        time.sleep(1)
 
-            # 제목 입력
-            page.get_by_test_id("HomeBoardWritePageTitleField_BottomLinedTextField").click()
-            page.get_by_test_id("HomeBoardWritePageTitleField_BottomLinedTextField").fill("키워드로깅테스트")
+        # 제목 입력
+        page.get_by_test_id("HomeBoardWritePageTitleField_BottomLinedTextField").click()
+        page.get_by_test_id("HomeBoardWritePageTitleField_BottomLinedTextField").fill(f"키워드로깅테스트 {dlp_token}")
 
-            # 본문 입력
-            editor_box = page.get_by_test_id("DoorayMDEditor").get_by_role("textbox")
-            editor_box.click()
-            editor_box.fill("\n".join(DLP_KEYWORDS))
-            time.sleep(2)
+        # 본문 입력
+        editor_box = page.get_by_test_id("DoorayMDEditor").get_by_role("textbox")
+        editor_box.click()
+        editor_box.fill("\n".join(DLP_KEYWORDS))
+        time.sleep(2)
 
-            # 저장 클릭
-            page.get_by_test_id("HomeBoardArticleEditorSaveButton_ButtonComponent").click()
+        # 저장 클릭 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page, "dooray_board", page.get_by_test_id("HomeBoardArticleEditorSaveButton_ButtonComponent").click)
 
-            # 대기
-            page.wait_for_timeout(5000)
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DOORAY_BOARD,
+            test_cases=KEYWORD_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
 
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_DOORAY_BOARD,
-                test_cases=KEYWORD_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.BLOCKER)
 @allure.step("Dooray board attach Test")
 @pytest.mark.dependency(name="dooray_board_attach")
-def test_dooray_board_attach(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "dooraystorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
+def test_dooray_board_attach(request, browser):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "dooray", "dooray_board", f"{DOORAY_BASE_URL}/home")
 
-        try:
+    try:
 
-            # 세션 유지한 채로 메일 페이지로 이동
-            page.goto(f"{DOORAY_BASE_URL}/home")
-            time.sleep(3)
+        # 세션 유지한 채로 메일 페이지로 이동
+        wait_for_ready(page)
 
 
-            # 메일쓰기 클릭 시 새 창이 열리는 것을 대기
-            page.get_by_test_id("HomeLnb_ContainedButton").click()
-            time.sleep(1)
+        # 메일쓰기 클릭 시 새 창이 열리는 것을 대기
+        page.get_by_test_id("HomeLnb_ContainedButton").click()
+        time.sleep(1)
 
-            # 파일 첨부
-            with page.expect_file_chooser() as fc_info:
-                page.get_by_test_id("HomeBoardArticleEditorAttachButton_GhostButton").click()
-            time.sleep(1)
-            file_chooser = fc_info.value
-            # 한 개 파일 첨부
+        # 파일 첨부
+        with page.expect_file_chooser() as fc_info:
+            page.get_by_test_id("HomeBoardArticleEditorAttachButton_GhostButton").click()
+        time.sleep(1)
+        file_chooser = fc_info.value
+        # 한 개 파일 첨부
+        # 첨부 요청이 실제로 파일 크기만큼 나가는지 확인 (안 나가면 ES 대기 없이 바로 실패)
+        with expect_file_transmitted(page, DLP_FILE):
             file_chooser.set_files(DLP_FILE)
 
-            # # 여러 파일 첨부(2개)
-            # file_chooser.set_files(DLP_FILES)
+        # # 여러 파일 첨부(2개)
+        # file_chooser.set_files(DLP_FILES)
 
-            # 저장 클릭
-            try:
-                page.get_by_test_id("HomeBoardArticleEditorSaveButton_ButtonComponent").click(timeout=2000)
-                print("✔ [DEBUG] 완료 클릭")
-            except:
-                print("▶ [DEBUG] 완료 없음 → 스킵")
+        # 저장 클릭
+        try:
+            page.get_by_test_id("HomeBoardArticleEditorSaveButton_ButtonComponent").click(timeout=2000)
+            print("✔ [DEBUG] 완료 클릭")
+        except:
+            print("▶ [DEBUG] 완료 없음 → 스킵")
 
 
-            # 대기
-            page.wait_for_timeout(10000)
+        # 대기
+        page.wait_for_timeout(10000)
 
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_DOORAY_BOARD,
-                test_cases=FILE_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DOORAY_BOARD,
+            test_cases=FILE_LOGGING_CASE,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
 
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
 
-        finally:
-            browser.close()
+    finally:
+        context.close()
 
 
@@ -2,7 +2,7 @@ import os
 import time
 import allure
 import pytest
-from playwright.sync_api import sync_playwright,BrowserContext,TimeoutError
+from playwright.sync_api import BrowserContext,TimeoutError
 from base import *
 
 NORMAL_LOGGING_CASE = [
@@ -41,203 +41,195 @@ KEYWORD_LOGGING_CASE = [
 @allure.step("Naverworks Login Test")
 #@pytest.mark.order("first")
 @pytest.mark.dependency(name="naverworks_login")
-def test_naverworks_login(request):
-    with sync_playwright() as p:
-        # 브라우저 및 컨텍스트 생성
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
-        page = context.new_page()
-
-        try:
-            # 네이버웍스 홈페이지 진입
-            goto_and_wait(page, f"{NAVERWORKS_BASE_URL}")
-
-            # 아이디 및 패스워드 입력
-            with page.expect_popup() as page1_info:
-                page.get_by_role("link", name="로그인", exact=True).click()
-            page1 = page1_info.value
-            time.sleep(1)
-            page1.get_by_placeholder("또는 id@group.xxx").click()
-            page1.get_by_placeholder("또는 id@group.xxx").fill(NAVERWORKS_ID)
-            page1.get_by_role("button", name="로그인", exact=True).click()
-            time.sleep(1)
-            page1.get_by_placeholder("비밀번호").click()
-            page1.get_by_placeholder("비밀번호").fill(NAVERWORKS_PASSWORD)
-            time.sleep(1)
-            page1.get_by_role("button", name="로그인").click()
-            time.sleep(3)
-
-            # 세션 상태 저장
-            os.makedirs("session", exist_ok=True)
-            session_path = os.path.join("session", "naverworksstorageState.json")
-            context.storage_state(path=session_path)
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_naverworks_login(request, browser):
+    # 저장된 벤더 세션이 아직 유효하면 UI 로그인 생략
+    if reuse_vendor_session(browser, "naverworks"):
+        return
+
+    # 브라우저 및 컨텍스트 생성
+    context = browser.new_context()
+    apply_route_policy(context, "naverworks_calendar")
+    page = context.new_page()
+
+    try:
+        # 네이버웍스 홈페이지 진입
+        goto_and_wait(page, f"{NAVERWORKS_BASE_URL}")
+
+        # 아이디 및 패스워드 입력
+        with page.expect_popup() as page1_info:
+            page.get_by_role("link", name="로그인", exact=True).click()
+        page1 = page1_info.value
+        time.sleep(1)
+        page1.get_by_placeholder("또는 id@group.xxx").click()
+        page1.get_by_placeholder("또는 id@group.xxx").fill(NAVERWORKS_ID)
+        page1.get_by_role("button", name="로그인", exact=True).click()
+        time.sleep(1)
+        page1.get_by_placeholder("비밀번호").click()
+        page1.get_by_placeholder("비밀번호").fill(NAVERWORKS_PASSWORD)
+        time.sleep(1)
+        page1.get_by_role("button", name="로그인").click()
+        time.sleep(3)
+
+        # 세션 상태 저장
+        save_vendor_session(context, "naverworks")
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.NORMAL)
 @allure.step("Naverworks Calendar Normal Test")
 @pytest.mark.dependency(name="naverworks_calendar_normal")
-def test_naverworks_calendar_normal(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "naverworksstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 게시판 페이지로 이동
-            page.goto(f"{NAVERWORKS_CALENDAR_URL}/")
-            time.sleep(3)
-
-            # 일정쓰기
-            page.get_by_role("link", name="일정쓰기").click()
-            time.sleep(2)
-
-            # 제목 입력
-            page.get_by_role("textbox", name="제목을 입력하세요").fill("기본로깅테스트")
-
-            # 본문 입력
-            editor_box = page.get_by_role("textbox", name="메모를 작성하세요")
-            editor_box.click()
-            editor_box.fill("\n".join(DLP_NORMAL))
-            time.sleep(1)
-
-            # 저장 클릭
-            page.get_by_role("button", name="저장").first.click()
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_NAVERWORKS_CALENDAR,
-                test_cases=NORMAL_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_naverworks_calendar_normal(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("naverworks")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "naverworks_calendar")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 게시판 페이지로 이동
+        page.goto(f"{NAVERWORKS_CALENDAR_URL}/")
+        time.sleep(3)
+
+        # 일정쓰기
+        page.get_by_role("link", name="일정쓰기").click()
+        time.sleep(2)
+
+        # 제목 입력
+        page.get_by_role("textbox", name="제목을 입력하세요").fill(f"기본로깅테스트 {dlp_token}")
+
+        # 본문 입력
+        editor_box = page.get_by_role("textbox", name="메모를 작성하세요")
+        editor_box.click()
+        editor_box.fill("\n".join(DLP_NORMAL))
+        time.sleep(1)
+
+        # 저장 클릭 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page, "naverworks_calendar", page.get_by_role("button", name="저장").first.click)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_NAVERWORKS_CALENDAR,
+            test_cases=NORMAL_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Naverworks Calendar Pattern Test")
 @pytest.mark.dependency(name="naverworks_calendar_pattern")
-def test_naverworks_calendar_pattern(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "naverworksstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 게시판 페이지로 이동
-            page.goto(f"{NAVERWORKS_CALENDAR_URL}/")
-            time.sleep(3)
-
-            # 일정쓰기
-            page.get_by_role("link", name="일정쓰기").click()
-            time.sleep(2)
-
-            # 제목 입력
-            page.get_by_role("textbox", name="제목을 입력하세요").fill("개인정보로깅테스트")
-
-            # 본문 입력
-            editor_box = page.get_by_role("textbox", name="메모를 작성하세요")
-            editor_box.click()
-            editor_box.fill("\n".join(DLP_PATTERNS))
-            time.sleep(1)
-
-            # 저장 클릭
-            page.get_by_role("button", name="저장").first.click()
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_NAVERWORKS_CALENDAR,
-                test_cases=PATTERN_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_naverworks_calendar_pattern(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("naverworks")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "naverworks_calendar")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 게시판 페이지로 이동
+        page.goto(f"{NAVERWORKS_CALENDAR_URL}/")
+        time.sleep(3)
+
+        # 일정쓰기
+        page.get_by_role("link", name="일정쓰기").click()
+        time.sleep(2)
+
+        # 제목 입력
+        page.get_by_role("textbox", name="제목을 입력하세요").fill(f"개인정보로깅테스트 {dlp_token}")
+
+        # 본문 입력
+        editor_box = page.get_by_role("textbox", name="메모를 작성하세요")
+        editor_box.click()
+        editor_box.fill("\n".join(DLP_PATTERNS))
+        time.sleep(1)
+
+        # 저장 클릭 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page, "naverworks_calendar", page.get_by_role("button", name="저장").first.click)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_NAVERWORKS_CALENDAR,
+            test_cases=PATTERN_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Naverworks Calendar Keyword Test")
 @pytest.mark.dependency(name="naverworks_calendar_keyword")
-def test_naverworks_calendar_keyword(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "naverworksstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 게시판 페이지로 이동
-            page.goto(f"{NAVERWORKS_CALENDAR_URL}/")
-            time.sleep(3)
-
-            # 일정쓰기
-            page.get_by_role("link", name="일정쓰기").click()
-            time.sleep(2)
-
-            # 제목 입력
-            page.get_by_role("textbox", name="제목을 입력하세요").fill("키워드로깅테스트")
-
-            # 본문 입력
-            editor_box = page.get_by_role("textbox", name="메모를 작성하세요")
-            editor_box.click()
-            editor_box.fill("\n".join(DLP_KEYWORDS))
-            time.sleep(1)
-
-            # 저장 클릭
-            page.get_by_role("button", name="저장").first.click()
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_NAVERWORKS_CALENDAR,
-                test_cases=KEYWORD_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_naverworks_calendar_keyword(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("naverworks")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "naverworks_calendar")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 게시판 페이지로 이동
+        page.goto(f"{NAVERWORKS_CALENDAR_URL}/")
+        time.sleep(3)
+
+        # 일정쓰기
+        page.get_by_role("link", name="일정쓰기").click()
+        time.sleep(2)
+
+        # 제목 입력
+        page.get_by_role("textbox", name="제목을 입력하세요").fill(f"키워드로깅테스트 {dlp_token}")
+
+        # 본문 입력
+        editor_box = page.get_by_role("textbox", name="메모를 작성하세요")
+        editor_box.click()
+        editor_box.fill("\n".join(DLP_KEYWORDS))
+        time.sleep(1)
+
+        # 저장 클릭 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page, "naverworks_calendar", page.get_by_role("button", name="저장").first.click)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_NAVERWORKS_CALENDAR,
+            test_cases=KEYWORD_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 # @allure.severity(allure.severity_level.BLOCKER)
 # @allure.step("Naverworks Calendar Attach Test")
@@ -2,7 +2,7 @@ import os
 import time
 import allure
 import pytest
-from playwright.sync_api import sync_playwright,TimeoutError
+from playwright.sync_api import TimeoutError
 from base import *
 
 
@@ -40,270 +40,266 @@ FILE_LOGGING_CASE = [
 
 @allure.severity(allure.severity_level.TRIVIAL)
 @allure.step("Dooray Login Test")
-def test_dooray_login(request):
-    with sync_playwright() as p:
-        # 브라우저 및 컨텍스트 생성
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
-        page = context.new_page()
-
-        try:
-            # 두레이 홈페이지 진입
-            page.goto(f"{DOORAY_BASE_URL}/")
-            time.sleep(3)
-
-
-            # 아이디 및 패스워드 입력
-            page.get_by_placeholder("아이디").click()
-            page.get_by_placeholder("아이디").fill(DOORAY_ID)
-            page.get_by_placeholder("비밀번호").click()
-            page.get_by_placeholder("비밀번호").fill(DOORAY_PASSWORD)
-            time.sleep(1)
-            page.get_by_role("button", name="로그인").click()
-            time.sleep(3)
-
-            # 세션 상태 저장
-            os.makedirs("session", exist_ok=True)
-            session_path = os.path.join("session", "dooraystorageState.json")
-            context.storage_state(path=session_path)
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_dooray_login(request, browser):
+    # 저장된 벤더 세션이 아직 유효하면 UI 로그인 생략
+    if reuse_vendor_session(browser, "dooray"):
+        return
+
+    # 브라우저 및 컨텍스트 생성
+    context = browser.new_context()
+    apply_route_policy(context, "dooray_board_comment")
+    page = context.new_page()
+
+    try:
+        # 두레이 홈페이지 진입
+        page.goto(f"{DOORAY_BASE_URL}/")
+        time.sleep(3)
+
+
+        # 아이디 및 패스워드 입력
+        page.get_by_placeholder("아이디").click()
+        page.get_by_placeholder("아이디").fill(DOORAY_ID)
+        page.get_by_placeholder("비밀번호").click()
+        page.get_by_placeholder("비밀번호").fill(DOORAY_PASSWORD)
+        time.sleep(1)
+        page.get_by_role("button", name="로그인").click()
+        time.sleep(3)
+
+        # 세션 상태 저장
+        save_vendor_session(context, "dooray")
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.NORMAL)
 @allure.step("Dooray Board Comment Normal Test")
-def test_dooray_board_comment_normal(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "dooraystorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 게시판 페이지로 이동
-            page.goto(f"{DOORAY_BASE_URL}/home")
-            time.sleep(3)
-
-
-            # 자유게시판으로 이동
-            page.get_by_role("link", name="자유게시판").click()
-
-            # 가장 위에 게시글 클릭
-            page.locator("div[role='gridcell']").nth(2).click()
-
-
-            # 댓글창 클릭
-            comment_box = page.locator("div.dooray-flavored-html-editor-content-editable[contenteditable='true']")
-            comment_box.click()
-            # 혹시 기존 내용이 있으면 지우고
-            comment_box.press("Control+A")
-            comment_box.press("Delete")
-            # 댓글 입력
-            comment_box.fill("\n".join(DLP_NORMAL))
-            time.sleep(1)
-
-            # 저장 클릭
-            page.get_by_role("button", name="저장").click()
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_DOORAY_BOARD_COMMENT,
-                test_cases=NORMAL_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_dooray_board_comment_normal(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("dooray")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "dooray_board_comment")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 게시판 페이지로 이동
+        page.goto(f"{DOORAY_BASE_URL}/home")
+        time.sleep(3)
+
+
+        # 자유게시판으로 이동
+        page.get_by_role("link", name="자유게시판").click()
+
+        # 가장 위에 게시글 클릭
+        page.locator("div[role='gridcell']").nth(2).click()
+
+
+        # 댓글창 클릭
+        comment_box = page.locator("div.dooray-flavored-html-editor-content-editable[contenteditable='true']")
+        comment_box.click()
+        # 혹시 기존 내용이 있으면 지우고
+        comment_box.press("Control+A")
+        comment_box.press("Delete")
+        # 댓글 입력
+        comment_box.fill("\n".join(DLP_NORMAL + [dlp_token]))
+        time.sleep(1)
+
+        # 저장 클릭 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page, "dooray_board_comment", page.get_by_role("button", name="저장").click)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DOORAY_BOARD_COMMENT,
+            test_cases=NORMAL_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Dooray Board Comment Pattern Test")
-def test_dooray_board_comment_pattern(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "dooraystorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
+def test_dooray_board_comment_pattern(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("dooray")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "dooray_board_comment")
+    page = context.new_page()
 
-        try:
+    try:
 
-            # 세션 유지한 채로 메일 페이지로 이동
-            page.goto(f"{DOORAY_BASE_URL}/home")
-            time.sleep(3)
+        # 세션 유지한 채로 메일 페이지로 이동
+        page.goto(f"{DOORAY_BASE_URL}/home")
+        time.sleep(3)
 
 
-            # 자유게시판으로 이동
-            page.get_by_role("link", name="자유게시판").click()
+        # 자유게시판으로 이동
+        page.get_by_role("link", name="자유게시판").click()
 
-            # 가장 위에 게시글 클릭
-            page.locator("div[role='gridcell']").nth(2).click()
+        # 가장 위에 게시글 클릭
+        page.locator("div[role='gridcell']").nth(2).click()
 
-            # 댓글창 클릭
-            comment_box = page.locator("div.dooray-flavored-html-editor-content-editable[contenteditable='true']")
-            comment_box.click()
-            # 혹시 기존 내용이 있으면 지우고
-            comment_box.press("Control+A")
-            comment_box.press("Delete")
-            # 댓글 입력
-            comment_box.fill("\n".join(DLP_PATTERNS))
+        # 댓글창 클릭
+        comment_box = page.locator("div.dooray-flavored-html-editor-content-editable[contenteditable='true']")
+        comment_box.click()
+        # 혹시 기존 내용이 있으면 지우고
+        comment_box.press("Control+A")
+        comment_box.press("Delete")
+        # 댓글 입력
+        comment_box.fill("\n".join(DLP_PATTERNS + [dlp_token]))
 
-            # 저장 클릭
-            page.get_by_role("button", name="저장").click()
+        # 저장 클릭 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page, "dooray_board_comment", page.get_by_role("button", name="저장").click)
 
-            # 대기
-            page.wait_for_timeout(5000)
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DOORAY_BOARD_COMMENT,
+            test_cases=PATTERN_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
 
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_DOORAY_BOARD_COMMENT,
-                test_cases=PATTERN_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
 
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Dooray Noard Comment Keyword Test")
-def test_dooray_board_comment_keyword(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "dooraystorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 메일 페이지로 이동
-            page.goto(f"{DOORAY_BASE_URL}/home")
-            time.sleep(3)
-
-
-            # 자유게시판으로 이동
-            page.get_by_role("link", name="자유게시판").click()
-
-            # 가장 위에 게시글 클릭
-            page.locator("div[role='gridcell']").nth(2).click()
-
-            # 댓글창 클릭
-            comment_box = page.locator("div.dooray-flavored-html-editor-content-editable[contenteditable='true']")
-            comment_box.click()
-            # 혹시 기존 내용이 있으면 지우고
-            comment_box.press("Control+A")
-            comment_box.press("Delete")
-            # 댓글 입력
-            comment_box.fill("\n".join(DLP_KEYWORDS))
-
-            # 저장 클릭
-            page.get_by_role("button", name="저장").click()
-
-            # 3초 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_DOORAY_BOARD_COMMENT,
-                test_cases=KEYWORD_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_dooray_board_comment_keyword(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("dooray")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "dooray_board_comment")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 메일 페이지로 이동
+        page.goto(f"{DOORAY_BASE_URL}/home")
+        time.sleep(3)
+
+
+        # 자유게시판으로 이동
+        page.get_by_role("link", name="자유게시판").click()
+
+        # 가장 위에 게시글 클릭
+        page.locator("div[role='gridcell']").nth(2).click()
+
+        # 댓글창 클릭
+        comment_box = page.locator("div.dooray-flavored-html-editor-content-editable[contenteditable='true']")
+        comment_box.click()
+        # 혹시 기존 내용이 있으면 지우고
+        comment_box.press("Control+A")
+        comment_box.press("Delete")
+        # 댓글 입력
+        comment_box.fill("\n".join(DLP_KEYWORDS + [dlp_token]))
+
+        # 저장 클릭
+        page.get_by_role("button", name="저장").click()
+
+        # 3초 대기
+        page.wait_for_timeout(5000)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DOORAY_BOARD_COMMENT,
+            test_cases=KEYWORD_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.BLOCKER)
 @allure.step("Dooray Board Comment Attach Test")
-def test_dooray_board_comment_attach(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "dooraystorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
+def test_dooray_board_comment_attach(request, browser):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("dooray")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "dooray_board_comment")
+    page = context.new_page()
 
-        try:
+    try:
 
-            # 세션 유지한 채로 메일 페이지로 이동
-            page.goto(f"{DOORAY_BASE_URL}/home")
-            time.sleep(3)
+        # 세션 유지한 채로 메일 페이지로 이동
+        page.goto(f"{DOORAY_BASE_URL}/home")
+        time.sleep(3)
 
 
-            # 자유게시판으로 이동
-            page.get_by_role("link", name="자유게시판").click()
+        # 자유게시판으로 이동
+        page.get_by_role("link", name="자유게시판").click()
 
-            # 가장 위에 게시글 클릭
-            page.locator("div[role='gridcell']").nth(2).click()
+        # 가장 위에 게시글 클릭
+        page.locator("div[role='gridcell']").nth(2).click()
 
-            # 스크롤하여 첨부 버튼을 보이게 하기
-            page.get_by_role("button", name="첨부").scroll_into_view_if_needed()
+        # 스크롤하여 첨부 버튼을 보이게 하기
+        page.get_by_role("button", name="첨부").scroll_into_view_if_needed()
 
-            # 파일 첨부
-            with page.expect_file_chooser() as fc_info:
-                page.get_by_role("button", name="첨부").click()
-            time.sleep(1)
-            file_chooser = fc_info.value
-            # 한 개 파일 첨부
+        # 파일 첨부
+        with page.expect_file_chooser() as fc_info:
+            page.get_by_role("button", name="첨부").click()
+        time.sleep(1)
+        file_chooser = fc_info.value
+        # 한 개 파일 첨부
+        # 첨부 요청이 실제로 파일 크기만큼 나가는지 확인 (안 나가면 ES 대기 없이 바로 실패)
+        with expect_file_transmitted(page, DLP_FILE):
             file_chooser.set_files(DLP_FILE)
 
-            # # 여러 파일(2개) 첨부
-            # file_chooser.set_files(DLP_FILES)
-
-            # 저장 클릭
-            try:
-                page.get_by_role("button", name="저장").click(timeout=2000)
-                print("✔ [DEBUG] 완료 클릭")
-            except:
-                print("▶ [DEBUG] 완료 없음 → 스킵")
+        # # 여러 파일(2개) 첨부
+        # file_chooser.set_files(DLP_FILES)
 
-            # 대기
-            page.wait_for_timeout(10000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_DOORAY_BOARD,
-                test_cases=FILE_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-
-        finally:
-            browser.close()
\ No newline at end of file
+        # 저장 클릭
+        try:
+            page.get_by_role("button", name="저장").click(timeout=2000)
+            print("✔ [DEBUG] 완료 클릭")
+        except:
+            print("▶ [DEBUG] 완료 없음 → 스킵")
+
+        # 대기
+        page.wait_for_timeout(10000)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DOORAY_BOARD,
+            test_cases=FILE_LOGGING_CASE,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+
+    finally:
+        context.close()
\ No newline at end of file
@@ -2,7 +2,7 @@ import os
 import time
 import allure
 import pytest
-from playwright.sync_api import sync_playwright,BrowserContext,TimeoutError
+from playwright.sync_api import BrowserContext,TimeoutError
 from base import *
 
 NORMAL_LOGGING_CASE = [
@@ -42,327 +42,307 @@ FILE_LOGGING_CASE = [
 #@pytest.mark.order("first")
 @pytest.mark.dependency(name="daum_login")
 @pytest.mark.xfail(reason="다음 로그인은 간헐적으로 실패함 (무시 가능)")
-def test_daum_login(request):
-    with sync_playwright() as p:
-        # 브라우저 및 컨텍스트 생성
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
-        page = context.new_page()
-
-        try:
-            # 홈페이지 진입
-            goto_and_wait(page, f"{DAUM_BASE_URL}/")
-
-            # 아이디 및 패스워드 입력
-            page.get_by_role("link", name="카카오계정으로 로그인").click()
-            time.sleep(1)
-            page.get_by_role("button", name="카카오로 로그인").click()
-            time.sleep(1)
-            page.get_by_role("textbox", name="계정정보 입력").click()
-            page.get_by_role("textbox", name="계정정보 입력").fill(DAUM_ID)
-            page.get_by_role("textbox", name="비밀번호 입력").click()
-            page.get_by_role("textbox", name="비밀번호 입력").fill(DAUM_PASSWORD)
-            time.sleep(1)
-            page.get_by_role("button", name="로그인", exact=True).click()
-            time.sleep(3)
-
-            # 세션 상태 저장
-            os.makedirs("session", exist_ok=True)
-            session_path = os.path.join("session", "daumstorageState.json")
-            context.storage_state(path=session_path)
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_daum_login(request, browser):
+    # 저장된 벤더 세션이 아직 유효하면 UI 로그인 생략
+    if reuse_vendor_session(browser, "daum"):
+        return
+
+    # 브라우저 및 컨텍스트 생성
+    context = browser.new_context()
+    apply_route_policy(context, "daum_mail")
+    page = context.new_page()
+
+    try:
+        # 홈페이지 진입
+        goto_and_wait(page, f"{DAUM_BASE_URL}/")
+
+        # 아이디 및 패스워드 입력
+        page.get_by_role("link", name="카카오계정으로 로그인").click()
+        time.sleep(1)
+        page.get_by_role("button", name="카카오로 로그인").click()
+        time.sleep(1)
+        page.get_by_role("textbox", name="계정정보 입력").click()
+        page.get_by_role("textbox", name="계정정보 입력").fill(DAUM_ID)
+        page.get_by_role("textbox", name="비밀번호 입력").click()
+        page.get_by_role("textbox", name="비밀번호 입력").fill(DAUM_PASSWORD)
+        time.sleep(1)
+        page.get_by_role("button", name="로그인", exact=True).click()
+        time.sleep(3)
+
+        # 세션 상태 저장
+        save_vendor_session(context, "daum")
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.NORMAL)
 @allure.step("Daum Mail Normal Test")
 @pytest.mark.dependency(name="daum_mail_normal")
-def test_daum_mail_normal(request):
-    with (sync_playwright() as p):
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "daumstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 메일 페이지로 이동
-            goto_and_wait(page, f"{DAUM_MAIL_URL}/")
-
-            # 팝업이 있으면 확인 클릭, 없으면 스킵
-            click_confirm_if_popup_exists(page)
-
-            try:
-                page.get_by_role("button", name="카카오로 로그인").click()
-                time.sleep(1)
-                page.get_by_role("textbox", name="계정정보 입력").click()
-                page.get_by_role("textbox", name="계정정보 입력").fill(DAUM_ID)
-                page.get_by_role("textbox", name="비밀번호 입력").click()
-                page.get_by_role("textbox", name="비밀번호 입력").fill(DAUM_PASSWORD)
-                time.sleep(1)
-                page.get_by_role("button", name="로그인", exact=True).click()
-                time.sleep(3)
-                print("정상적으로 로그인 하였습니다")
-            except:
-                print("로그인 필요 없음 → 스킵")
-
-            # 팝업이 있으면 확인 클릭, 없으면 스킵
-            click_confirm_if_popup_exists(page)
-
-            # 메일쓰기 클릭 시 새 창이 열리는 것을 대기
-            click_and_wait_navigation(page, role="button", name="내게쓰기")
-
-            # 제목 입력
-            page.get_by_role("textbox", name="제목").click()
-            page.get_by_role("textbox", name="제목").fill("기본로깅테스트")
-
-            # 본문 입력
-            editor_box = page.locator("iframe[name=\"tx_canvas_wysiwyg\"]").content_frame.locator("body")
-            editor_box.fill("\n".join(DLP_NORMAL))
-
-
-            # 보내기 클릭
-            page.get_by_role("button", name="보내기").click()
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_DAUM_MAIL,
-                test_cases=NORMAL_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_daum_mail_normal(request, service_page, dlp_token):
+    # 모듈 동안 유지되는 로그인 페이지를 받아서 새 작성 화면만 다시 연다
+    session = service_page("daum_mail")
+
+    try:
+        # 내게쓰기 (첫 케이스만 메일함 진입/팝업/로그인 처리)
+        page = session.compose()
+
+        # 제목 입력
+        page.get_by_role("textbox", name="제목").click()
+        page.get_by_role("textbox", name="제목").fill(f"기본로깅테스트 {dlp_token}")
+
+        # 본문 입력
+        editor_box = page.locator("iframe[name=\"tx_canvas_wysiwyg\"]").content_frame.locator("body")
+        editor_box.fill("\n".join(DLP_NORMAL))
+
+
+        # 보내기 클릭 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page, "daum_mail", page.get_by_role("button", name="보내기").click)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DAUM_MAIL,
+            test_cases=NORMAL_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(session.page, request, timeout=5000)
+        # 상태를 알 수 없는 페이지는 다음 케이스에 넘기지 않는다
+        session.invalidate()
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Daum Mail Pattern Test")
 @pytest.mark.dependency(name="daum_mail_pattern")
-def test_daum_mail_pattern(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "daumstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 메일 페이지로 이동
-            goto_and_wait(page, f"{DAUM_MAIL_URL}/")
-
-            # 팝업이 있으면 확인 클릭, 없으면 스킵
-            click_confirm_if_popup_exists(page)
-
-            try:
-                page.get_by_role("button", name="카카오로 로그인").click()
-                time.sleep(1)
-                page.get_by_role("textbox", name="계정정보 입력").click()
-                page.get_by_role("textbox", name="계정정보 입력").fill(DAUM_ID)
-                page.get_by_role("textbox", name="비밀번호 입력").click()
-                page.get_by_role("textbox", name="비밀번호 입력").fill(DAUM_PASSWORD)
-                time.sleep(1)
-                page.get_by_role("button", name="로그인", exact=True).click()
-                time.sleep(3)
-                print("정상적으로 로그인 하였습니다")
-            except:
-                print("로그인 필요 없음 → 스킵")
-
-            # 팝업이 있으면 확인 클릭, 없으면 스킵
-            click_confirm_if_popup_exists(page)
-
-            # 메일쓰기 클릭 시 새 창이 열리는 것을 대기
-            click_and_wait_navigation(page, role="button", name="내게쓰기")
-
-            # 제목 입력
-            page.get_by_role("textbox", name="제목").click()
-            page.get_by_role("textbox", name="제목").fill("개인정보로깅테스트")
-
-            # 본문 입력
-            editor_box = page.locator("iframe[name=\"tx_canvas_wysiwyg\"]").content_frame.locator("body")
-            editor_box.fill("\n".join(DLP_PATTERNS))
-
-            # 보내기 클릭
-            page.get_by_role("button", name="보내기").click()
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_DAUM_MAIL,
-                test_cases=PATTERN_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_daum_mail_pattern(request, service_page, dlp_token):
+    # 모듈 동안 유지되는 로그인 페이지를 받아서 새 작성 화면만 다시 연다
+    session = service_page("daum_mail")
+
+    try:
+        # 내게쓰기 (첫 케이스만 메일함 진입/팝업/로그인 처리)
+        page = session.compose()
+
+        # 제목 입력
+        page.get_by_role("textbox", name="제목").click()
+        page.get_by_role("textbox", name="제목").fill(f"개인정보로깅테스트 {dlp_token}")
+
+        # 본문 입력
+        editor_box = page.locator("iframe[name=\"tx_canvas_wysiwyg\"]").content_frame.locator("body")
+        editor_box.fill("\n".join(DLP_PATTERNS))
+
+        # 보내기 클릭 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page, "daum_mail", page.get_by_role("button", name="보내기").click)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DAUM_MAIL,
+            test_cases=PATTERN_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(session.page, request, timeout=5000)
+        # 상태를 알 수 없는 페이지는 다음 케이스에 넘기지 않는다
+        session.invalidate()
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Daum Mail Keyword Test")
 @pytest.mark.dependency(name="daum_mail_keyword")
-def test_daum_mail_keyword(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "daumstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
+def test_daum_mail_keyword(request, service_page, dlp_token):
+    # 모듈 동안 유지되는 로그인 페이지를 받아서 새 작성 화면만 다시 연다
+    session = service_page("daum_mail")
+
+    try:
+        # 내게쓰기 (첫 케이스만 메일함 진입/팝업/로그인 처리)
+        page = session.compose()
+
+        # 제목 입력
+        page.get_by_role("textbox", name="제목").click()
+        page.get_by_role("textbox", name="제목").fill(f"키워드로깅테스트 {dlp_token}")
+
+        # 본문 입력
+        editor_box = page.locator("iframe[name=\"tx_canvas_wysiwyg\"]").content_frame.locator("body")
+        editor_box.fill("\n".join(DLP_KEYWORDS))
+
+        # 보내기 클릭 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page, "daum_mail", page.get_by_role("button", name="보내기").click)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DAUM_MAIL,
+            test_cases=KEYWORD_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(session.page, request, timeout=5000)
+        # 상태를 알 수 없는 페이지는 다음 케이스에 넘기지 않는다
+        session.invalidate()
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
-            # 세션 유지한 채로 메일 페이지로 이동
-            goto_and_wait(page, f"{DAUM_MAIL_URL}/")
-
-            # 팝업이 있으면 확인 클릭, 없으면 스킵
-            click_confirm_if_popup_exists(page)
+@allure.severity(allure.severity_level.BLOCKER)
+@allure.step("Daum Mail Attach Test")
+@pytest.mark.dependency(name="daum_mail_attach")
+def test_daum_mail_attach(request, service_page, dlp_token):
+    # 모듈 동안 유지되는 로그인 페이지를 받아서 새 작성 화면만 다시 연다
+    session = service_page("daum_mail")
 
-            try:
-                page.get_by_role("button", name="카카오로 로그인").click()
-                time.sleep(1)
-                page.get_by_role("textbox", name="계정정보 입력").click()
-                page.get_by_role("textbox", name="계정정보 입력").fill(DAUM_ID)
-                page.get_by_role("textbox", name="비밀번호 입력").click()
-                page.get_by_role("textbox", name="비밀번호 입력").fill(DAUM_PASSWORD)
-                time.sleep(1)
-                page.get_by_role("button", name="로그인", exact=True).click()
-                time.sleep(3)
-                print("정상적으로 로그인 하였습니다")
-            except:
-                print("로그인 필요 없음 → 스킵")
+    try:
+        # 내게쓰기 (첫 케이스만 메일함 진입/팝업/로그인 처리)
+        page = session.compose()
 
-            # 팝업이 있으면 확인 클릭, 없으면 스킵
-            click_confirm_if_popup_exists(page)
+        # 제목 입력
+        page.get_by_role("textbox", name="제목").click()
+        page.get_by_role("textbox", name="제목").fill(f"첨부파일로깅테스트 {dlp_token}")
 
-            # 메일쓰기 클릭 시 새 창이 열리는 것을 대기
-            click_and_wait_navigation(page, role="button", name="내게쓰기")
+        # 3. 파일 첨부 클릭
+        # 첨부 요청이 실제로 파일 크기만큼 나가는지 확인 (안 나가면 ES 대기 없이 바로 실패)
+        with expect_file_transmitted(page, DLP_FILE):
+            page.get_by_label("파일 첨부하기").set_input_files(DLP_FILE)
+        page.wait_for_timeout(2000)
+        print("파일을 첨부하였습니다.")
 
-            # 제목 입력
-            page.get_by_role("textbox", name="제목").click()
-            page.get_by_role("textbox", name="제목").fill("키워드로깅테스트")
+        # 첨부 후 작성 화면이 기준선과 달라졌는지 (UI 개편 조기 감지, 실패시키지 않음)
+        check_ui_drift(page, "daum_mail_attach")
 
-            # 본문 입력
-            editor_box = page.locator("iframe[name=\"tx_canvas_wysiwyg\"]").content_frame.locator("body")
-            editor_box.fill("\n".join(DLP_KEYWORDS))
 
-            # 보내기 클릭
-            page.get_by_role("button", name="보내기").click()
+        # 보내기 클릭
+        try:
+            page.get_by_role("button", name="보내기").click(timeout=2000)
+            print("✔ [DEBUG] '보내기' 버튼을 클릭했습니다.")
+        except Exception:
+            print("▶ [DEBUG] '보내기' 버튼이 없어 스킵합니다.")
 
             # 대기
-            page.wait_for_timeout(5000)
+            page.wait_for_timeout(10000)
 
             # ===== 여기서 ES 검증 반복 호출 =====
             assert_es_logs_with_retry(
                 service_name=SERVICE_NAMES_DAUM_MAIL,
-                test_cases=KEYWORD_LOGGING_CASE,
+                test_cases=FILE_LOGGING_CASE,
+                token=dlp_token,
                 size=1,
                 max_attempts=3,  # 총 3번 시도
                 interval_sec=5  # 시도 간 5초 대기
             )
 
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
+    except Exception as e:
+        capture_failure_screenshot(session.page, request, timeout=5000)
+        # 상태를 알 수 없는 페이지는 다음 케이스에 넘기지 않는다
+        session.invalidate()
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
-        finally:
-            browser.close()
 
-@allure.severity(allure.severity_level.BLOCKER)
-@allure.step("Daum Mail Attach Test")
-@pytest.mark.dependency(name="daum_mail_attach")
-def test_daum_mail_attach(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "daumstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 메일 페이지로 이동
-            goto_and_wait(page, f"{DAUM_MAIL_URL}/")
-
-            # 팝업이 있으면 확인 클릭, 없으면 스킵
-            click_confirm_if_popup_exists(page)
-
-            try:
-                page.get_by_role("button", name="카카오로 로그인").click()
-                time.sleep(1)
-                page.get_by_role("textbox", name="계정정보 입력").click()
-                page.get_by_role("textbox", name="계정정보 입력").fill(DAUM_ID)
-                page.get_by_role("textbox", name="비밀번호 입력").click()
-                page.get_by_role("textbox", name="비밀번호 입력").fill(DAUM_PASSWORD)
-                time.sleep(1)
-                page.get_by_role("button", name="로그인", exact=True).click()
-                time.sleep(3)
-                print("정상적으로 로그인 하였습니다")
-            except:
-                print("로그인 필요 없음 → 스킵")
-
-            # 팝업이 있으면 확인 클릭, 없으면 스킵
-            click_confirm_if_popup_exists(page)
-
-            # 메일쓰기 클릭 시 새 창이 열리는 것을 대기
-            click_and_wait_navigation(page, role="button", name="내게쓰기")
-
-            # 제목 입력
-            page.get_by_role("textbox", name="제목").click()
-            page.get_by_role("textbox", name="제목").fill("첨부파일로깅테스트")
-
-            # 3. 파일 첨부 클릭
-            page.get_by_label("파일 첨부하기").set_input_files(DLP_FILE)
-            page.wait_for_timeout(2000)
-            print("파일을 첨부하였습니다.")
-
-
-            # 보내기 클릭
-            try:
-                page.get_by_role("button", name="보내기").click(timeout=2000)
-                print("✔ [DEBUG] '보내기' 버튼을 클릭했습니다.")
-            except Exception:
-                print("▶ [DEBUG] '보내기' 버튼이 없어 스킵합니다.")
-
-                # 대기
-                page.wait_for_timeout(10000)
-
-                # ===== 여기서 ES 검증 반복 호출 =====
-                assert_es_logs_with_retry(
-                    service_name=SERVICE_NAMES_DAUM_MAIL,
-                    test_cases=FILE_LOGGING_CASE,
-                    size=1,
-                    max_attempts=3,  # 총 3번 시도
-                    interval_sec=5  # 시도 간 5초 대기
-                )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
+@allure.severity(allure.severity_level.NORMAL)
+@allure.step("Daum Mail Large Body Test")
+@pytest.mark.skipif(not LARGE_BODY_MODE, reason="LARGE_BODY_MODE=false")
+@pytest.mark.parametrize("size_kb", LARGE_BODY_SIZES_KB)
+def test_daum_mail_large_body(request, service_page, dlp_token, size_kb):
+    # 모듈 동안 유지되는 로그인 페이지를 받아서 새 작성 화면만 다시 연다
+    session = service_page("daum_mail")
+
+    try:
+        # 내게쓰기
+        page = session.compose()
+
+        # 제목 입력
+        page.get_by_role("textbox", name="제목").click()
+        page.get_by_role("textbox", name="제목").fill(f"대용량본문로깅테스트 {size_kb}KB {dlp_token}")
+
+        # 패턴 + 키워드 블록을 일정 간격으로 반복한 본문 (기대값은 블록 1개 기대값 × 블록 수)
+        body, expected = build_large_body(
+            size_kb,
+            DLP_PATTERNS + DLP_KEYWORDS,
+            {
+                "pattern_count": int(PATTERN_LOGGING_CASE[0]["expected"]["pattern_count"]),
+                "keyword_count": int(KEYWORD_LOGGING_CASE[0]["expected"]["keyword_count"]),
+            },
+        )
+
+        # 본문 입력 (키 입력 단위 fill 대신 insertText 한 번)
+        editor_box = page.locator("iframe[name=\"tx_canvas_wysiwyg\"]").content_frame.locator("body")
+        insert = insert_text_fast(editor_box, body)
+
+        # 보내기 클릭 → 전송 요청 응답까지 대기 (MB 단위 본문이라 넉넉하게)
+        send = send_and_wait_for_request(page, "daum_mail", page.get_by_role("button", name="보내기").click,
+                                         timeout=120000)
+
+        # ===== DUT 로그 도착까지 짧은 간격으로 재시도 (도착 시간 측정) =====
+        started = time.monotonic()
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DAUM_MAIL,
+            test_cases=[{"hit_index": 0, "label": f"대용량 본문 {size_kb}KB", "expected": expected}],
+            token=dlp_token,
+            size=1,
+            max_attempts=30,
+            interval_sec=2,
+            allow_fallback=False,
+        )
+        attach_large_body_timing("daum_mail", size_kb, insert, send, int((time.monotonic() - started) * 1000))
+
+    except Exception as e:
+        capture_failure_screenshot(session.page, request, timeout=5000)
+        # 상태를 알 수 없는 페이지는 다음 케이스에 넘기지 않는다
+        session.invalidate()
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
 
-        finally:
-            browser.close()
+@allure.severity(allure.severity_level.NORMAL)
+@allure.step("Daum Mail Attach Sweep Test")
+@pytest.mark.skipif(not ATTACH_SWEEP_MODE, reason="ATTACH_SWEEP_MODE=false")
+@pytest.mark.parametrize("size_kb, kind", attach_sweep_cases("daum_mail"))
+def test_daum_mail_attach_sweep(request, service_page, dlp_token, size_kb, kind):
+    # 모듈 동안 유지되는 로그인 페이지를 받아서 새 작성 화면만 다시 연다
+    session = service_page("daum_mail")
+    files = [generate_sweep_file(size_kb, kind)]
+
+    try:
+        # 내게쓰기
+        page = session.compose()
+
+        # 제목 입력
+        page.get_by_role("textbox", name="제목").click()
+        page.get_by_role("textbox", name="제목").fill(f"첨부파일스윕테스트 {size_kb}KB {kind} {dlp_token}")
+
+        # 파일 첨부 (크기에 비례한 시간 안에 전송되는지 확인 + 업로드 시간 기록)
+        with expect_file_transmitted(page, files, timeout=sweep_upload_timeout_ms(size_kb)) as upload:
+            page.get_by_label("파일 첨부하기").set_input_files(files)
+        print(f"파일을 첨부하였습니다. ({size_kb}KB {kind})")
+
+        # 보내기 클릭
+        try:
+            page.get_by_role("button", name="보내기").click(timeout=2000)
+            print("✔ [DEBUG] '보내기' 버튼을 클릭했습니다.")
+        except Exception:
+            print("▶ [DEBUG] '보내기' 버튼이 없어 스킵합니다.")
+
+        # ===== 파일 로그 도착까지 짧은 간격으로 확인하고 크기별 시간 기록 =====
+        verify_and_record_sweep("daum_mail", size_kb, kind, upload,
+                                service_names=SERVICE_NAMES_DAUM_MAIL, test_cases=FILE_LOGGING_CASE, token=dlp_token)
+
+    except Exception as e:
+        capture_failure_screenshot(session.page, request, timeout=5000)
+        # 상태를 알 수 없는 페이지는 다음 케이스에 넘기지 않는다
+        session.invalidate()
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
@@ -2,7 +2,7 @@ import os
 import time
 import allure
 import pytest
-from playwright.sync_api import sync_playwright,BrowserContext,TimeoutError
+from playwright.sync_api import BrowserContext,TimeoutError
 from base import *
 
 
@@ -42,312 +42,360 @@ FILE_LOGGING_CASE = [
 @allure.step("Dooray Login Test")
 #@pytest.mark.order("first")
 @pytest.mark.dependency(name="dooray_login")
-def test_dooray_login(request):
-    with sync_playwright() as p:
-        # 브라우저 및 컨텍스트 생성
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
-        page = context.new_page()
-
-        try:
-            # 두레이 홈페이지 진입
-            goto_and_wait(page, f"{DOORAY_BASE_URL}")
-            time.sleep(3)
-
-
-            # 아이디 및 패스워드 입력
-            page.get_by_placeholder("아이디").click()
-            page.get_by_placeholder("아이디").fill(DOORAY_ID)
-            page.get_by_placeholder("비밀번호").click()
-            page.get_by_placeholder("비밀번호").fill(DOORAY_PASSWORD)
-            time.sleep(1)
-            page.get_by_role("button", name="로그인").click()
-            time.sleep(3)
-
-            # 세션 상태 저장
-            os.makedirs("session", exist_ok=True)
-            session_path = os.path.join("session", "dooraystorageState.json")
-            context.storage_state(path=session_path)
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_dooray_login(request, browser):
+    # 저장된 벤더 세션이 아직 유효하면 UI 로그인 생략
+    if reuse_vendor_session(browser, "dooray"):
+        return
+
+    # 브라우저 및 컨텍스트 생성
+    context = browser.new_context()
+    apply_route_policy(context, "dooray_mail")
+    page = context.new_page()
+
+    try:
+        # 두레이 홈페이지 진입
+        goto_and_wait(page, f"{DOORAY_BASE_URL}")
+        time.sleep(3)
+
+
+        # 아이디 및 패스워드 입력
+        page.get_by_placeholder("아이디").click()
+        page.get_by_placeholder("아이디").fill(DOORAY_ID)
+        page.get_by_placeholder("비밀번호").click()
+        page.get_by_placeholder("비밀번호").fill(DOORAY_PASSWORD)
+        time.sleep(1)
+        page.get_by_role("button", name="로그인").click()
+        time.sleep(3)
+
+        # 세션 상태 저장
+        save_vendor_session(context, "dooray")
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.NORMAL)
 @allure.step("Dooray Mail Normal Test")
 @pytest.mark.dependency(name="dooray_mail_normal")
-def test_dooray_mail_normal(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "dooraystorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 메일 페이지로 이동
-            page.goto(f"{DOORAY_BASE_URL}/mail/systems/inbox")
-            time.sleep(3)
-
-            # 메일쓰기 클릭 시 새 창이 열리는 것을 대기
-            with page.expect_popup() as page1_info:
-                page.get_by_test_id("openNewMailWriteForm").click()
-            page1 = page1_info.value
-            time.sleep(2)
-
-            # 수신자 입력
-            page1.get_by_test_id("MemberAutocompleteInput_TextField").first.click()
-            page1.get_by_test_id("MemberAutocompleteInput_TextField").first.fill(EMAIL_RECEIVER)
-            page1.wait_for_timeout(3000)  # 입력 후 잠시 대기
-            print("수신자 정보를 입력하였습니다.")
-
-            # 제목 입력
-            page1.get_by_test_id("MailWriteHeader_BottomLinedTextField").click()
-            page1.get_by_test_id("MailWriteHeader_BottomLinedTextField").fill("기본로깅테스트")
-
-            # 본문 입력
-            page1.get_by_role("application").locator("div").nth(3).click()
-            page1.get_by_role("application").locator("div").nth(1).fill("\n".join(DLP_NORMAL))
-            time.sleep(1)
-
-            # 보내기 클릭
-            page1.get_by_test_id("MailWriteFooter_ContainedButton").click()
-            time.sleep(1)
-            page1.get_by_test_id("MailWritePreviewModal_ContainedButton").click()
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_DOORAY_MAIL,
-                test_cases=NORMAL_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_dooray_mail_normal(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("dooray")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "dooray_mail")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 메일 페이지로 이동
+        page.goto(f"{DOORAY_BASE_URL}/mail/systems/inbox")
+        time.sleep(3)
+
+        # 메일쓰기 클릭 시 새 창이 열리는 것을 대기
+        with page.expect_popup() as page1_info:
+            page.get_by_test_id("openNewMailWriteForm").click()
+        page1 = page1_info.value
+        time.sleep(2)
+
+        # 수신자 입력
+        page1.get_by_test_id("MemberAutocompleteInput_TextField").first.click()
+        page1.get_by_test_id("MemberAutocompleteInput_TextField").first.fill(EMAIL_RECEIVER)
+        page1.wait_for_timeout(3000)  # 입력 후 잠시 대기
+        print("수신자 정보를 입력하였습니다.")
+
+        # 제목 입력
+        page1.get_by_test_id("MailWriteHeader_BottomLinedTextField").click()
+        page1.get_by_test_id("MailWriteHeader_BottomLinedTextField").fill(f"기본로깅테스트 {dlp_token}")
+
+        # 본문 입력
+        page1.get_by_role("application").locator("div").nth(3).click()
+        page1.get_by_role("application").locator("div").nth(1).fill("\n".join(DLP_NORMAL))
+        time.sleep(1)
+
+        # 보내기 클릭
+        page1.get_by_test_id("MailWriteFooter_ContainedButton").click()
+        time.sleep(1)
+        page1.get_by_test_id("MailWritePreviewModal_ContainedButton").click()
+
+        # 대기
+        page.wait_for_timeout(5000)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DOORAY_MAIL,
+            test_cases=NORMAL_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Dooray Mail Pattern Test")
 @pytest.mark.dependency(name="dooray_mail_pattern")
-def test_dooray_mail_pattern(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "dooraystorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
+def test_dooray_mail_pattern(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("dooray")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "dooray_mail")
+    page = context.new_page()
 
-        try:
+    try:
 
-            # 세션 유지한 채로 메일 페이지로 이동
-            page.goto(f"{DOORAY_BASE_URL}/mail/systems/inbox")
-            time.sleep(3)
+        # 세션 유지한 채로 메일 페이지로 이동
+        page.goto(f"{DOORAY_BASE_URL}/mail/systems/inbox")
+        time.sleep(3)
 
 
-            # 메일쓰기 클릭 시 새 창이 열리는 것을 대기
-            with page.expect_popup() as page1_info:
-                page.get_by_test_id("openNewMailWriteForm").click()
-            page1 = page1_info.value
-            time.sleep(2)
+        # 메일쓰기 클릭 시 새 창이 열리는 것을 대기
+        with page.expect_popup() as page1_info:
+            page.get_by_test_id("openNewMailWriteForm").click()
+        page1 = page1_info.value
+        time.sleep(2)
 
-            # 수신자 입력
-            page1.get_by_test_id("MemberAutocompleteInput_TextField").first.click()
-            page1.get_by_test_id("MemberAutocompleteInput_TextField").first.fill(EMAIL_RECEIVER)
-            page1.wait_for_timeout(1000)  # 입력 후 잠시 대기
-            print("수신자 정보를 입력하였습니다.")
+        # 수신자 입력
+        page1.get_by_test_id("MemberAutocompleteInput_TextField").first.click()
+        page1.get_by_test_id("MemberAutocompleteInput_TextField").first.fill(EMAIL_RECEIVER)
+        page1.wait_for_timeout(1000)  # 입력 후 잠시 대기
+        print("수신자 정보를 입력하였습니다.")
 
 
-            # 제목 입력
-            page1.get_by_test_id("MailWriteHeader_BottomLinedTextField").click()
-            page1.get_by_test_id("MailWriteHeader_BottomLinedTextField").fill("개인정보로깅테스트")
+        # 제목 입력
+        page1.get_by_test_id("MailWriteHeader_BottomLinedTextField").click()
+        page1.get_by_test_id("MailWriteHeader_BottomLinedTextField").fill(f"개인정보로깅테스트 {dlp_token}")
 
-            # 본문 클릭
-            page1.get_by_role("application").locator("div").nth(3).click()
+        # 본문 클릭
+        page1.get_by_role("application").locator("div").nth(3).click()
 
-            # 기존 내용 모두 삭제
-            target_box = page1.get_by_role("application").locator("div").nth(1)
-            target_box.click()
+        # 기존 내용 모두 삭제
+        target_box = page1.get_by_role("application").locator("div").nth(1)
+        target_box.click()
 
-            # 패턴 리스트 여러 개를 줄바꿈으로 입력
-            target_box.fill("\n".join(DLP_PATTERNS))
-            time.sleep(1)
+        # 패턴 리스트 여러 개를 줄바꿈으로 입력
+        target_box.fill("\n".join(DLP_PATTERNS))
+        time.sleep(1)
 
-            # 보내기 클릭
-            page1.get_by_test_id("MailWriteFooter_ContainedButton").click()
-            time.sleep(1)
-            page1.get_by_test_id("MailWritePreviewModal_ContainedButton").click()
+        # 보내기 클릭
+        page1.get_by_test_id("MailWriteFooter_ContainedButton").click()
+        time.sleep(1)
+        page1.get_by_test_id("MailWritePreviewModal_ContainedButton").click()
 
-            # 5초 대기
-            page.wait_for_timeout(5000)
+        # 5초 대기
+        page.wait_for_timeout(5000)
 
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_DOORAY_MAIL,
-                test_cases=PATTERN_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DOORAY_MAIL,
+            test_cases=PATTERN_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
 
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
 
-        finally:
-            browser.close()
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Dooray Mail Keyword Test")
 @pytest.mark.dependency(name="dooray_mail_keyword")
-def test_dooray_mail_keyword(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "dooraystorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 메일 페이지로 이동
-            page.goto(f"{DOORAY_BASE_URL}/mail/systems/inbox")
-            time.sleep(3)
-
-            # 메일쓰기 클릭 시 새 창이 열리는 것을 대기
-            with page.expect_popup() as page1_info:
-                page.get_by_test_id("openNewMailWriteForm").click()
-            page1 = page1_info.value
-            time.sleep(2)
-
-            # 수신자 입력
-            page1.get_by_test_id("MemberAutocompleteInput_TextField").first.click()
-            page1.get_by_test_id("MemberAutocompleteInput_TextField").first.fill(EMAIL_RECEIVER)
-            page1.wait_for_timeout(1000)  # 입력 후 잠시 대기
-            print("수신자 정보를 입력하였습니다.")
-
-
-            # 제목 입력
-            page1.get_by_test_id("MailWriteHeader_BottomLinedTextField").click()
-            page1.get_by_test_id("MailWriteHeader_BottomLinedTextField").fill("키워드로깅테스트")
-
-            # 본문 클릭
-            page1.get_by_role("application").locator("div").nth(3).click()
-
-            # 기존 내용 모두 삭제
-            target_box = page1.get_by_role("application").locator("div").nth(1)
-            target_box.click()
-
-            # 패턴 리스트 여러 개를 줄바꿈으로 입력
-            target_box.fill("\n".join(DLP_KEYWORDS))
-            time.sleep(1)
-
-            # 보내기 클릭
-            page1.get_by_test_id("MailWriteFooter_ContainedButton").click()
-            time.sleep(1)
-            page1.get_by_test_id("MailWritePreviewModal_ContainedButton").click()
-
-            # 5초 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_DOORAY_MAIL,
-                test_cases=KEYWORD_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-
-        finally:
-            browser.close()
+def test_dooray_mail_keyword(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("dooray")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "dooray_mail")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 메일 페이지로 이동
+        page.goto(f"{DOORAY_BASE_URL}/mail/systems/inbox")
+        time.sleep(3)
+
+        # 메일쓰기 클릭 시 새 창이 열리는 것을 대기
+        with page.expect_popup() as page1_info:
+            page.get_by_test_id("openNewMailWriteForm").click()
+        page1 = page1_info.value
+        time.sleep(2)
+
+        # 수신자 입력
+        page1.get_by_test_id("MemberAutocompleteInput_TextField").first.click()
+        page1.get_by_test_id("MemberAutocompleteInput_TextField").first.fill(EMAIL_RECEIVER)
+        page1.wait_for_timeout(1000)  # 입력 후 잠시 대기
+        print("수신자 정보를 입력하였습니다.")
+
+
+        # 제목 입력
+        page1.get_by_test_id("MailWriteHeader_BottomLinedTextField").click()
+        page1.get_by_test_id("MailWriteHeader_BottomLinedTextField").fill(f"키워드로깅테스트 {dlp_token}")
+
+        # 본문 클릭
+        page1.get_by_role("application").locator("div").nth(3).click()
+
+        # 기존 내용 모두 삭제
+        target_box = page1.get_by_role("application").locator("div").nth(1)
+        target_box.click()
+
+        # 패턴 리스트 여러 개를 줄바꿈으로 입력
+        target_box.fill("\n".join(DLP_KEYWORDS))
+        time.sleep(1)
+
+        # 보내기 클릭
+        page1.get_by_test_id("MailWriteFooter_ContainedButton").click()
+        time.sleep(1)
+        page1.get_by_test_id("MailWritePreviewModal_ContainedButton").click()
+
+        # 5초 대기
+        page.wait_for_timeout(5000)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DOORAY_MAIL,
+            test_cases=KEYWORD_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.BLOCKER)
 @allure.step("Dooray Mail Attach Test")
 @pytest.mark.dependency(name="dooray_mail_attach")
-def test_dooray_mail_attach(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "dooraystorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 메일 페이지로 이동
-            page.goto(f"{DOORAY_BASE_URL}/mail/systems/inbox")
-            time.sleep(3)
-
-            # 메일쓰기 클릭 시 새 창이 열리는 것을 대기
-            with page.expect_popup() as page1_info:
-                page.get_by_test_id("openNewMailWriteForm").click()
-            page1 = page1_info.value
-            time.sleep(2)
-
-            # 수신자 입력
-            page1.get_by_test_id("MemberAutocompleteInput_TextField").first.click()
-            page1.get_by_test_id("MemberAutocompleteInput_TextField").first.fill(EMAIL_RECEIVER)
-            page1.wait_for_timeout(1000)  # 입력 후 잠시 대기
-            print("수신자 정보를 입력하였습니다.")
-
-            # 제목 입력
-            page1.get_by_test_id("MailWriteHeader_BottomLinedTextField").click()
-            page1.get_by_test_id("MailWriteHeader_BottomLinedTextField").fill("첨부파일로깅테스트")
-
-            # 파일 첨부
-            with page1.expect_file_chooser() as fc_info:
-                page1.get_by_test_id("MailWriteHeader_GhostButton").click()
-            time.sleep(1)
-            file_chooser = fc_info.value
-            # 파일 1개 첨부
+def test_dooray_mail_attach(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("dooray")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "dooray_mail")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 메일 페이지로 이동
+        page.goto(f"{DOORAY_BASE_URL}/mail/systems/inbox")
+        time.sleep(3)
+
+        # 메일쓰기 클릭 시 새 창이 열리는 것을 대기
+        with page.expect_popup() as page1_info:
+            page.get_by_test_id("openNewMailWriteForm").click()
+        page1 = page1_info.value
+        time.sleep(2)
+
+        # 수신자 입력
+        page1.get_by_test_id("MemberAutocompleteInput_TextField").first.click()
+        page1.get_by_test_id("MemberAutocompleteInput_TextField").first.fill(EMAIL_RECEIVER)
+        page1.wait_for_timeout(1000)  # 입력 후 잠시 대기
+        print("수신자 정보를 입력하였습니다.")
+
+        # 제목 입력
+        page1.get_by_test_id("MailWriteHeader_BottomLinedTextField").click()
+        page1.get_by_test_id("MailWriteHeader_BottomLinedTextField").fill(f"첨부파일로깅테스트 {dlp_token}")
+
+        # 파일 첨부
+        with page1.expect_file_chooser() as fc_info:
+            page1.get_by_test_id("MailWriteHeader_GhostButton").click()
+        time.sleep(1)
+        file_chooser = fc_info.value
+        # 파일 1개 첨부
+        # 첨부 요청이 실제로 파일 크기만큼 나가는지 확인 (안 나가면 ES 대기 없이 바로 실패)
+        with expect_file_transmitted(page1, DLP_FILE):
             file_chooser.set_files(DLP_FILE)
-            # # 파일 2개 첨부
-            # file_chooser.set_files(DLP_FILES)
-            print("파일을 첨부하였습니다.")
+        # # 파일 2개 첨부
+        # file_chooser.set_files(DLP_FILES)
+        print("파일을 첨부하였습니다.")
 
-            # 5초 대기
-            page.wait_for_timeout(10000)
+        # 5초 대기
+        page.wait_for_timeout(10000)
 
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_DOORAY_MAIL,
-                test_cases=FILE_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DOORAY_MAIL,
+            test_cases=FILE_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
 
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
 
 
-        finally:
-            browser.close()
-
+    finally:
+        context.close()
 
 
+@allure.severity(allure.severity_level.NORMAL)
+@allure.step("Dooray Mail Attach Sweep Test")
+@pytest.mark.skipif(not ATTACH_SWEEP_MODE, reason="ATTACH_SWEEP_MODE=false")
+@pytest.mark.parametrize("size_kb, kind", attach_sweep_cases("dooray_mail"))
+def test_dooray_mail_attach_sweep(request, browser, dlp_token, size_kb, kind):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("dooray")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "dooray_mail")
+    page = context.new_page()
+    files = [generate_sweep_file(size_kb, kind)]
+
+    try:
+        # 세션 유지한 채로 메일 페이지로 이동
+        goto_and_wait(page, f"{DOORAY_BASE_URL}/mail/systems/inbox",
+                      ready="[data-testid='openNewMailWriteForm']")
+
+        # 메일쓰기 클릭 시 새 창이 열리는 것을 대기
+        with page.expect_popup() as page1_info:
+            page.get_by_test_id("openNewMailWriteForm").click()
+        page1 = page1_info.value
+        page1.get_by_test_id("MailWriteHeader_BottomLinedTextField").wait_for()
+
+        # 제목 입력
+        page1.get_by_test_id("MailWriteHeader_BottomLinedTextField").click()
+        page1.get_by_test_id("MailWriteHeader_BottomLinedTextField").fill(f"첨부파일스윕테스트 {size_kb}KB {kind} {dlp_token}")
+
+        # 파일 첨부 (크기에 비례한 시간 안에 전송되는지 확인 + 업로드 시간 기록)
+        with page1.expect_file_chooser() as fc_info:
+            page1.get_by_test_id("MailWriteHeader_GhostButton").click()
+        file_chooser = fc_info.value
+        with expect_file_transmitted(page1, files, timeout=sweep_upload_timeout_ms(size_kb)) as upload:
+            file_chooser.set_files(files)
+        print(f"파일을 첨부하였습니다. ({size_kb}KB {kind})")
+
+        # ===== 파일 로그 도착까지 짧은 간격으로 확인하고 크기별 시간 기록 =====
+        verify_and_record_sweep("dooray_mail", size_kb, kind, upload,
+                                service_names=SERVICE_NAMES_DOORAY_MAIL, test_cases=FILE_LOGGING_CASE, token=dlp_token)
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
@@ -2,7 +2,7 @@ import os
 import time
 import allure
 import pytest
-from playwright.sync_api import sync_playwright,BrowserContext,TimeoutError
+from playwright.sync_api import BrowserContext,TimeoutError
 from base import *
 
 NORMAL_LOGGING_CASE = [
@@ -41,300 +41,343 @@ FILE_LOGGING_CASE = [
 @allure.step("Naverworks Login Test")
 #@pytest.mark.order("first")
 @pytest.mark.dependency(name="naverworks_login")
-def test_naverworks_login(request):
-    with sync_playwright() as p:
-        # 브라우저 및 컨텍스트 생성
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
-        page = context.new_page()
-
-        try:
-            # 네이버웍스 홈페이지 진입
-            goto_and_wait(page, f"{NAVERWORKS_BASE_URL}")
-
-            # 아이디 및 패스워드 입력
-            with page.expect_popup() as page1_info:
-                page.get_by_role("link", name="로그인", exact=True).click()
-            page1 = page1_info.value
-            time.sleep(1)
-            page1.get_by_placeholder("또는 id@group.xxx").click()
-            page1.get_by_placeholder("또는 id@group.xxx").fill(NAVERWORKS_ID)
-            page1.get_by_role("button", name="로그인", exact=True).click()
-            time.sleep(1)
-            page1.get_by_placeholder("비밀번호").click()
-            page1.get_by_placeholder("비밀번호").fill(NAVERWORKS_PASSWORD)
-            time.sleep(1)
-            page1.get_by_role("button", name="로그인").click()
-            time.sleep(3)
-
-            # 세션 상태 저장
-            os.makedirs("session", exist_ok=True)
-            session_path = os.path.join("session", "naverworksstorageState.json")
-            context.storage_state(path=session_path)
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_naverworks_login(request, browser):
+    # 저장된 벤더 세션이 아직 유효하면 UI 로그인 생략
+    if reuse_vendor_session(browser, "naverworks"):
+        return
+
+    # 브라우저 및 컨텍스트 생성
+    context = browser.new_context()
+    apply_route_policy(context, "naverworks_mail")
+    page = context.new_page()
+
+    try:
+        # 네이버웍스 홈페이지 진입
+        goto_and_wait(page, f"{NAVERWORKS_BASE_URL}")
+
+        # 아이디 및 패스워드 입력
+        with page.expect_popup() as page1_info:
+            page.get_by_role("link", name="로그인", exact=True).click()
+        page1 = page1_info.value
+        time.sleep(1)
+        page1.get_by_placeholder("또는 id@group.xxx").click()
+        page1.get_by_placeholder("또는 id@group.xxx").fill(NAVERWORKS_ID)
+        page1.get_by_role("button", name="로그인", exact=True).click()
+        time.sleep(1)
+        page1.get_by_placeholder("비밀번호").click()
+        page1.get_by_placeholder("비밀번호").fill(NAVERWORKS_PASSWORD)
+        time.sleep(1)
+        page1.get_by_role("button", name="로그인").click()
+        time.sleep(3)
+
+        # 세션 상태 저장
+        save_vendor_session(context, "naverworks")
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.NORMAL)
 @allure.step("Naverworks Mail Normal Test")
 @pytest.mark.dependency(name="naverworks_mail_normal")
-def test_naverworks_mail_normal(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "naverworksstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 메일 페이지로 이동
-            page.goto(f"{NAVERWORKS_MAIL_URL}/")
-            time.sleep(3)
-
-            # 메일쓰기
-            with page.expect_popup() as page1_info:
-                page.get_by_role("link", name="메일쓰기").click()
-            page1 = page1_info.value
-            time.sleep(2)
-
-            # 수신자 입력
-            page1.get_by_role("combobox", name="받는사람").fill(EMAIL_RECEIVER)
-            time.sleep(1)
-
-            # 제목 입력
-            page1.get_by_role("textbox", name="제목").fill("기본로깅테스트")
-
-            # 본문 입력
-            editor_box = page1.locator("iframe").content_frame.locator(".workseditor-content")
-            editor_box.click()
-            editor_box.fill("\n".join(DLP_NORMAL))
-            time.sleep(1)
-
-            # 저장 클릭
-            page1.get_by_role("button", name="보내기").click()
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_NAVERWORKS_MAIL,
-                test_cases=NORMAL_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_naverworks_mail_normal(request, browser, dlp_token):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "naverworks", "naverworks_mail", f"{NAVERWORKS_MAIL_URL}/")
+
+    try:
+
+        # 세션 유지한 채로 메일 페이지로 이동
+        wait_for_ready(page)
+
+        # 메일쓰기
+        with page.expect_popup() as page1_info:
+            page.get_by_role("link", name="메일쓰기").click()
+        page1 = page1_info.value
+        time.sleep(2)
+        # 작성 화면이 기준선과 달라졌는지 (UI 개편 조기 감지, 실패시키지 않음)
+        check_ui_drift(page1, "naverworks_mail_compose")
+
+        # 수신자 입력
+        page1.get_by_role("combobox", name="받는사람").fill(EMAIL_RECEIVER)
+        time.sleep(1)
+
+        # 제목 입력
+        page1.get_by_role("textbox", name="제목").fill(f"기본로깅테스트 {dlp_token}")
+
+        # 본문 입력
+        editor_box = page1.locator("iframe").content_frame.locator(".workseditor-content")
+        editor_box.click()
+        editor_box.fill("\n".join(DLP_NORMAL))
+        time.sleep(1)
+
+        # 저장 클릭 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page1, "naverworks_mail", page1.get_by_role("button", name="보내기").click)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_NAVERWORKS_MAIL,
+            test_cases=NORMAL_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Naverworks Mail Pattern Test")
 @pytest.mark.dependency(name="naverworks_mail_pattern")
-def test_naverworks_mail_pattern(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "naverworksstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
+def test_naverworks_mail_pattern(request, browser, dlp_token):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "naverworks", "naverworks_mail", f"{NAVERWORKS_MAIL_URL}/")
 
-        try:
-
-            # 세션 유지한 채로 메일 페이지로 이동
-            page.goto(f"{NAVERWORKS_MAIL_URL}/")
-            time.sleep(3)
+    try:
 
-            # 메일쓰기
-            with page.expect_popup() as page1_info:
-                page.get_by_role("link", name="메일쓰기").click()
-            page1 = page1_info.value
-            time.sleep(2)
+        # 세션 유지한 채로 메일 페이지로 이동
+        wait_for_ready(page)
 
-            # 수신자 입력
-            page1.get_by_role("combobox", name="받는사람").fill(EMAIL_RECEIVER)
-            time.sleep(1)
+        # 메일쓰기
+        with page.expect_popup() as page1_info:
+            page.get_by_role("link", name="메일쓰기").click()
+        page1 = page1_info.value
+        time.sleep(2)
+        # 작성 화면이 기준선과 달라졌는지 (UI 개편 조기 감지, 실패시키지 않음)
+        check_ui_drift(page1, "naverworks_mail_compose")
 
-            # 제목 입력
-            page1.get_by_role("textbox", name="제목").fill("개인정보로깅테스트")
+        # 수신자 입력
+        page1.get_by_role("combobox", name="받는사람").fill(EMAIL_RECEIVER)
+        time.sleep(1)
 
-            # 본문 입력
-            editor_box = page1.locator("iframe").content_frame.locator(".workseditor-content")
-            editor_box.click()
-            editor_box.fill("\n".join(DLP_PATTERNS))
-            time.sleep(1)
+        # 제목 입력
+        page1.get_by_role("textbox", name="제목").fill(f"개인정보로깅테스트 {dlp_token}")
 
-            # 저장 클릭
-            page1.get_by_role("button", name="보내기").click()
+        # 본문 입력
+        editor_box = page1.locator("iframe").content_frame.locator(".workseditor-content")
+        editor_box.click()
+        editor_box.fill("\n".join(DLP_PATTERNS))
+        time.sleep(1)
 
-            # 대기
-            page.wait_for_timeout(5000)
+        # 저장 클릭 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page1, "naverworks_mail", page1.get_by_role("button", name="보내기").click)
 
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_NAVERWORKS_MAIL,
-                test_cases=PATTERN_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_NAVERWORKS_MAIL,
+            test_cases=PATTERN_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
 
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
 
-        finally:
-            browser.close()
+    finally:
+        context.close()
 
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Naverworks Mail Keyword Test")
 @pytest.mark.dependency(name="naverworks_mail_keyword")
-def test_naverworks_mail_keyword(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "naverworksstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
+def test_naverworks_mail_keyword(request, browser, dlp_token):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "naverworks", "naverworks_mail", f"{NAVERWORKS_MAIL_URL}/")
 
-            # 세션 유지한 채로 메일 페이지로 이동
-            page.goto(f"{NAVERWORKS_MAIL_URL}/")
-            time.sleep(3)
+    try:
 
-            # 메일쓰기
-            with page.expect_popup() as page1_info:
-                page.get_by_role("link", name="메일쓰기").click()
-            page1 = page1_info.value
-            time.sleep(2)
+        # 세션 유지한 채로 메일 페이지로 이동
+        wait_for_ready(page)
 
-            # 수신자 입력
-            page1.get_by_role("combobox", name="받는사람").fill(EMAIL_RECEIVER)
-            time.sleep(1)
+        # 메일쓰기
+        with page.expect_popup() as page1_info:
+            page.get_by_role("link", name="메일쓰기").click()
+        page1 = page1_info.value
+        time.sleep(2)
+        # 작성 화면이 기준선과 달라졌는지 (UI 개편 조기 감지, 실패시키지 않음)
+        check_ui_drift(page1, "naverworks_mail_compose")
 
-            # 제목 입력
-            page1.get_by_role("textbox", name="제목").fill("키워드로깅테스트")
+        # 수신자 입력
+        page1.get_by_role("combobox", name="받는사람").fill(EMAIL_RECEIVER)
+        time.sleep(1)
 
-            # 본문 입력
-            editor_box = page1.locator("iframe").content_frame.locator(".workseditor-content")
-            editor_box.click()
-            editor_box.fill("\n".join(DLP_KEYWORDS))
-            time.sleep(1)
+        # 제목 입력
+        page1.get_by_role("textbox", name="제목").fill(f"키워드로깅테스트 {dlp_token}")
 
-            # 저장 클릭
-            page1.get_by_role("button", name="보내기").click()
+        # 본문 입력
+        editor_box = page1.locator("iframe").content_frame.locator(".workseditor-content")
+        editor_box.click()
+        editor_box.fill("\n".join(DLP_KEYWORDS))
+        time.sleep(1)
 
-            # 대기
-            page.wait_for_timeout(5000)
+        # 저장 클릭 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page1, "naverworks_mail", page1.get_by_role("button", name="보내기").click)
 
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_NAVERWORKS_MAIL,
-                test_cases=KEYWORD_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_NAVERWORKS_MAIL,
+            test_cases=KEYWORD_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
 
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
 
-        finally:
-            browser.close()
+    finally:
+        context.close()
 
 
 @allure.severity(allure.severity_level.BLOCKER)
 @allure.step("Naverworks Mail Attach Test")
 @pytest.mark.dependency(name="naverworks_mail_attach")
-def test_naverworks_mail_attach(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "naverworksstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
+def test_naverworks_mail_attach(request, browser, dlp_token):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "naverworks", "naverworks_mail", f"{NAVERWORKS_MAIL_URL}/")
+
+    try:
+
+        # 세션 유지한 채로 메일 페이지로 이동
+        wait_for_ready(page)
+
+        # 메일쓰기
+        with page.expect_popup() as page1_info:
+            page.get_by_role("link", name="메일쓰기").click()
+        page1 = page1_info.value
+        time.sleep(2)
+        # 작성 화면이 기준선과 달라졌는지 (UI 개편 조기 감지, 실패시키지 않음)
+        check_ui_drift(page1, "naverworks_mail_compose")
+
+        # 수신자 입력
+        page1.get_by_role("combobox", name="받는사람").fill(EMAIL_RECEIVER)
+        time.sleep(1)
+
+        # 제목 입력
+        page1.get_by_role("textbox", name="제목").fill(f"첨부파일로깅테스트 {dlp_token}")
+
+        # 본문 입력
+        editor_box = page1.locator("iframe").content_frame.locator(".workseditor-content")
+        editor_box.click()
+        editor_box.fill("첨부파일로깅테스트")
+        time.sleep(1)
+
+        # 파일첨부 클릭
+        page1.get_by_role("button", name="파일첨부 파일첨부").click()
+        time.sleep(1)
+        # 첨부 메뉴가 기준선과 달라졌는지
+        check_ui_drift(page1, "naverworks_mail_attach")
+
+        # '내 PC' 클릭 → 파일 선택창 열리는 구간을 file chooser 로 처리
+        with page1.expect_file_chooser(timeout=5000) as fc_info:
+            page1.get_by_role("link", name="내 PC").click()
+        time.sleep(1)
+        file_chooser = fc_info.value
+        # 첨부 요청이 실제로 파일 크기만큼 나가는지 확인 (안 나가면 ES 대기 없이 바로 실패)
+        with expect_file_transmitted(page1, DLP_FILE):
+            file_chooser.set_files(DLP_FILE)
+        print(f"[DEBUG] 파일 첨부 완료: {DLP_FILE}")
+        time.sleep(2)
 
+        # 저장 클릭
         try:
+            page1.get_by_role("button", name="보내기").click(timeout=1500)
+            print("✔ [DEBUG] 보내기 클릭됨")
+        except:
+            print("▶ [DEBUG] 보내기 없음 → 스킵")
 
-            # 세션 유지한 채로 메일 페이지로 이동
-            page.goto(f"{NAVERWORKS_MAIL_URL}/")
-            time.sleep(3)
-
-            # 메일쓰기
-            with page.expect_popup() as page1_info:
-                page.get_by_role("link", name="메일쓰기").click()
-            page1 = page1_info.value
-            time.sleep(2)
-
-            # 수신자 입력
-            page1.get_by_role("combobox", name="받는사람").fill(EMAIL_RECEIVER)
-            time.sleep(1)
-
-            # 제목 입력
-            page1.get_by_role("textbox", name="제목").fill("첨부파일로깅테스트")
-
-            # 본문 입력
-            editor_box = page1.locator("iframe").content_frame.locator(".workseditor-content")
-            editor_box.click()
-            editor_box.fill("첨부파일로깅테스트")
-            time.sleep(1)
-
-            # 파일첨부 클릭
-            page1.get_by_role("button", name="파일첨부 파일첨부").click()
-            time.sleep(1)
-
-            # '내 PC' 클릭 → 파일 선택창 열리는 구간을 file chooser 로 처리
-            with page1.expect_file_chooser(timeout=5000) as fc_info:
-                page1.get_by_role("link", name="내 PC").click()
-            time.sleep(1)
-            file_chooser = fc_info.value
-            file_chooser.set_files(DLP_FILE)
-            print(f"[DEBUG] 파일 첨부 완료: {DLP_FILE}")
-            time.sleep(2)
-
-            # 저장 클릭
-            try:
-                page1.get_by_role("button", name="보내기").click(timeout=1500)
-                print("✔ [DEBUG] 보내기 클릭됨")
-            except:
-                print("▶ [DEBUG] 보내기 없음 → 스킵")
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_NAVERWORKS_MAIL,
-                test_cases=FILE_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-
-        finally:
-            browser.close()
\ No newline at end of file
+        # 대기
+        page.wait_for_timeout(5000)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_NAVERWORKS_MAIL,
+            test_cases=FILE_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+
+    finally:
+        context.close()
+
+
+@allure.severity(allure.severity_level.NORMAL)
+@allure.step("Naverworks Mail Attach Sweep Test")
+@pytest.mark.skipif(not ATTACH_SWEEP_MODE, reason="ATTACH_SWEEP_MODE=false")
+@pytest.mark.parametrize("size_kb, kind", attach_sweep_cases("naverworks_mail"))
+def test_naverworks_mail_attach_sweep(request, browser, dlp_token, size_kb, kind):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "naverworks", "naverworks_mail", f"{NAVERWORKS_MAIL_URL}/")
+    files = [generate_sweep_file(size_kb, kind)]
+
+    try:
+        # 세션 유지한 채로 메일 페이지로 이동
+        wait_for_ready(page)
+
+        # 메일쓰기
+        with page.expect_popup() as page1_info:
+            page.get_by_role("link", name="메일쓰기").click()
+        page1 = page1_info.value
+        page1.get_by_role("textbox", name="제목").wait_for()
+
+        # 수신자 입력
+        page1.get_by_role("combobox", name="받는사람").fill(EMAIL_RECEIVER)
+
+        # 제목 입력
+        page1.get_by_role("textbox", name="제목").fill(f"첨부파일스윕테스트 {size_kb}KB {kind} {dlp_token}")
+
+        # 파일첨부 → '내 PC' 클릭 → 파일 선택창은 file chooser 로 처리
+        page1.get_by_role("button", name="파일첨부 파일첨부").click()
+        with page1.expect_file_chooser(timeout=5000) as fc_info:
+            page1.get_by_role("link", name="내 PC").click()
+        file_chooser = fc_info.value
+        # 크기에 비례한 시간 안에 전송되는지 확인 + 업로드 시간 기록
+        with expect_file_transmitted(page1, files, timeout=sweep_upload_timeout_ms(size_kb)) as upload:
+            file_chooser.set_files(files)
+        print(f"[DEBUG] 파일 첨부 완료: {size_kb}KB {kind}")
+
+        # 보내기 클릭
+        try:
+            page1.get_by_role("button", name="보내기").click(timeout=1500)
+            print("✔ [DEBUG] 보내기 클릭됨")
+        except Exception:
+            print("▶ [DEBUG] 보내기 없음 → 스킵")
+
+        # ===== 파일 로그 도착까지 짧은 간격으로 확인하고 크기별 시간 기록 =====
+        verify_and_record_sweep("naverworks_mail", size_kb, kind, upload,
+                                service_names=SERVICE_NAMES_NAVERWORKS_MAIL, test_cases=FILE_LOGGING_CASE, token=dlp_token)
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
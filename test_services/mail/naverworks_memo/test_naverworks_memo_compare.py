@@ -2,7 +2,7 @@ import os
 import time
 import allure
 import pytest
-from playwright.sync_api import sync_playwright,BrowserContext,TimeoutError
+from playwright.sync_api import BrowserContext,TimeoutError
 from base import *
 
 NORMAL_LOGGING_CASE = [
@@ -41,282 +41,272 @@ FILE_LOGGING_CASE = [
 @allure.step("Naverworks Login Test")
 #@pytest.mark.order("first")
 @pytest.mark.dependency(name="naverworks_login")
-def test_naverworks_login(request):
-    with sync_playwright() as p:
-        # 브라우저 및 컨텍스트 생성
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
-        page = context.new_page()
-
-        try:
-            # 네이버웍스 홈페이지 진입
-            goto_and_wait(page, f"{NAVERWORKS_BASE_URL}")
-
-            # 아이디 및 패스워드 입력
-            with page.expect_popup() as page1_info:
-                page.get_by_role("link", name="로그인", exact=True).click()
-            page1 = page1_info.value
-            time.sleep(1)
-            page1.get_by_placeholder("또는 id@group.xxx").click()
-            page1.get_by_placeholder("또는 id@group.xxx").fill(NAVERWORKS_ID)
-            page1.get_by_role("button", name="로그인", exact=True).click()
-            time.sleep(1)
-            page1.get_by_placeholder("비밀번호").click()
-            page1.get_by_placeholder("비밀번호").fill(NAVERWORKS_PASSWORD)
-            time.sleep(1)
-            page1.get_by_role("button", name="로그인").click()
-            time.sleep(3)
-
-            # 세션 상태 저장
-            os.makedirs("session", exist_ok=True)
-            session_path = os.path.join("session", "naverworksstorageState.json")
-            context.storage_state(path=session_path)
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_naverworks_login(request, browser):
+    # 저장된 벤더 세션이 아직 유효하면 UI 로그인 생략
+    if reuse_vendor_session(browser, "naverworks"):
+        return
+
+    # 브라우저 및 컨텍스트 생성
+    context = browser.new_context()
+    apply_route_policy(context, "naverworks_memo")
+    page = context.new_page()
+
+    try:
+        # 네이버웍스 홈페이지 진입
+        goto_and_wait(page, f"{NAVERWORKS_BASE_URL}")
+
+        # 아이디 및 패스워드 입력
+        with page.expect_popup() as page1_info:
+            page.get_by_role("link", name="로그인", exact=True).click()
+        page1 = page1_info.value
+        time.sleep(1)
+        page1.get_by_placeholder("또는 id@group.xxx").click()
+        page1.get_by_placeholder("또는 id@group.xxx").fill(NAVERWORKS_ID)
+        page1.get_by_role("button", name="로그인", exact=True).click()
+        time.sleep(1)
+        page1.get_by_placeholder("비밀번호").click()
+        page1.get_by_placeholder("비밀번호").fill(NAVERWORKS_PASSWORD)
+        time.sleep(1)
+        page1.get_by_role("button", name="로그인").click()
+        time.sleep(3)
+
+        # 세션 상태 저장
+        save_vendor_session(context, "naverworks")
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.NORMAL)
 @allure.step("Naverworks Memo Normal Test")
 @pytest.mark.dependency(name="naverworks_memo_normal")
-def test_naverworks_memo_normal(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "naverworksstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
+def test_naverworks_memo_normal(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("naverworks")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "naverworks_memo")
+    page = context.new_page()
 
-            # 세션 유지한 채로 메일 페이지로 이동
-            page.goto(f"{NAVERWORKS_MAIL_URL}/")
-            time.sleep(3)
+    try:
 
-            # 메일쓰기
-            with page.expect_popup() as page1_info:
-                page.get_by_role("link", name="메모쓰기").click()
-            page1 = page1_info.value
-            time.sleep(2)
+        # 세션 유지한 채로 메일 페이지로 이동
+        goto_and_wait(page, f"{NAVERWORKS_MAIL_URL}/")
 
-            # 제목 입력
-            page1.get_by_role("textbox", name="제목").fill("기본로깅테스트")
+        # 메일쓰기
+        with page.expect_popup() as page1_info:
+            page.get_by_role("link", name="메모쓰기").click()
+        page1 = page1_info.value
+        time.sleep(2)
 
-            # 본문 입력
-            editor_box = page1.locator("iframe").content_frame.locator(".workseditor-content")
-            editor_box.click()
-            editor_box.fill("\n".join(DLP_NORMAL))
-            time.sleep(1)
+        # 제목 입력
+        page1.get_by_role("textbox", name="제목").fill(f"기본로깅테스트 {dlp_token}")
 
-            # 저장 클릭
-            page1.get_by_role("button", name="저장", exact=True).click()
+        # 본문 입력
+        editor_box = page1.locator("iframe").content_frame.locator(".workseditor-content")
+        editor_box.click()
+        editor_box.fill("\n".join(DLP_NORMAL))
+        time.sleep(1)
 
-            # 대기
-            page.wait_for_timeout(5000)
+        # 저장 클릭 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page1, "naverworks_memo", page1.get_by_role("button", name="저장", exact=True).click)
 
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_NAVERWORKS_MEMO,
-                test_cases=NORMAL_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_NAVERWORKS_MEMO,
+            test_cases=NORMAL_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
 
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
-        finally:
-            browser.close()
+    finally:
+        context.close()
 
 
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Naverworks Memo Pattern Test")
 @pytest.mark.dependency(name="naverworks_memo_pattern")
-def test_naverworks_memo_pattern(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "naverworksstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 메일 페이지로 이동
-            page.goto(f"{NAVERWORKS_MAIL_URL}/")
-            time.sleep(3)
-
-            # 메일쓰기
-            with page.expect_popup() as page1_info:
-                page.get_by_role("link", name="메모쓰기").click()
-            page1 = page1_info.value
-            time.sleep(2)
-
-            # 제목 입력
-            page1.get_by_role("textbox", name="제목").fill("개인정보로깅테스트")
-
-            # 본문 입력
-            editor_box = page1.locator("iframe").content_frame.locator(".workseditor-content")
-            editor_box.click()
-            editor_box.fill("\n".join(DLP_PATTERNS))
-            time.sleep(1)
-
-            # 저장 클릭
-            page1.get_by_role("button", name="저장", exact=True).click()
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_NAVERWORKS_MEMO,
-                test_cases=PATTERN_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_naverworks_memo_pattern(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("naverworks")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "naverworks_memo")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 메일 페이지로 이동
+        goto_and_wait(page, f"{NAVERWORKS_MAIL_URL}/")
+
+        # 메일쓰기
+        with page.expect_popup() as page1_info:
+            page.get_by_role("link", name="메모쓰기").click()
+        page1 = page1_info.value
+        time.sleep(2)
+
+        # 제목 입력
+        page1.get_by_role("textbox", name="제목").fill(f"개인정보로깅테스트 {dlp_token}")
+
+        # 본문 입력
+        editor_box = page1.locator("iframe").content_frame.locator(".workseditor-content")
+        editor_box.click()
+        editor_box.fill("\n".join(DLP_PATTERNS))
+        time.sleep(1)
+
+        # 저장 클릭 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page1, "naverworks_memo", page1.get_by_role("button", name="저장", exact=True).click)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_NAVERWORKS_MEMO,
+            test_cases=PATTERN_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Naverworks Memo Keyword Test")
 @pytest.mark.dependency(name="naverworks_memo_keyword")
-def test_naverworks_memo_keyword(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "naverworksstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 메일 페이지로 이동
-            page.goto(f"{NAVERWORKS_MAIL_URL}/")
-            time.sleep(3)
-
-            # 메일쓰기
-            with page.expect_popup() as page1_info:
-                page.get_by_role("link", name="메모쓰기").click()
-            page1 = page1_info.value
-            time.sleep(2)
-
-            # 제목 입력
-            page1.get_by_role("textbox", name="제목").fill("키워드로깅테스트")
-
-            # 본문 입력
-            editor_box = page1.locator("iframe").content_frame.locator(".workseditor-content")
-            editor_box.click()
-            editor_box.fill("\n".join(DLP_KEYWORDS))
-            time.sleep(1)
-
-            # 저장 클릭
-            page1.get_by_role("button", name="저장", exact=True).click()
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_NAVERWORKS_MEMO,
-                test_cases=KEYWORD_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_naverworks_memo_keyword(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("naverworks")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "naverworks_memo")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 메일 페이지로 이동
+        goto_and_wait(page, f"{NAVERWORKS_MAIL_URL}/")
+
+        # 메일쓰기
+        with page.expect_popup() as page1_info:
+            page.get_by_role("link", name="메모쓰기").click()
+        page1 = page1_info.value
+        time.sleep(2)
+
+        # 제목 입력
+        page1.get_by_role("textbox", name="제목").fill(f"키워드로깅테스트 {dlp_token}")
+
+        # 본문 입력
+        editor_box = page1.locator("iframe").content_frame.locator(".workseditor-content")
+        editor_box.click()
+        editor_box.fill("\n".join(DLP_KEYWORDS))
+        time.sleep(1)
+
+        # 저장 클릭 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page1, "naverworks_memo", page1.get_by_role("button", name="저장", exact=True).click)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_NAVERWORKS_MEMO,
+            test_cases=KEYWORD_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 
 @allure.severity(allure.severity_level.BLOCKER)
 @allure.step("Naverworks Memo Attach Test")
 @pytest.mark.dependency(name="naverworks_memo_attach")
-def test_naverworks_memo_attach(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "naverworksstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
+def test_naverworks_memo_attach(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("naverworks")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "naverworks_memo")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 메일 페이지로 이동
+        goto_and_wait(page, f"{NAVERWORKS_MAIL_URL}/")
+
+        # 메일쓰기
+        with page.expect_popup() as page1_info:
+            page.get_by_role("link", name="메모쓰기").click()
+        page1 = page1_info.value
+        time.sleep(2)
+
+        # 제목 입력
+        page1.get_by_role("textbox", name="제목").fill(f"첨부파일로깅테스트 {dlp_token}")
+
+        # 본문 입력
+        editor_box = page1.locator("iframe").content_frame.locator(".workseditor-content")
+        editor_box.click()
+        editor_box.fill("첨부파일로깅테스트")
+        time.sleep(1)
+
+        # 파일첨부 클릭
+        page1.get_by_role("button", name="파일첨부 파일첨부").click()
+        time.sleep(1)
+
+        # '내 PC' 클릭 → 파일 선택창 열리는 구간을 file chooser 로 처리
+        with page1.expect_file_chooser(timeout=5000) as fc_info:
+            page1.get_by_role("link", name="내 PC").click()
+        time.sleep(1)
+        file_chooser = fc_info.value
+        # 첨부 요청이 실제로 파일 크기만큼 나가는지 확인 (안 나가면 ES 대기 없이 바로 실패)
+        with expect_file_transmitted(page1, DLP_FILE):
+            file_chooser.set_files(DLP_FILE)
+        print(f"[DEBUG] 파일 첨부 완료: {DLP_FILE}")
+        time.sleep(2)
 
+        # 저장 클릭
         try:
-
-            # 세션 유지한 채로 메일 페이지로 이동
-            page.goto(f"{NAVERWORKS_MAIL_URL}/")
-            time.sleep(3)
-
-            # 메일쓰기
-            with page.expect_popup() as page1_info:
-                page.get_by_role("link", name="메모쓰기").click()
-            page1 = page1_info.value
-            time.sleep(2)
-
-            # 제목 입력
-            page1.get_by_role("textbox", name="제목").fill("첨부파일로깅테스트")
-
-            # 본문 입력
-            editor_box = page1.locator("iframe").content_frame.locator(".workseditor-content")
-            editor_box.click()
-            editor_box.fill("첨부파일로깅테스트")
-            time.sleep(1)
-
-            # 파일첨부 클릭
-            page1.get_by_role("button", name="파일첨부 파일첨부").click()
-            time.sleep(1)
-
-            # '내 PC' 클릭 → 파일 선택창 열리는 구간을 file chooser 로 처리
-            with page1.expect_file_chooser(timeout=5000) as fc_info:
-                page1.get_by_role("link", name="내 PC").click()
-            time.sleep(1)
-            file_chooser = fc_info.value
-            file_chooser.set_files(DLP_FILE)
-            print(f"[DEBUG] 파일 첨부 완료: {DLP_FILE}")
-            time.sleep(2)
-
-            # 저장 클릭
-            try:
-                page1.get_by_role("button", name="저장", exact=True).click(timeout=1500)
-                print("✔ [DEBUG] 보내기 클릭됨")
-            except:
-                print("▶ [DEBUG] 보내기 없음 → 스킵")
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_NAVERWORKS_MEMO,
-                test_cases=FILE_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
\ No newline at end of file
+            page1.get_by_role("button", name="저장", exact=True).click(timeout=1500)
+            print("✔ [DEBUG] 보내기 클릭됨")
+        except:
+            print("▶ [DEBUG] 보내기 없음 → 스킵")
+
+        # 대기
+        page.wait_for_timeout(5000)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_NAVERWORKS_MEMO,
+            test_cases=FILE_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
\ No newline at end of file
@@ -2,7 +2,7 @@ import os
 import time
 import allure
 import pytest
-from playwright.sync_api import sync_playwright,BrowserContext,TimeoutError
+from playwright.sync_api import BrowserContext,TimeoutError
 from base import *
 
 NORMAL_LOGGING_CASE = [
@@ -41,276 +41,299 @@ FILE_LOGGING_CASE = [
 @allure.step("Outlook Login Test")
 #@pytest.mark.order("first")
 @pytest.mark.dependency(name="outlook_login")
-def test_outlook_login(request):
-    with sync_playwright() as p:
-        # 브라우저 및 컨텍스트 생성
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
-        page = context.new_page()
-
-        try:
-            # 홈페이지 진입
-            goto_and_wait(page, f"{OUTLOOK_BASE_URL}/")
-
-            # 아이디 및 패스워드 입력
-            page.get_by_placeholder("전자 메일, 전화 또는 Skype").click()
-            page.get_by_placeholder("전자 메일, 전화 또는 Skype").fill(OUTLOOK_ID)
-            page.get_by_role("button", name="다음").click()
-            time.sleep(3)
-            page.get_by_role("button", name="암호 사용").click()
-            page.get_by_role("textbox", name="암호").click()
-            page.get_by_role("textbox", name="암호").fill(OUTLOOK_PASSWORD)
-            page.get_by_test_id("primaryButton").click()
-            page.get_by_test_id("secondaryButton").click()
-            time.sleep(3)
-
-            # 세션 상태 저장
-            os.makedirs("session", exist_ok=True)
-            session_path = os.path.join("session", "outlookstorageState.json")
-            context.storage_state(path=session_path)
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_outlook_login(request, browser):
+    # 저장된 벤더 세션이 아직 유효하면 UI 로그인 생략
+    if reuse_vendor_session(browser, "outlook"):
+        return
+
+    # 브라우저 및 컨텍스트 생성
+    context = browser.new_context()
+    apply_route_policy(context, "outlook_mail")
+    page = context.new_page()
+
+    try:
+        # 홈페이지 진입
+        goto_and_wait(page, f"{OUTLOOK_BASE_URL}/")
+
+        # 아이디 및 패스워드 입력
+        page.get_by_placeholder("전자 메일, 전화 또는 Skype").click()
+        page.get_by_placeholder("전자 메일, 전화 또는 Skype").fill(OUTLOOK_ID)
+        page.get_by_role("button", name="다음").click()
+        time.sleep(3)
+        page.get_by_role("button", name="암호 사용").click()
+        page.get_by_role("textbox", name="암호").click()
+        page.get_by_role("textbox", name="암호").fill(OUTLOOK_PASSWORD)
+        page.get_by_test_id("primaryButton").click()
+        page.get_by_test_id("secondaryButton").click()
+        time.sleep(3)
+
+        # 세션 상태 저장
+        save_vendor_session(context, "outlook")
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.NORMAL)
 @allure.step("Outlook Mail Normal Test")
 @pytest.mark.dependency(name="outlook_mail_normal")
-def test_outlook_mail_normal(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "outlookstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 메일 페이지로 이동
-            page.goto(f"{OUTLOOK_MAIL_URL}", wait_until="domcontentloaded")
-            time.sleep(5)
-
-            # 새 메일
-            page.get_by_role("button", name="새 메일").click()
-            time.sleep(1)
-
-            # 수신자 입력
-            page.get_by_label("받는 사람").click()
-            page.get_by_label("받는 사람", exact=True).fill(EMAIL_RECEIVER)
-            print("수신자 정보를 입력하였습니다.")
-
-            # 제목 입력
-            page.get_by_role("textbox", name="과목").click()
-            page.get_by_role("textbox", name="과목").fill("기본로깅테스트")
-
-            # 본문 입력
-            editor_box = page.get_by_role("textbox", name="메시지 본문")
-            editor_box.click()
-            editor_box.fill("\n".join(DLP_NORMAL))
-
-            # 보내기 클릭
-            page.get_by_role("button", name="보내기", exact=True).click()
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_OUTLOOK_MAIL,
-                test_cases=NORMAL_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_outlook_mail_normal(request, browser, dlp_token):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "outlook", "outlook_mail", f"{OUTLOOK_MAIL_URL}")
+
+    try:
+
+        # 세션 유지한 채로 메일 페이지로 이동
+        wait_for_ready(page)
+
+        # 새 메일
+        page.get_by_role("button", name="새 메일").click()
+        time.sleep(1)
+
+        # 수신자 입력
+        page.get_by_label("받는 사람").click()
+        page.get_by_label("받는 사람", exact=True).fill(EMAIL_RECEIVER)
+        print("수신자 정보를 입력하였습니다.")
+
+        # 제목 입력
+        page.get_by_role("textbox", name="과목").click()
+        page.get_by_role("textbox", name="과목").fill(f"기본로깅테스트 {dlp_token}")
+
+        # 본문 입력
+        editor_box = page.get_by_role("textbox", name="메시지 본문")
+        editor_box.click()
+        editor_box.fill("\n".join(DLP_NORMAL))
+
+        # 보내기 클릭 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page, "outlook_mail", page.get_by_role("button", name="보내기", exact=True).click)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_OUTLOOK_MAIL,
+            test_cases=NORMAL_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Outlook Mail Pattern Test")
 @pytest.mark.dependency(name="outlook_mail_pattern")
-def test_outlook_mail_pattern(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "outlookstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 메일 페이지로 이동
-            page.goto(f"{OUTLOOK_MAIL_URL}", wait_until="domcontentloaded")
-            time.sleep(5)
-
-            # 새 메일
-            page.get_by_role("button", name="새 메일").click()
-            time.sleep(1)
-
-            # 수신자 입력
-            page.get_by_label("받는 사람").click()
-            page.get_by_label("받는 사람", exact=True).fill(EMAIL_RECEIVER)
-            print("수신자 정보를 입력하였습니다.")
-
-            # 제목 입력
-            page.get_by_role("textbox", name="과목").click()
-            page.get_by_role("textbox", name="과목").fill("개인정보로깅테스트")
-
-            # 본문 입력
-            editor_box = page.get_by_role("textbox", name="메시지 본문")
-            editor_box.click()
-            editor_box.fill("\n".join(DLP_PATTERNS))
-
-            # 보내기 클릭
-            page.get_by_role("button", name="보내기", exact=True).click()
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_OUTLOOK_MAIL,
-                test_cases=PATTERN_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_outlook_mail_pattern(request, browser, dlp_token):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "outlook", "outlook_mail", f"{OUTLOOK_MAIL_URL}")
+
+    try:
+
+        # 세션 유지한 채로 메일 페이지로 이동
+        wait_for_ready(page)
+
+        # 새 메일
+        page.get_by_role("button", name="새 메일").click()
+        time.sleep(1)
+
+        # 수신자 입력
+        page.get_by_label("받는 사람").click()
+        page.get_by_label("받는 사람", exact=True).fill(EMAIL_RECEIVER)
+        print("수신자 정보를 입력하였습니다.")
+
+        # 제목 입력
+        page.get_by_role("textbox", name="과목").click()
+        page.get_by_role("textbox", name="과목").fill(f"개인정보로깅테스트 {dlp_token}")
+
+        # 본문 입력
+        editor_box = page.get_by_role("textbox", name="메시지 본문")
+        editor_box.click()
+        editor_box.fill("\n".join(DLP_PATTERNS))
+
+        # 보내기 클릭 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page, "outlook_mail", page.get_by_role("button", name="보내기", exact=True).click)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_OUTLOOK_MAIL,
+            test_cases=PATTERN_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Outlook Mail Keyword Test")
 @pytest.mark.dependency(name="outlook_keyword_mail")
-def test_outlook_mail_keyword(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "outlookstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 메일 페이지로 이동
-            page.goto(f"{OUTLOOK_MAIL_URL}", wait_until="domcontentloaded")
-            time.sleep(5)
-
-            # 새 메일
-            page.get_by_role("button", name="새 메일").click()
-            time.sleep(1)
-
-            # 수신자 입력
-            page.get_by_label("받는 사람").click()
-            page.get_by_label("받는 사람", exact=True).fill(EMAIL_RECEIVER)
-            print("수신자 정보를 입력하였습니다.")
-
-            # 제목 입력
-            page.get_by_role("textbox", name="과목").click()
-            page.get_by_role("textbox", name="과목").fill("키워드로깅테스트")
-
-            # 본문 입력
-            editor_box = page.get_by_role("textbox", name="메시지 본문")
-            editor_box.click()
-            editor_box.fill("\n".join(DLP_KEYWORDS))
-
-            # 보내기 클릭
-            page.get_by_role("button", name="보내기", exact=True).click()
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_OUTLOOK_MAIL,
-                test_cases=KEYWORD_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_outlook_mail_keyword(request, browser, dlp_token):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "outlook", "outlook_mail", f"{OUTLOOK_MAIL_URL}")
+
+    try:
+
+        # 세션 유지한 채로 메일 페이지로 이동
+        wait_for_ready(page)
+
+        # 새 메일
+        page.get_by_role("button", name="새 메일").click()
+        time.sleep(1)
+
+        # 수신자 입력
+        page.get_by_label("받는 사람").click()
+        page.get_by_label("받는 사람", exact=True).fill(EMAIL_RECEIVER)
+        print("수신자 정보를 입력하였습니다.")
+
+        # 제목 입력
+        page.get_by_role("textbox", name="과목").click()
+        page.get_by_role("textbox", name="과목").fill(f"키워드로깅테스트 {dlp_token}")
+
+        # 본문 입력
+        editor_box = page.get_by_role("textbox", name="메시지 본문")
+        editor_box.click()
+        editor_box.fill("\n".join(DLP_KEYWORDS))
+
+        # 보내기 클릭 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page, "outlook_mail", page.get_by_role("button", name="보내기", exact=True).click)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_OUTLOOK_MAIL,
+            test_cases=KEYWORD_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.BLOCKER)
 @allure.step("Outlook Mail Attach Test")
 @pytest.mark.dependency(name="outlook_mail_attach")
-def test_outlook_mail_attach(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "outlookstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 메일 페이지로 이동
-            page.goto(f"{OUTLOOK_MAIL_URL}", wait_until="domcontentloaded")
-            time.sleep(5)
-
-            # 새 메일
-            page.get_by_role("button", name="새 메일").click()
-            time.sleep(1)
-
-            # 수신자 입력
-            page.get_by_label("받는 사람").click()
-            page.get_by_label("받는 사람", exact=True).fill(EMAIL_RECEIVER)
-            print("수신자 정보를 입력하였습니다.")
-
-            # 제목 입력
-            page.get_by_role("textbox", name="과목").click()
-            page.get_by_role("textbox", name="과목").fill("첨부파일로깅테스트")
-
-            # 파일 첨부
-            page.get_by_role("tab", name="삽입").click()
-            time.sleep(1)
-            page.get_by_label("파일 첨부").click()
-            time.sleep(1)
-            file_input = page.locator("[data-testid='local-computer-filein']").first
+def test_outlook_mail_attach(request, browser, dlp_token):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "outlook", "outlook_mail", f"{OUTLOOK_MAIL_URL}")
+
+    try:
+
+        # 세션 유지한 채로 메일 페이지로 이동
+        wait_for_ready(page)
+
+        # 새 메일
+        page.get_by_role("button", name="새 메일").click()
+        time.sleep(1)
+
+        # 수신자 입력
+        page.get_by_label("받는 사람").click()
+        page.get_by_label("받는 사람", exact=True).fill(EMAIL_RECEIVER)
+        print("수신자 정보를 입력하였습니다.")
+
+        # 제목 입력
+        page.get_by_role("textbox", name="과목").click()
+        page.get_by_role("textbox", name="과목").fill(f"첨부파일로깅테스트 {dlp_token}")
+
+        # 파일 첨부
+        page.get_by_role("tab", name="삽입").click()
+        time.sleep(1)
+        page.get_by_label("파일 첨부").click()
+        time.sleep(1)
+        file_input = page.locator("[data-testid='local-computer-filein']").first
+        # 첨부 요청이 실제로 파일 크기만큼 나가는지 확인 (안 나가면 ES 대기 없이 바로 실패)
+        with expect_file_transmitted(page, DLP_FILE):
             file_input.set_input_files(DLP_FILE)
-            print("파일 첨부가 완료되었습니다.")
-            time.sleep(3)
-
-            # 보내기 클릭
-            safe_send_with_popup_retry(page)
-
-            # 대기
-            page.wait_for_timeout(10000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_OUTLOOK_MAIL,
-                test_cases=FILE_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+        print("파일 첨부가 완료되었습니다.")
+        time.sleep(3)
+
+        # 보내기 클릭 → 팝업은 뜨는 즉시 처리, 전송 요청 응답까지 대기
+        safe_send_with_popup_retry(page, service="outlook_mail")
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_OUTLOOK_MAIL,
+            test_cases=FILE_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
+
+
+@allure.severity(allure.severity_level.NORMAL)
+@allure.step("Outlook Mail Attach Sweep Test")
+@pytest.mark.skipif(not ATTACH_SWEEP_MODE, reason="ATTACH_SWEEP_MODE=false")
+@pytest.mark.parametrize("size_kb, kind", attach_sweep_cases("outlook_mail"))
+def test_outlook_mail_attach_sweep(request, browser, dlp_token, size_kb, kind):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "outlook", "outlook_mail", f"{OUTLOOK_MAIL_URL}")
+    files = [generate_sweep_file(size_kb, kind)]
+
+    try:
+        # 세션 유지한 채로 메일 페이지로 이동
+        wait_for_ready(page)
+
+        # 새 메일
+        page.get_by_role("button", name="새 메일").click()
+
+        # 수신자 입력
+        page.get_by_label("받는 사람").click()
+        page.get_by_label("받는 사람", exact=True).fill(EMAIL_RECEIVER)
+
+        # 제목 입력
+        page.get_by_role("textbox", name="과목").click()
+        page.get_by_role("textbox", name="과목").fill(f"첨부파일스윕테스트 {size_kb}KB {kind} {dlp_token}")
+
+        # 파일 첨부 (크기에 비례한 시간 안에 전송되는지 확인 + 업로드 시간 기록)
+        page.get_by_role("tab", name="삽입").click()
+        page.get_by_label("파일 첨부").click()
+        file_input = page.locator("[data-testid='local-computer-filein']").first
+        with expect_file_transmitted(page, files, timeout=sweep_upload_timeout_ms(size_kb)) as upload:
+            file_input.set_input_files(files)
+        print(f"파일 첨부가 완료되었습니다. ({size_kb}KB {kind})")
+
+        # 보내기 클릭 → 팝업은 뜨는 즉시 처리, 전송 요청 응답까지 대기
+        safe_send_with_popup_retry(page, service="outlook_mail")
+
+        # ===== 파일 로그 도착까지 짧은 간격으로 확인하고 크기별 시간 기록 =====
+        verify_and_record_sweep("outlook_mail", size_kb, kind, upload,
+                                service_names=SERVICE_NAMES_OUTLOOK_MAIL, test_cases=FILE_LOGGING_CASE, token=dlp_token)
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
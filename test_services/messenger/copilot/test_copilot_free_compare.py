@@ -2,7 +2,7 @@ import os
 import time
 import allure
 import pytest
-from playwright.sync_api import sync_playwright,TimeoutError
+from playwright.sync_api import TimeoutError
 from base import *
 from pathlib import Path
 
@@ -41,232 +41,233 @@ FILE_LOGGING_CASE = [
 
 @allure.severity(allure.severity_level.TRIVIAL)
 @allure.step("Copilot Free Login Test")
-def test_copilot_free_login(request):
-    with sync_playwright() as p:
-        # 브라우저 및 컨텍스트 생성
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
-        page = context.new_page()
-
-        try:
-            # 코파일럿 홈페이지 진입
-            page.goto(f"{COPILOT_BASE_URL}/")
-            time.sleep(3)
-
-            # 로그인 버튼 클릭
-            page.get_by_test_id("composer-input").click()
-            page.get_by_test_id("sidebar-settings-button").click()
-            page.get_by_test_id("connect-account-button").click()
-            page.get_by_test_id("msa-sign-in-button").click()
-
-
-            # 아이디 및 패스워드 입력
-            id_box = page.get_by_role("textbox", name="전자 메일, 전화 또는 Skype를 입력하세요")
-            id_box.fill(COPILOT_ID)
-            page.get_by_role("button", name="다음").click()
-            time.sleep(1)
-            page.get_by_role("button", name="암호 사용").click()
-            time.sleep(1)
-            pw_box = page.get_by_role("textbox", name="암호")
-            pw_box.fill(COPILOT_PASSWORD)
-            time.sleep(1)
-            page.get_by_test_id("primaryButton").click()
-            time.sleep(1)
-            page.get_by_test_id("secondaryButton").click()
-            time.sleep(3)
-
-            # 세션 상태 저장
-            os.makedirs("session", exist_ok=True)
-            session_path = os.path.join("session", "copilotfreestorageState.json")
-            context.storage_state(path=session_path)
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_copilot_free_login(request, browser):
+    # 저장된 벤더 세션이 아직 유효하면 UI 로그인 생략
+    if reuse_vendor_session(browser, "copilot"):
+        return
+
+    # 브라우저 및 컨텍스트 생성
+    context = browser.new_context()
+    apply_route_policy(context, "copilot")
+    page = context.new_page()
+
+    try:
+        # 코파일럿 홈페이지 진입
+        page.goto(f"{COPILOT_BASE_URL}/")
+        time.sleep(3)
+
+        # 로그인 버튼 클릭
+        page.get_by_test_id("composer-input").click()
+        page.get_by_test_id("sidebar-settings-button").click()
+        page.get_by_test_id("connect-account-button").click()
+        page.get_by_test_id("msa-sign-in-button").click()
+
+
+        # 아이디 및 패스워드 입력
+        id_box = page.get_by_role("textbox", name="전자 메일, 전화 또는 Skype를 입력하세요")
+        id_box.fill(COPILOT_ID)
+        page.get_by_role("button", name="다음").click()
+        time.sleep(1)
+        page.get_by_role("button", name="암호 사용").click()
+        time.sleep(1)
+        pw_box = page.get_by_role("textbox", name="암호")
+        pw_box.fill(COPILOT_PASSWORD)
+        time.sleep(1)
+        page.get_by_test_id("primaryButton").click()
+        time.sleep(1)
+        page.get_by_test_id("secondaryButton").click()
+        time.sleep(3)
+
+        # 세션 상태 저장
+        save_vendor_session(context, "copilot")
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 
 @allure.severity(allure.severity_level.NORMAL)
 @allure.step("Copilot Free Normal Test")
-def test_copilot_free_normal(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "copilotfreestorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
+def test_copilot_free_normal(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("copilot")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "copilot")
+    page = context.new_page()
 
-        try:
+    try:
 
-            # 세션 유지한 채로 메신저 페이지로 이동
-            page.goto(f"{COPILOT_BASE_URL}")
-            time.sleep(3)
+        # 세션 유지한 채로 메신저 페이지로 이동
+        page.goto(f"{COPILOT_BASE_URL}")
+        time.sleep(3)
 
-            # 새 채팅 열기
-            page.get_by_role("button", name="새로운 채팅 시작").click()
-            time.sleep(1)
+        # 새 채팅 열기
+        page.get_by_role("button", name="새로운 채팅 시작").click()
+        time.sleep(1)
 
-            # 메시지 입력
-            page.get_by_test_id("composer-input").fill("\n".join(DLP_NORMAL))
-            time.sleep(1)
+        # 메시지 입력
+        page.get_by_test_id("composer-input").fill("\n".join(DLP_NORMAL + [dlp_token]))
+        time.sleep(1)
 
-            # 메시지 전송
-            page.get_by_test_id("submit-button").click()
-            time.sleep(5)
+        # 메시지 전송
+        page.get_by_test_id("submit-button").click()
+        time.sleep(5)
 
-            # 대기
-            page.wait_for_timeout(5000)
+        # 대기
+        page.wait_for_timeout(5000)
 
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_COPILOT,
-                test_cases=NORMAL_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_COPILOT,
+            test_cases=NORMAL_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
 
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
-        finally:
-            browser.close()
+    finally:
+        context.close()
 
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Copilot Free Pattern Test")
-def test_copilot_free_pattern(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "copilotfreestorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 메신저 페이지로 이동
-            page.goto(f"{COPILOT_BASE_URL}")
-            time.sleep(3)
-
-            # 새 채팅 열기
-            page.get_by_role("button", name="새로운 채팅 시작").click()
-            time.sleep(1)
-
-            # 메시지 입력
-            page.get_by_test_id("composer-input").fill("\n".join(DLP_PATTERNS))
-            time.sleep(1)
-
-            # 메시지 전송
-            page.get_by_test_id("submit-button").click()
-            time.sleep(5)
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_COPILOT,
-                test_cases=PATTERN_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-        finally:
-            browser.close()
+def test_copilot_free_pattern(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("copilot")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "copilot")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 메신저 페이지로 이동
+        page.goto(f"{COPILOT_BASE_URL}")
+        time.sleep(3)
+
+        # 새 채팅 열기
+        page.get_by_role("button", name="새로운 채팅 시작").click()
+        time.sleep(1)
+
+        # 메시지 입력
+        page.get_by_test_id("composer-input").fill("\n".join(DLP_PATTERNS + [dlp_token]))
+        time.sleep(1)
+
+        # 메시지 전송
+        page.get_by_test_id("submit-button").click()
+        time.sleep(5)
+
+        # 대기
+        page.wait_for_timeout(5000)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_COPILOT,
+            test_cases=PATTERN_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+    finally:
+        context.close()
 
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Copilot Free Keyword Test")
-def test_copilot_free_keyword(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "copilotfreestorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 메신저 페이지로 이동
-            page.goto(f"{COPILOT_BASE_URL}")
-            time.sleep(3)
-
-            # 새 채팅 열기
-            page.get_by_role("button", name="새로운 채팅 시작").click()
-            time.sleep(1)
-
-            # 메시지 입력
-            page.get_by_test_id("composer-input").fill("\n".join(DLP_KEYWORDS))
-            time.sleep(1)
-
-            # 메시지 전송
-            page.get_by_test_id("submit-button").click()
-            time.sleep(5)
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_COPILOT,
-                test_cases=KEYWORD_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_copilot_free_keyword(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("copilot")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "copilot")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 메신저 페이지로 이동
+        page.goto(f"{COPILOT_BASE_URL}")
+        time.sleep(3)
+
+        # 새 채팅 열기
+        page.get_by_role("button", name="새로운 채팅 시작").click()
+        time.sleep(1)
+
+        # 메시지 입력
+        page.get_by_test_id("composer-input").fill("\n".join(DLP_KEYWORDS + [dlp_token]))
+        time.sleep(1)
+
+        # 메시지 전송
+        page.get_by_test_id("submit-button").click()
+        time.sleep(5)
+
+        # 대기
+        page.wait_for_timeout(5000)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_COPILOT,
+            test_cases=KEYWORD_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Copilot Free Attach Test")
-def test_copilot_free_attach(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "copilotfreestorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 메신저 페이지로 이동
-            page.goto(f"{COPILOT_BASE_URL}")
-            time.sleep(3)
-
-            # 새 채팅 열기
-            page.get_by_role("button", name="새로운 채팅 시작").click()
-            time.sleep(1)
-
-            # 파일 첨부
-            # 1) 첨부 UI 열기
-            page.get_by_test_id("composer-create-button").click()
-            time.sleep(0.5)
-
-            # 2) file chooser 기다리기 → 클릭
-            with page.expect_file_chooser(timeout=5000) as fc_info:
-                page.get_by_test_id("add-images-files").click()
-            time.sleep(1)
-            # 3) file chooser 객체 얻기
-            file_chooser = fc_info.value
-            time.sleep(1)
-            # 4) 파일 첨부
+def test_copilot_free_attach(request, browser):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("copilot")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "copilot")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 메신저 페이지로 이동
+        page.goto(f"{COPILOT_BASE_URL}")
+        time.sleep(3)
+
+        # 새 채팅 열기
+        page.get_by_role("button", name="새로운 채팅 시작").click()
+        time.sleep(1)
+
+        # 파일 첨부
+        # 1) 첨부 UI 열기
+        page.get_by_test_id("composer-create-button").click()
+        time.sleep(0.5)
+
+        # 2) file chooser 기다리기 → 클릭
+        with page.expect_file_chooser(timeout=5000) as fc_info:
+            page.get_by_test_id("add-images-files").click()
+        time.sleep(1)
+        # 3) file chooser 객체 얻기
+        file_chooser = fc_info.value
+        time.sleep(1)
+        # 4) 파일 첨부 ~ 메시지 전송 사이에 파일 크기만큼의 요청이 나가는지 확인 (안 나가면 바로 실패)
+        with expect_file_transmitted(page, DLP_FILE):
             file_chooser.set_files(DLP_FILE)
             time.sleep(5)
 
@@ -277,22 +278,88 @@ def test_copilot_free_attach(request):
             except:
                 print("▶ [DEBUG] 완료 없음 → 스킵")
 
-            # 대기
-            page.wait_for_timeout(10000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_COPILOT,
-                test_cases=FILE_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
\ No newline at end of file
+        # 대기
+        page.wait_for_timeout(10000)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_COPILOT,
+            test_cases=FILE_LOGGING_CASE,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
+
+@allure.severity(allure.severity_level.NORMAL)
+@allure.step("Copilot Free Prompt Sweep Test")
+@pytest.mark.skipif(not COPILOT_SWEEP_MODE, reason="COPILOT_SWEEP_MODE=false")
+@pytest.mark.parametrize("size_kb, unit_every_kb", prompt_sweep_cases())
+def test_copilot_free_prompt_sweep(request, browser, dlp_token, size_kb, unit_every_kb):
+    # 패턴 + 키워드 블록을 unit_every_kb 마다 반복한 프롬프트 (기대값은 블록 1개 기대값 × 블록 수)
+    body, expected = build_large_body(
+        size_kb,
+        DLP_PATTERNS + DLP_KEYWORDS,
+        {
+            "pattern_count": int(PATTERN_LOGGING_CASE[0]["expected"]["pattern_count"]),
+            "keyword_count": int(KEYWORD_LOGGING_CASE[0]["expected"]["keyword_count"]),
+        },
+        unit_every_kb=unit_every_kb,
+    )
+    # 로그 본문이 잘려도 토큰은 남도록 맨 앞에 둔다
+    prompt = f"{dlp_token}\n{body}"
+
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("copilot")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "copilot")
+    page = context.new_page()
+
+    # 프롬프트는 WebSocket 프레임으로 나가므로 페이지 진입 전에 전송량 수집 시작
+    tracker = OutgoingTracker(page)
+
+    try:
+
+        # 세션 유지한 채로 메신저 페이지로 이동
+        page.goto(f"{COPILOT_BASE_URL}")
+        time.sleep(3)
+
+        # 새 채팅 열기
+        page.get_by_role("button", name="새로운 채팅 시작").click()
+        time.sleep(1)
+
+        # 입력창 한도(maxlength)를 넘는 프롬프트는 잘려서 기대값이 맞지 않으므로 skip
+        composer = page.get_by_test_id("composer-input")
+        max_chars = input_char_limit(composer)
+        if max_chars and len(prompt) > max_chars:
+            pytest.skip(f"프롬프트 {len(prompt)}자 > 입력창 한도 {max_chars}자")
+
+        # 프롬프트 입력 (키 입력 단위 fill 대신 insertText 한 번)
+        insert = insert_text_fast(composer, prompt)
+
+        # 메시지 전송 → 프롬프트 크기만큼 나갈 때까지 대기 (안 나가면 바로 실패)
+        tracker.mark()
+        page.get_by_test_id("submit-button").click()
+        outgoing = tracker.wait_transmitted(len(prompt.encode("utf-8")))
+
+        # ===== DUT 로그 도착까지 짧은 간격으로 재시도 (도착 시간 + 검출 수 확인) =====
+        verify_and_record_prompt_sweep(
+            "copilot", size_kb, unit_every_kb, prompt, insert, outgoing, expected,
+            service_names=SERVICE_NAMES_COPILOT,
+            token=dlp_token,
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
@@ -2,7 +2,7 @@ import os
 import time
 import allure
 import pytest
-from playwright.sync_api import sync_playwright,TimeoutError
+from playwright.sync_api import TimeoutError
 from base import *
 from pathlib import Path
 
@@ -40,223 +40,293 @@ FILE_LOGGING_CASE = [
 
 @allure.severity(allure.severity_level.TRIVIAL)
 @allure.step("Dooray Login Test")
-def test_dooray_login(request):
-    with sync_playwright() as p:
-        # 브라우저 및 컨텍스트 생성
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
-        page = context.new_page()
-
-        try:
-            # 두레이 홈페이지 진입
-            page.goto(f"{DOORAY_BASE_URL}/")
-            time.sleep(3)
-
-
-            # 아이디 및 패스워드 입력
-            page.get_by_placeholder("아이디").click()
-            page.get_by_placeholder("아이디").fill(DOORAY_ID)
-            page.get_by_placeholder("비밀번호").click()
-            page.get_by_placeholder("비밀번호").fill(DOORAY_PASSWORD)
-            time.sleep(1)
-            page.get_by_role("button", name="로그인").click()
-            time.sleep(3)
-
-            # 세션 상태 저장
-            os.makedirs("session", exist_ok=True)
-            session_path = os.path.join("session", "dooraystorageState.json")
-            context.storage_state(path=session_path)
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_dooray_login(request, browser):
+    # 저장된 벤더 세션이 아직 유효하면 UI 로그인 생략
+    if reuse_vendor_session(browser, "dooray"):
+        return
+
+    # 브라우저 및 컨텍스트 생성
+    context = browser.new_context()
+    apply_route_policy(context, "dooray_messenger")
+    page = context.new_page()
+
+    try:
+        # 두레이 홈페이지 진입
+        page.goto(f"{DOORAY_BASE_URL}/")
+        time.sleep(3)
+
+
+        # 아이디 및 패스워드 입력
+        page.get_by_placeholder("아이디").click()
+        page.get_by_placeholder("아이디").fill(DOORAY_ID)
+        page.get_by_placeholder("비밀번호").click()
+        page.get_by_placeholder("비밀번호").fill(DOORAY_PASSWORD)
+        time.sleep(1)
+        page.get_by_role("button", name="로그인").click()
+        time.sleep(3)
+
+        # 세션 상태 저장
+        save_vendor_session(context, "dooray")
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 
 @allure.severity(allure.severity_level.NORMAL)
 @allure.step("Dooray Messenger Normal Test")
-def test_dooray_messenger_normal(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "dooraystorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
+@pytest.mark.skipif(MULTI_TAB_SENDS, reason="MULTI_TAB_SENDS 모드에서는 test_dooray_messenger_multitab 에서 함께 전송")
+def test_dooray_messenger_normal(request, browser, dlp_token):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "dooray", "dooray_messenger", f"{DOORAY_BASE_URL}/messenger")
 
-        try:
+    try:
 
-            # 세션 유지한 채로 메신저 페이지로 이동
-            page.goto(f"{DOORAY_BASE_URL}/messenger")
-            time.sleep(3)
+        # 세션 유지한 채로 메신저 페이지로 이동
+        wait_for_ready(page)
 
 
-            # 메시지 입력
-            page.locator("textarea").fill("\n".join(DLP_NORMAL))
-            time.sleep(3)
+        # 메시지 입력
+        page.locator("textarea").fill("\n".join(DLP_NORMAL + [dlp_token]))
+        time.sleep(3)
 
-            # Enter로 메시지 전송
-            page.locator("textarea").press("Enter")
-            print("✔ [DEBUG] Enter 키로 메시지 전송 완료")
+        # Enter로 메시지 전송 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page, "dooray_messenger", lambda: page.locator("textarea").press("Enter"))
+        print("✔ [DEBUG] Enter 키로 메시지 전송 완료")
 
-            # 대기
-            page.wait_for_timeout(5000)
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DOORAY_MESSENGER,
+            test_cases=NORMAL_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
 
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_DOORAY_MESSENGER,
-                test_cases=NORMAL_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+    finally:
+        context.close()
 
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Dooray Messenger Pattern Test")
-def test_dooray_messenger_pattern(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "dooraystorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
+@pytest.mark.skipif(MULTI_TAB_SENDS, reason="MULTI_TAB_SENDS 모드에서는 test_dooray_messenger_multitab 에서 함께 전송")
+def test_dooray_messenger_pattern(request, browser, dlp_token):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "dooray", "dooray_messenger", f"{DOORAY_BASE_URL}/messenger")
 
-            # 세션 유지한 채로 메신저 페이지로 이동
-            page.goto(f"{DOORAY_BASE_URL}/messenger")
-            time.sleep(3)
+    try:
 
+        # 세션 유지한 채로 메신저 페이지로 이동
+        wait_for_ready(page)
 
-            # 메시지 입력
-            page.locator("textarea").fill("\n".join(DLP_PATTERNS))
-            time.sleep(3)
 
-            # Enter로 메시지 전송
-            page.locator("textarea").press("Enter")
-            print("✔ [DEBUG] Enter 키로 메시지 전송 완료")
+        # 메시지 입력
+        page.locator("textarea").fill("\n".join(DLP_PATTERNS + [dlp_token]))
+        time.sleep(3)
 
-            # 대기
-            page.wait_for_timeout(5000)
+        # Enter로 메시지 전송 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page, "dooray_messenger", lambda: page.locator("textarea").press("Enter"))
+        print("✔ [DEBUG] Enter 키로 메시지 전송 완료")
 
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_DOORAY_MESSENGER,
-                test_cases=PATTERN_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DOORAY_MESSENGER,
+            test_cases=PATTERN_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
 
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
-        finally:
-            browser.close()
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Dooray Messenger Keyword Test")
-def test_dooray_messenger_keyword(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "dooraystorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
+@pytest.mark.skipif(MULTI_TAB_SENDS, reason="MULTI_TAB_SENDS 모드에서는 test_dooray_messenger_multitab 에서 함께 전송")
+def test_dooray_messenger_keyword(request, browser, dlp_token):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "dooray", "dooray_messenger", f"{DOORAY_BASE_URL}/messenger")
+
+    try:
 
-        try:
+        # 세션 유지한 채로 메신저 페이지로 이동
+        wait_for_ready(page)
 
-            # 세션 유지한 채로 메신저 페이지로 이동
-            page.goto(f"{DOORAY_BASE_URL}/messenger")
-            time.sleep(3)
 
+        # 메시지 입력
+        page.locator("textarea").fill("\n".join(DLP_KEYWORDS + [dlp_token]))
+        time.sleep(3)
 
-            # 메시지 입력
-            page.locator("textarea").fill("\n".join(DLP_KEYWORDS))
-            time.sleep(3)
+        # Enter로 메시지 전송 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page, "dooray_messenger", lambda: page.locator("textarea").press("Enter"))
+        print("✔ [DEBUG] Enter 키로 메시지 전송 완료")
 
-            # Enter로 메시지 전송
-            page.locator("textarea").press("Enter")
-            print("✔ [DEBUG] Enter 키로 메시지 전송 완료")
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DOORAY_MESSENGER,
+            test_cases=KEYWORD_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
 
-            # 대기
-            page.wait_for_timeout(5000)
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_DOORAY_MESSENGER,
-                test_cases=KEYWORD_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
+    finally:
+        context.close()
 
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
 
-        finally:
-            browser.close()
+@allure.severity(allure.severity_level.CRITICAL)
+@allure.step("Dooray Messenger Multi Tab Test")
+@pytest.mark.skipif(not MULTI_TAB_SENDS, reason="MULTI_TAB_SENDS=true 일 때만 실행")
+def test_dooray_messenger_multitab(request, browser):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성 (탭은 케이스마다 하나씩)
+    context = browser.new_context(storage_state=get_session_path("dooray"))
+    apply_route_policy(context, "dooray_messenger")
+
+    def prepare(lines):
+        def fill(page, token):
+            page.locator("textarea").fill("\n".join(lines + [token]))
+        return fill
+
+    def send(page):
+        page.locator("textarea").press("Enter")
+
+    # 첨부는 본문 텍스트가 없으므로 파일 이름에 토큰을 넣어 ES 문서를 케이스별로 찾는다
+    # (업로드는 '이미지 전송' 클릭과 함께 나가므로 첨부 ~ 전송 전체를 send 단계에서 수행)
+    attach_files = {}
+
+    def prepare_attach(page, token):
+        with open(DLP_FILE_SINGLE, "rb") as f:
+            attach_files[page] = {
+                "name": f"{token}_{Path(DLP_FILE_SINGLE).name}",
+                "mimeType": "image/jpeg",
+                "buffer": f.read(),
+            }
+
+    def send_attach(page):
+        payload = attach_files[page]
+        with page.expect_file_chooser(timeout=5000) as fc_info:
+            page.locator('button:has(i[name="paperclip"])').click()
+        with expect_file_transmitted(page, payload):
+            fc_info.value.set_files(payload)
+            page.get_by_role("button", name="이미지 전송").click()
+
+    try:
+        # 기본/패턴/키워드/첨부를 탭 4개에서 준비 → 연달아 전송 → 토큰별 ES 검증
+        run_multi_tab_sends(
+            context,
+            "dooray_messenger",
+            f"{DOORAY_BASE_URL}/messenger",
+            SERVICE_NAMES_DOORAY_MESSENGER,
+            [
+                {"label": "기본 로깅", "test_cases": NORMAL_LOGGING_CASE, "prepare": prepare(DLP_NORMAL), "send": send},
+                {"label": "패턴 로깅", "test_cases": PATTERN_LOGGING_CASE, "prepare": prepare(DLP_PATTERNS), "send": send},
+                {"label": "키워드 로깅", "test_cases": KEYWORD_LOGGING_CASE, "prepare": prepare(DLP_KEYWORDS), "send": send},
+                {"label": "파일 로깅", "test_cases": FILE_LOGGING_CASE, "prepare": prepare_attach, "send": send_attach},
+            ],
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(context.pages[0] if context.pages else None, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
+
+
+@allure.severity(allure.severity_level.NORMAL)
+@allure.step("Dooray Messenger Burst Test")
+@pytest.mark.skipif(not BURST_MODE, reason="BURST_MODE=true 일 때만 실행")
+def test_dooray_messenger_burst(request, browser):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "dooray", "dooray_messenger", f"{DOORAY_BASE_URL}/messenger")
+
+    try:
+
+        # 세션 유지한 채로 메신저 페이지로 이동
+        wait_for_ready(page)
+
+        # 고유 토큰을 단 메시지 BURST_COUNT 건을 BURST_RATE_PER_SEC 속도로 전송 → ES 문서 수 / 도착 시간 집계
+        run_message_burst(
+            page,
+            "dooray_messenger",
+            SERVICE_NAMES_DOORAY_MESSENGER,
+            fill=lambda p, text: p.locator("textarea").fill(text),
+            send=lambda p: p.locator("textarea").press("Enter"),
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 
 @allure.severity(allure.severity_level.BLOCKER)
 @allure.step("Dooray Messenger Attach Test")
-def test_dooray_messenger_attach(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "dooraystorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 메신저 페이지로 이동
-            page.goto(f"{DOORAY_BASE_URL}/messenger")
-            time.sleep(3)
-
-            # 1. 첨부할 파일 경로 (예: DLP_FILE_SINGLE 사용)
-            file_path = str(Path(DLP_FILE_SINGLE).resolve())
-
-            with page.expect_file_chooser(timeout=5000) as fc_info:
-                page.locator('button:has(i[name="paperclip"])').click()
-            time.sleep(1)
-            file_chooser = fc_info.value
+def test_dooray_messenger_attach(request, browser):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "dooray", "dooray_messenger", f"{DOORAY_BASE_URL}/messenger")
+
+    try:
+
+        # 세션 유지한 채로 메신저 페이지로 이동
+        wait_for_ready(page)
+
+        # 1. 첨부할 파일 경로 (예: DLP_FILE_SINGLE 사용)
+        file_path = str(Path(DLP_FILE_SINGLE).resolve())
+
+        with page.expect_file_chooser(timeout=5000) as fc_info:
+            page.locator('button:has(i[name="paperclip"])').click()
+        time.sleep(1)
+        file_chooser = fc_info.value
+        # 첨부 ~ '이미지 전송' 클릭 사이에 파일 크기만큼의 요청이 나가는지 확인 (안 나가면 바로 실패)
+        with expect_file_transmitted(page, file_path):
             file_chooser.set_files(file_path)
             time.sleep(2)
             page.get_by_role("button", name="이미지 전송").click()
-            print(f"[DEBUG] 파일 첨부 완료: {file_path}")
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_DOORAY_MESSENGER,
-                test_cases=FILE_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
\ No newline at end of file
+        print(f"[DEBUG] 파일 첨부 완료: {file_path}")
+
+        # 대기
+        page.wait_for_timeout(5000)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DOORAY_MESSENGER,
+            test_cases=FILE_LOGGING_CASE,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
\ No newline at end of file
@@ -2,7 +2,7 @@ import os
 import time
 import allure
 import pytest
-from playwright.sync_api import sync_playwright,BrowserContext,TimeoutError
+from playwright.sync_api import BrowserContext,TimeoutError
 from base import *
 
 NORMAL_LOGGING_CASE = [
@@ -41,228 +41,234 @@ FILE_LOGGING_CASE = [
 @allure.step("Naverworks Login Test")
 #@pytest.mark.order("first")
 @pytest.mark.dependency(name="naverworks_login")
-def test_naverworks_login(request):
-    with sync_playwright() as p:
-        # 브라우저 및 컨텍스트 생성
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
-        page = context.new_page()
-
-        try:
-            # 네이버웍스 홈페이지 진입
-            goto_and_wait(page, f"{NAVERWORKS_BASE_URL}")
-
-            # 아이디 및 패스워드 입력
-            with page.expect_popup() as page1_info:
-                page.get_by_role("link", name="로그인", exact=True).click()
-            page1 = page1_info.value
-            time.sleep(1)
-            page1.get_by_placeholder("또는 id@group.xxx").click()
-            page1.get_by_placeholder("또는 id@group.xxx").fill(NAVERWORKS_ID)
-            page1.get_by_role("button", name="로그인", exact=True).click()
-            time.sleep(1)
-            page1.get_by_placeholder("비밀번호").click()
-            page1.get_by_placeholder("비밀번호").fill(NAVERWORKS_PASSWORD)
-            time.sleep(1)
-            page1.get_by_role("button", name="로그인").click()
-            time.sleep(3)
-
-            # 세션 상태 저장
-            os.makedirs("session", exist_ok=True)
-            session_path = os.path.join("session", "naverworksstorageState.json")
-            context.storage_state(path=session_path)
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_naverworks_login(request, browser):
+    # 저장된 벤더 세션이 아직 유효하면 UI 로그인 생략
+    if reuse_vendor_session(browser, "naverworks"):
+        return
+
+    # 브라우저 및 컨텍스트 생성
+    context = browser.new_context()
+    apply_route_policy(context, "naverworks_messenger")
+    page = context.new_page()
+
+    try:
+        # 네이버웍스 홈페이지 진입
+        goto_and_wait(page, f"{NAVERWORKS_BASE_URL}")
+
+        # 아이디 및 패스워드 입력
+        with page.expect_popup() as page1_info:
+            page.get_by_role("link", name="로그인", exact=True).click()
+        page1 = page1_info.value
+        time.sleep(1)
+        page1.get_by_placeholder("또는 id@group.xxx").click()
+        page1.get_by_placeholder("또는 id@group.xxx").fill(NAVERWORKS_ID)
+        page1.get_by_role("button", name="로그인", exact=True).click()
+        time.sleep(1)
+        page1.get_by_placeholder("비밀번호").click()
+        page1.get_by_placeholder("비밀번호").fill(NAVERWORKS_PASSWORD)
+        time.sleep(1)
+        page1.get_by_role("button", name="로그인").click()
+        time.sleep(3)
+
+        # 세션 상태 저장
+        save_vendor_session(context, "naverworks")
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 
 @allure.severity(allure.severity_level.NORMAL)
 @allure.step("Naverworks Messenger Normal Test")
 @pytest.mark.dependency(name="naverworks_messenger_normal")
-def test_naverworks_messenger_normal(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "naverworksstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
+def test_naverworks_messenger_normal(request, browser, dlp_token):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "naverworks", "naverworks_messenger", f"{NAVERWORKS_MESSENGER_URL}/")
 
-        try:
+    try:
 
-            # 세션 유지한 채로 메신저 페이지로 이동
-            page.goto(f"{NAVERWORKS_MESSENGER_URL}/")
-            time.sleep(3)
+        # 세션 유지한 채로 메신저 페이지로 이동
+        wait_for_ready(page)
 
-            # 메시지 입력
-            editor_box = page.locator("#message-input")
-            editor_box.fill("\n".join(DLP_NORMAL))
+        # 메시지 입력
+        editor_box = page.locator("#message-input")
+        editor_box.fill("\n".join(DLP_NORMAL + [dlp_token]))
 
-            # Enter로 메시지 전송
-            page.keyboard.press("Enter")
-            print("✔ [DEBUG] Enter 키로 메시지 전송 완료")
+        # Enter로 메시지 전송 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page, "naverworks_messenger", lambda: page.keyboard.press("Enter"))
+        print("✔ [DEBUG] Enter 키로 메시지 전송 완료")
 
-            # 대기
-            page.wait_for_timeout(5000)
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_NAVERWORKS_MESSENGER,
+            test_cases=NORMAL_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
 
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_NAVERWORKS_MESSENGER,
-                test_cases=NORMAL_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+    finally:
+        context.close()
 
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Naverworks Messenger Pattern Test")
 @pytest.mark.dependency(name="naverworks_messenger_pattern")
-def test_naverworks_messenger_pattern(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "naverworksstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
+def test_naverworks_messenger_pattern(request, browser, dlp_token):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "naverworks", "naverworks_messenger", f"{NAVERWORKS_MESSENGER_URL}/")
 
-            # 세션 유지한 채로 메신저 페이지로 이동
-            page.goto(f"{NAVERWORKS_MESSENGER_URL}/")
-            time.sleep(3)
+    try:
 
-            # 메시지 입력
-            editor_box = page.locator("#message-input")
-            editor_box.fill("\n".join(DLP_PATTERN))
+        # 세션 유지한 채로 메신저 페이지로 이동
+        wait_for_ready(page)
 
-            # Enter로 메시지 전송
-            page.keyboard.press("Enter")
-            print("✔ [DEBUG] Enter 키로 메시지 전송 완료")
+        # 메시지 입력
+        editor_box = page.locator("#message-input")
+        editor_box.fill("\n".join(DLP_PATTERN + [dlp_token]))
 
-            # 대기
-            page.wait_for_timeout(5000)
+        # Enter로 메시지 전송 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page, "naverworks_messenger", lambda: page.keyboard.press("Enter"))
+        print("✔ [DEBUG] Enter 키로 메시지 전송 완료")
 
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_NAVERWORKS_MESSENGER,
-                test_cases=PATTERN_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_NAVERWORKS_MESSENGER,
+            test_cases=PATTERN_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
 
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
-        finally:
-            browser.close()
+    finally:
+        context.close()
 
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Naverworks Messenger Keyword Test")
 @pytest.mark.dependency(name="naverworks_messenger_keyword")
-def test_naverworks_messenger_keyword(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "naverworksstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 메신저 페이지로 이동
-            page.goto(f"{NAVERWORKS_MESSENGER_URL}/")
-            time.sleep(3)
-
-            # 메시지 입력
-            editor_box = page.locator("#message-input")
-            editor_box.fill("\n".join(DLP_KEYWORDS))
-
-            # Enter로 메시지 전송
-            page.keyboard.press("Enter")
-            print("✔ [DEBUG] Enter 키로 메시지 전송 완료")
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_NAVERWORKS_MESSENGER,
-                test_cases=KEYWORD_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_naverworks_messenger_keyword(request, browser, dlp_token):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "naverworks", "naverworks_messenger", f"{NAVERWORKS_MESSENGER_URL}/")
+
+    try:
+
+        # 세션 유지한 채로 메신저 페이지로 이동
+        wait_for_ready(page)
+
+        # 메시지 입력
+        editor_box = page.locator("#message-input")
+        editor_box.fill("\n".join(DLP_KEYWORDS + [dlp_token]))
+
+        # Enter로 메시지 전송 → 전송 요청 응답까지 대기
+        send_and_wait_for_request(page, "naverworks_messenger", lambda: page.keyboard.press("Enter"))
+        print("✔ [DEBUG] Enter 키로 메시지 전송 완료")
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_NAVERWORKS_MESSENGER,
+            test_cases=KEYWORD_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
+
+@allure.severity(allure.severity_level.NORMAL)
+@allure.step("Naverworks Messenger Burst Test")
+@pytest.mark.skipif(not BURST_MODE, reason="BURST_MODE=true 일 때만 실행")
+def test_naverworks_messenger_burst(request, browser):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "naverworks", "naverworks_messenger", f"{NAVERWORKS_MESSENGER_URL}/")
+
+    try:
+
+        # 세션 유지한 채로 메신저 페이지로 이동
+        wait_for_ready(page)
+
+        # 고유 토큰을 단 메시지 BURST_COUNT 건을 BURST_RATE_PER_SEC 속도로 전송 → ES 문서 수 / 도착 시간 집계
+        run_message_burst(
+            page,
+            "naverworks_messenger",
+            SERVICE_NAMES_NAVERWORKS_MESSENGER,
+            fill=lambda p, text: p.locator("#message-input").fill(text),
+            send=lambda p: p.keyboard.press("Enter"),
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.BLOCKER)
 @allure.step("Naverworks Messenger Attach Test")
 @pytest.mark.dependency(name="naverworks_messenger_attach")
-def test_naverworks_messenger_attach(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "naverworksstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 메신저 페이지로 이동
-            page.goto(f"{NAVERWORKS_MESSENGER_URL}/")
-            time.sleep(3)
-
-            # 파일 첨부
-            page.get_by_role("button", name="파일첨부").click()
-
-            # '내 PC' 클릭 → 파일 선택창 뜨는 타이밍에 맞춰 파일 지정
-            with page.expect_file_chooser(timeout=5000) as fc_info:
-                page.get_by_text("내 PC").click()
-            time.sleep(1)
-            file_chooser = fc_info.value
+def test_naverworks_messenger_attach(request, browser):
+    # 저장된 세션으로 시작 페이지 진입 (ES 대기 중 미리 열어 둔 컨텍스트가 있으면 그대로 사용)
+    context, page = open_service_page(browser, "naverworks", "naverworks_messenger", f"{NAVERWORKS_MESSENGER_URL}/")
+
+    try:
+
+        # 세션 유지한 채로 메신저 페이지로 이동
+        wait_for_ready(page)
+
+        # 파일 첨부
+        page.get_by_role("button", name="파일첨부").click()
+
+        # '내 PC' 클릭 → 파일 선택창 뜨는 타이밍에 맞춰 파일 지정
+        with page.expect_file_chooser(timeout=5000) as fc_info:
+            page.get_by_text("내 PC").click()
+        time.sleep(1)
+        file_chooser = fc_info.value
+        # 첨부 요청이 실제로 파일 크기만큼 나가는지 확인 (안 나가면 ES 대기 없이 바로 실패)
+        with expect_file_transmitted(page, DLP_FILE):
             file_chooser.set_files(DLP_FILE)
-            time.sleep(2)
-            print(f"[DEBUG] 파일 첨부 완료: {DLP_FILE}")
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_NAVERWORKS_MESSENGER,
-                test_cases=FILE_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
\ No newline at end of file
+        time.sleep(2)
+        print(f"[DEBUG] 파일 첨부 완료: {DLP_FILE}")
+
+        # 대기
+        page.wait_for_timeout(5000)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_NAVERWORKS_MESSENGER,
+            test_cases=FILE_LOGGING_CASE,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
\ No newline at end of file
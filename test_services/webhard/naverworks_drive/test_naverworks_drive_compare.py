@@ -2,7 +2,7 @@ import os
 import time
 import allure
 import pytest
-from playwright.sync_api import sync_playwright,BrowserContext,TimeoutError
+from playwright.sync_api import BrowserContext,TimeoutError
 from base import *
 
 NORMAL_LOGGING_CASE = [
@@ -41,75 +41,77 @@ MIX_LOGGING_CASE = [
 @allure.step("Naverworks Login Test")
 #@pytest.mark.order("first")
 @pytest.mark.dependency(name="naverworks_login")
-def test_naverworks_login(request):
-    with sync_playwright() as p:
-        # 브라우저 및 컨텍스트 생성
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
-        page = context.new_page()
-
-        try:
-            # 네이버웍스 홈페이지 진입
-            goto_and_wait(page, f"{NAVERWORKS_BASE_URL}")
-
-            # 아이디 및 패스워드 입력
-            with page.expect_popup() as page1_info:
-                page.get_by_role("link", name="로그인", exact=True).click()
-            page1 = page1_info.value
-            time.sleep(1)
-            page1.get_by_placeholder("또는 id@group.xxx").click()
-            page1.get_by_placeholder("또는 id@group.xxx").fill(NAVERWORKS_ID)
-            page1.get_by_role("button", name="로그인", exact=True).click()
-            time.sleep(1)
-            page1.get_by_placeholder("비밀번호").click()
-            page1.get_by_placeholder("비밀번호").fill(NAVERWORKS_PASSWORD)
-            time.sleep(1)
-            page1.get_by_role("button", name="로그인").click()
-            time.sleep(3)
-
-            # 세션 상태 저장
-            os.makedirs("session", exist_ok=True)
-            session_path = os.path.join("session", "naverworksstorageState.json")
-            context.storage_state(path=session_path)
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_naverworks_login(request, browser):
+    # 저장된 벤더 세션이 아직 유효하면 UI 로그인 생략
+    if reuse_vendor_session(browser, "naverworks"):
+        return
+
+    # 브라우저 및 컨텍스트 생성
+    context = browser.new_context()
+    apply_route_policy(context, "naverworks_drive")
+    page = context.new_page()
+
+    try:
+        # 네이버웍스 홈페이지 진입
+        goto_and_wait(page, f"{NAVERWORKS_BASE_URL}")
+
+        # 아이디 및 패스워드 입력
+        with page.expect_popup() as page1_info:
+            page.get_by_role("link", name="로그인", exact=True).click()
+        page1 = page1_info.value
+        time.sleep(1)
+        page1.get_by_placeholder("또는 id@group.xxx").click()
+        page1.get_by_placeholder("또는 id@group.xxx").fill(NAVERWORKS_ID)
+        page1.get_by_role("button", name="로그인", exact=True).click()
+        time.sleep(1)
+        page1.get_by_placeholder("비밀번호").click()
+        page1.get_by_placeholder("비밀번호").fill(NAVERWORKS_PASSWORD)
+        time.sleep(1)
+        page1.get_by_role("button", name="로그인").click()
+        time.sleep(3)
+
+        # 세션 상태 저장
+        save_vendor_session(context, "naverworks")
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.BLOCKER)
 @allure.step("Naverworks Drive Normal Test")
 @pytest.mark.dependency(name="naverworks_drive_normal")
-def test_naverworks_drive_normal(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "naverworksstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 드라이브 페이지로 이동
-            page.goto(f"{NAVERWORKS_DRIVE_URL}/")
-            time.sleep(3)
-
-            # 테스트 페이지로 진입
-            page.get_by_title("테스트").click()
-            time.sleep(2)
-
-            # 파일 첨부
-            page.get_by_role("button", name="새로 만들기").click()
-            time.sleep(1)
-
-            # "파일 올리기" 클릭 → file chooser 대기 후 파일 첨부
-            with page.expect_file_chooser(timeout=5000) as fc_info:
-                page.locator("a").filter(has_text="파일 올리기").click()
-            time.sleep(1)
-            file_chooser = fc_info.value
+def test_naverworks_drive_normal(request, browser):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("naverworks")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "naverworks_drive")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 드라이브 페이지로 이동
+        goto_and_wait(page, f"{NAVERWORKS_DRIVE_URL}/")
+
+        # 테스트 페이지로 진입
+        page.get_by_title("테스트").click()
+        time.sleep(2)
+
+        # 파일 첨부
+        page.get_by_role("button", name="새로 만들기").click()
+        time.sleep(1)
+
+        # "파일 올리기" 클릭 → file chooser 대기 후 파일 첨부
+        with page.expect_file_chooser(timeout=5000) as fc_info:
+            page.locator("a").filter(has_text="파일 올리기").click()
+        time.sleep(1)
+        file_chooser = fc_info.value
+        # 첨부 요청이 실제로 파일 크기만큼 나가는지 확인 (안 나가면 ES 대기 없이 바로 실패)
+        # 같은 파일 재업로드 시 덮어쓰기 확인 전에는 업로드가 시작되지 않으므로 팝업 처리까지 블록 안에서
+        with expect_file_transmitted(page, DLP_FILE):
             file_chooser.set_files(DLP_FILE)
             print(f"[DEBUG] file chooser로 파일 첨부 완료: {DLP_FILE}")
 
@@ -124,56 +126,57 @@ def test_naverworks_drive_normal(request):
                 print("▶ [DEBUG] '덮어쓰기' 버튼이 없어 스킵합니다.")
 
 
-            # 대기
-            page.wait_for_timeout(5000)
+        # 대기
+        page.wait_for_timeout(5000)
 
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_NAVERWORKS_DRIVE,
-                test_cases=NORMAL_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_NAVERWORKS_DRIVE,
+            test_cases=NORMAL_LOGGING_CASE,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
 
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
-        finally:
-            browser.close()
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.BLOCKER)
 @allure.step("Naverworks Drive Pattern Test")
 @pytest.mark.dependency(name="naverworks_drive_pattern")
-def test_naverworks_drive_pattern(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "naverworksstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 드라이브 페이지로 이동
-            page.goto(f"{NAVERWORKS_DRIVE_URL}/")
-            time.sleep(3)
-
-            # 테스트 페이지로 진입
-            page.get_by_title("테스트").click()
-            time.sleep(2)
-
-            # 파일 첨부
-            page.get_by_role("button", name="새로 만들기").click()
-            time.sleep(1)
-
-            # "파일 올리기" 클릭 → file chooser 대기 후 파일 첨부
-            with page.expect_file_chooser(timeout=5000) as fc_info:
-                page.locator("a").filter(has_text="파일 올리기").click()
-            time.sleep(1)
-            file_chooser = fc_info.value
+def test_naverworks_drive_pattern(request, browser):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("naverworks")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "naverworks_drive")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 드라이브 페이지로 이동
+        goto_and_wait(page, f"{NAVERWORKS_DRIVE_URL}/")
+
+        # 테스트 페이지로 진입
+        page.get_by_title("테스트").click()
+        time.sleep(2)
+
+        # 파일 첨부
+        page.get_by_role("button", name="새로 만들기").click()
+        time.sleep(1)
+
+        # "파일 올리기" 클릭 → file chooser 대기 후 파일 첨부
+        with page.expect_file_chooser(timeout=5000) as fc_info:
+            page.locator("a").filter(has_text="파일 올리기").click()
+        time.sleep(1)
+        file_chooser = fc_info.value
+        # 첨부 요청이 실제로 파일 크기만큼 나가는지 확인 (안 나가면 ES 대기 없이 바로 실패)
+        # 같은 파일 재업로드 시 덮어쓰기 확인 전에는 업로드가 시작되지 않으므로 팝업 처리까지 블록 안에서
+        with expect_file_transmitted(page, DLP_FILE_PATTERN):
             file_chooser.set_files(DLP_FILE_PATTERN)
             print(f"[DEBUG] file chooser로 파일 첨부 완료: {DLP_FILE_PATTERN}")
 
@@ -188,57 +191,58 @@ def test_naverworks_drive_pattern(request):
                 print("▶ [DEBUG] '덮어쓰기' 버튼이 없어 스킵합니다.")
 
 
-            # 대기
-            page.wait_for_timeout(5000)
+        # 대기
+        page.wait_for_timeout(5000)
 
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_NAVERWORKS_DRIVE,
-                test_cases=PATTERN_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_NAVERWORKS_DRIVE,
+            test_cases=PATTERN_LOGGING_CASE,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
 
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
-        finally:
-            browser.close()
+    finally:
+        context.close()
 
 
 allure.severity(allure.severity_level.BLOCKER)
 @allure.step("Naverworks Drive Keyword Test")
 @pytest.mark.dependency(name="naverworks_drive_keyword")
-def test_naverworks_drive_keyword(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "naverworksstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 드라이브 페이지로 이동
-            page.goto(f"{NAVERWORKS_DRIVE_URL}/")
-            time.sleep(3)
-
-            # 테스트 페이지로 진입
-            page.get_by_title("테스트").click()
-            time.sleep(2)
-
-            # 파일 첨부
-            page.get_by_role("button", name="새로 만들기").click()
-            time.sleep(1)
-
-            # "파일 올리기" 클릭 → file chooser 대기 후 파일 첨부
-            with page.expect_file_chooser(timeout=5000) as fc_info:
-                page.locator("a").filter(has_text="파일 올리기").click()
-            time.sleep(1)
-            file_chooser = fc_info.value
+def test_naverworks_drive_keyword(request, browser):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("naverworks")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "naverworks_drive")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 드라이브 페이지로 이동
+        goto_and_wait(page, f"{NAVERWORKS_DRIVE_URL}/")
+
+        # 테스트 페이지로 진입
+        page.get_by_title("테스트").click()
+        time.sleep(2)
+
+        # 파일 첨부
+        page.get_by_role("button", name="새로 만들기").click()
+        time.sleep(1)
+
+        # "파일 올리기" 클릭 → file chooser 대기 후 파일 첨부
+        with page.expect_file_chooser(timeout=5000) as fc_info:
+            page.locator("a").filter(has_text="파일 올리기").click()
+        time.sleep(1)
+        file_chooser = fc_info.value
+        # 첨부 요청이 실제로 파일 크기만큼 나가는지 확인 (안 나가면 ES 대기 없이 바로 실패)
+        # 같은 파일 재업로드 시 덮어쓰기 확인 전에는 업로드가 시작되지 않으므로 팝업 처리까지 블록 안에서
+        with expect_file_transmitted(page, DLP_FILE_KEYWORD):
             file_chooser.set_files(DLP_FILE_KEYWORD)
             print(f"[DEBUG] file chooser로 파일 첨부 완료: {DLP_FILE_KEYWORD}")
 
@@ -253,57 +257,58 @@ def test_naverworks_drive_keyword(request):
                 print("▶ [DEBUG] '덮어쓰기' 버튼이 없어 스킵합니다.")
 
 
-            # 대기
-            page.wait_for_timeout(5000)
+        # 대기
+        page.wait_for_timeout(5000)
 
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_NAVERWORKS_DRIVE,
-                test_cases=KEYWORD_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_NAVERWORKS_DRIVE,
+            test_cases=KEYWORD_LOGGING_CASE,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
 
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
 
-        finally:
-            browser.close()
+    finally:
+        context.close()
 
 
 allure.severity(allure.severity_level.BLOCKER)
 @allure.step("Naverworks Drive Mix Test")
 @pytest.mark.dependency(name="naverworks_drive_mix")
-def test_naverworks_drive_mix(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "naverworksstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 드라이브 페이지로 이동
-            page.goto(f"{NAVERWORKS_DRIVE_URL}/")
-            time.sleep(3)
-
-            # 테스트 페이지로 진입
-            page.get_by_title("테스트").click()
-            time.sleep(2)
-
-            # 파일 첨부
-            page.get_by_role("button", name="새로 만들기").click()
-            time.sleep(1)
-
-            # "파일 올리기" 클릭 → file chooser 대기 후 파일 첨부
-            with page.expect_file_chooser(timeout=5000) as fc_info:
-                page.locator("a").filter(has_text="파일 올리기").click()
-            time.sleep(1)
-            file_chooser = fc_info.value
+def test_naverworks_drive_mix(request, browser):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("naverworks")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "naverworks_drive")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 드라이브 페이지로 이동
+        goto_and_wait(page, f"{NAVERWORKS_DRIVE_URL}/")
+
+        # 테스트 페이지로 진입
+        page.get_by_title("테스트").click()
+        time.sleep(2)
+
+        # 파일 첨부
+        page.get_by_role("button", name="새로 만들기").click()
+        time.sleep(1)
+
+        # "파일 올리기" 클릭 → file chooser 대기 후 파일 첨부
+        with page.expect_file_chooser(timeout=5000) as fc_info:
+            page.locator("a").filter(has_text="파일 올리기").click()
+        time.sleep(1)
+        file_chooser = fc_info.value
+        # 첨부 요청이 실제로 파일 크기만큼 나가는지 확인 (안 나가면 ES 대기 없이 바로 실패)
+        # 같은 파일 재업로드 시 덮어쓰기 확인 전에는 업로드가 시작되지 않으므로 팝업 처리까지 블록 안에서
+        with expect_file_transmitted(page, DLP_FILE_MIX):
             file_chooser.set_files(DLP_FILE_MIX)
             print(f"[DEBUG] file chooser로 파일 첨부 완료: {DLP_FILE_MIX}")
 
@@ -318,22 +323,81 @@ def test_naverworks_drive_mix(request):
                 print("▶ [DEBUG] '덮어쓰기' 버튼이 없어 스킵합니다.")
 
 
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_NAVERWORKS_DRIVE,
-                test_cases=MIX_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
+        # 대기
+        page.wait_for_timeout(5000)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_NAVERWORKS_DRIVE,
+            test_cases=MIX_LOGGING_CASE,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
+
+
+def _delete_bench_file(page, name):
+    # 목록에서 파일 우클릭 → 삭제 → 확인, 목록에서 사라질 때까지 대기 (못 지우면 예외)
+    row = page.get_by_text(name, exact=True).first
+    row.click(button="right")
+    page.get_by_text("삭제", exact=True).first.click()
+    click_confirm_if_popup_exists(page, timeout=3000)
+    row.wait_for(state="hidden", timeout=10000)
+
+
+@allure.severity(allure.severity_level.NORMAL)
+@allure.step("Naverworks Drive Upload Benchmark")
+@pytest.mark.skipif(not BENCH_MODE, reason="BENCH_MODE=false")
+@pytest.mark.parametrize("route, size_kb", bench_cases())
+def test_naverworks_drive_upload_bench(request, bench_browser, dlp_token, route, size_kb):
+    # 경로(dut / bypass)별 전용 브라우저에서 같은 업로드를 BENCH_REPEATS 번 반복
+    session_path = get_session_path("naverworks")
+    context = bench_browser(route).new_context(storage_state=session_path)
+    apply_route_policy(context, "naverworks_drive")
+    page = context.new_page()
+    uploads = []
+    uploaded_names = []
+
+    try:
+        # 앞선 케이스가 올린 파일을 못 지웠으면 더 올리지 않음 (드라이브 용량 보호)
+        ensure_bench_cleanup_ok("naverworks_drive")
+
+        # 세션 유지한 채로 드라이브 테스트 폴더로 이동
+        goto_and_wait(page, f"{NAVERWORKS_DRIVE_URL}/")
+        page.get_by_title("테스트").click()
+
+        for i in range(1, BENCH_REPEATS + 1):
+            # 반복마다 새 파일명 → 덮어쓰기 팝업 없이 같은 조건으로 업로드
+            payload = make_bench_payload(size_kb, f"bench_{route}_{size_kb}KB_{dlp_token}_{i}.bin")
+            uploaded_names.append(payload["name"])
 
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
\ No newline at end of file
+            page.get_by_role("button", name="새로 만들기").click()
+            with page.expect_file_chooser(timeout=5000) as fc_info:
+                page.locator("a").filter(has_text="파일 올리기").click()
+            file_chooser = fc_info.value
+            # 100% 전송 + 구간 요청 응답까지 기다린 뒤 다음 반복 (남은 청크/완료 요청도 시간에 포함)
+            with expect_file_transmitted(page, payload, timeout=sweep_upload_timeout_ms(size_kb),
+                                         min_ratio=1.0, wait_settled=True) as upload:
+                file_chooser.set_files(payload)
+            uploads.append(upload)
+            print(f"[BENCH] {route} {size_kb}KB {i}/{BENCH_REPEATS}: {upload['upload_ms']}ms")
+
+        record_bench("naverworks_drive", route, size_kb, uploads)
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        # 이번 케이스가 올린 bench_* 파일 삭제 (실패하면 같은 서비스의 남은 벤치 케이스는 중단)
+        delete_bench_files(page, "naverworks_drive", uploaded_names, _delete_bench_file)
+        context.close()
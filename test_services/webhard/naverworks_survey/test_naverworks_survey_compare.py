@@ -2,7 +2,7 @@ import os
 import time
 import allure
 import pytest
-from playwright.sync_api import sync_playwright,BrowserContext,TimeoutError
+from playwright.sync_api import BrowserContext,TimeoutError
 from base import *
 
 NORMAL_LOGGING_CASE = [
@@ -41,298 +41,301 @@ FILE_LOGGING_CASE = [
 @allure.step("Naverworks Login Test")
 #@pytest.mark.order("first")
 @pytest.mark.dependency(name="naverworks_login")
-def test_naverworks_login(request):
-    with sync_playwright() as p:
-        # 브라우저 및 컨텍스트 생성
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
-        page = context.new_page()
-
-        try:
-            # 네이버웍스 홈페이지 진입
-            goto_and_wait(page, f"{NAVERWORKS_BASE_URL}")
-
-            # 아이디 및 패스워드 입력
-            with page.expect_popup() as page1_info:
-                page.get_by_role("link", name="로그인", exact=True).click()
-            page1 = page1_info.value
-            time.sleep(1)
-            page1.get_by_placeholder("또는 id@group.xxx").click()
-            page1.get_by_placeholder("또는 id@group.xxx").fill(NAVERWORKS_ID)
-            page1.get_by_role("button", name="로그인", exact=True).click()
-            time.sleep(1)
-            page1.get_by_placeholder("비밀번호").click()
-            page1.get_by_placeholder("비밀번호").fill(NAVERWORKS_PASSWORD)
-            time.sleep(1)
-            page1.get_by_role("button", name="로그인").click()
-            time.sleep(3)
-
-            # 세션 상태 저장
-            os.makedirs("session", exist_ok=True)
-            session_path = os.path.join("session", "naverworksstorageState.json")
-            context.storage_state(path=session_path)
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_naverworks_login(request, browser):
+    # 저장된 벤더 세션이 아직 유효하면 UI 로그인 생략
+    if reuse_vendor_session(browser, "naverworks"):
+        return
+
+    # 브라우저 및 컨텍스트 생성
+    context = browser.new_context()
+    apply_route_policy(context, "naverworks_survey")
+    page = context.new_page()
+
+    try:
+        # 네이버웍스 홈페이지 진입
+        goto_and_wait(page, f"{NAVERWORKS_BASE_URL}")
+
+        # 아이디 및 패스워드 입력
+        with page.expect_popup() as page1_info:
+            page.get_by_role("link", name="로그인", exact=True).click()
+        page1 = page1_info.value
+        time.sleep(1)
+        page1.get_by_placeholder("또는 id@group.xxx").click()
+        page1.get_by_placeholder("또는 id@group.xxx").fill(NAVERWORKS_ID)
+        page1.get_by_role("button", name="로그인", exact=True).click()
+        time.sleep(1)
+        page1.get_by_placeholder("비밀번호").click()
+        page1.get_by_placeholder("비밀번호").fill(NAVERWORKS_PASSWORD)
+        time.sleep(1)
+        page1.get_by_role("button", name="로그인").click()
+        time.sleep(3)
+
+        # 세션 상태 저장
+        save_vendor_session(context, "naverworks")
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.NORMAL)
 @allure.step("Naverworks Survey Normal Test")
 @pytest.mark.dependency(name="naverworks_survey_normal")
-def test_naverworks_survey_normal(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "naverworksstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 드라이브 페이지로 이동
-            page.goto(f"{NAVERWORKS_SURVEY_URL}")
-            time.sleep(3)
-
-            # 새설문 등록
-            page.get_by_role("button", name="새 설문").click()
-            page.get_by_role("button", name="사내용 설문").click()
-            with page.expect_popup() as page1_info:
-                page.get_by_role("link", name="새 설문").click()
-            page1 = page1_info.value
-            time.sleep(2)
-
-            # 제목 입력
-            page1.get_by_role("textbox", name="설문 제목을 입력하세요").click()
-            page1.get_by_role("textbox", name="설문 제목을 입력하세요").fill("기본로깅테스트")
-            time.sleep(1)
-            page1.get_by_role("textbox", name="설문 설명을 입력하세요").click()
-            page1.get_by_role("textbox", name="설문 설명을 입력하세요").fill("\n".join(DLP_NORMAL))
-            time.sleep(1)
-
-            page1.get_by_role("button", name="구성 추가").click()
-            time.sleep(0.5)
-            page1.get_by_text("객관식").click()
-            time.sleep(0.5)
-            page1.get_by_role("button", name="추가", exact=True).click()
-            time.sleep(0.5)
-            page1.get_by_role("button", name="완료").click()
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_NAVERWORKS_SURVEY,
-                test_cases=NORMAL_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_naverworks_survey_normal(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("naverworks")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "naverworks_survey")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 드라이브 페이지로 이동
+        page.goto(f"{NAVERWORKS_SURVEY_URL}")
+        time.sleep(3)
+
+        # 새설문 등록
+        page.get_by_role("button", name="새 설문").click()
+        page.get_by_role("button", name="사내용 설문").click()
+        with page.expect_popup() as page1_info:
+            page.get_by_role("link", name="새 설문").click()
+        page1 = page1_info.value
+        time.sleep(2)
+
+        # 제목 입력
+        page1.get_by_role("textbox", name="설문 제목을 입력하세요").click()
+        page1.get_by_role("textbox", name="설문 제목을 입력하세요").fill(f"기본로깅테스트 {dlp_token}")
+        time.sleep(1)
+        page1.get_by_role("textbox", name="설문 설명을 입력하세요").click()
+        page1.get_by_role("textbox", name="설문 설명을 입력하세요").fill("\n".join(DLP_NORMAL))
+        time.sleep(1)
+
+        page1.get_by_role("button", name="구성 추가").click()
+        time.sleep(0.5)
+        page1.get_by_text("객관식").click()
+        time.sleep(0.5)
+        page1.get_by_role("button", name="추가", exact=True).click()
+        time.sleep(0.5)
+        page1.get_by_role("button", name="완료").click()
+
+        # 대기
+        page.wait_for_timeout(5000)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_NAVERWORKS_SURVEY,
+            test_cases=NORMAL_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Naverworks Survey Pattern Test")
 @pytest.mark.dependency(name="naverworks_survey_pattern")
-def test_naverworks_survey_pattern(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "naverworksstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 드라이브 페이지로 이동
-            page.goto(f"{NAVERWORKS_SURVEY_URL}")
-            time.sleep(3)
-
-            # 새설문 등록
-            page.get_by_role("button", name="새 설문").click()
-            page.get_by_role("button", name="사내용 설문").click()
-            with page.expect_popup() as page1_info:
-                page.get_by_role("link", name="새 설문").click()
-            page1 = page1_info.value
-            time.sleep(2)
-
-            # 제목 입력
-            page1.get_by_role("textbox", name="설문 제목을 입력하세요").click()
-            page1.get_by_role("textbox", name="설문 제목을 입력하세요").fill("개인정보로깅테스트")
-            time.sleep(1)
-            page1.get_by_role("textbox", name="설문 설명을 입력하세요").click()
-            page1.get_by_role("textbox", name="설문 설명을 입력하세요").fill("\n".join(DLP_PATTERNS))
-            time.sleep(1)
-
-            page1.get_by_role("button", name="구성 추가").click()
-            time.sleep(0.5)
-            page1.get_by_text("객관식").click()
-            time.sleep(0.5)
-            page1.get_by_role("button", name="추가", exact=True).click()
-            time.sleep(0.5)
-            page1.get_by_role("button", name="완료").click()
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_NAVERWORKS_SURVEY,
-                test_cases=PATTERN_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_naverworks_survey_pattern(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("naverworks")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "naverworks_survey")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 드라이브 페이지로 이동
+        page.goto(f"{NAVERWORKS_SURVEY_URL}")
+        time.sleep(3)
+
+        # 새설문 등록
+        page.get_by_role("button", name="새 설문").click()
+        page.get_by_role("button", name="사내용 설문").click()
+        with page.expect_popup() as page1_info:
+            page.get_by_role("link", name="새 설문").click()
+        page1 = page1_info.value
+        time.sleep(2)
+
+        # 제목 입력
+        page1.get_by_role("textbox", name="설문 제목을 입력하세요").click()
+        page1.get_by_role("textbox", name="설문 제목을 입력하세요").fill(f"개인정보로깅테스트 {dlp_token}")
+        time.sleep(1)
+        page1.get_by_role("textbox", name="설문 설명을 입력하세요").click()
+        page1.get_by_role("textbox", name="설문 설명을 입력하세요").fill("\n".join(DLP_PATTERNS))
+        time.sleep(1)
+
+        page1.get_by_role("button", name="구성 추가").click()
+        time.sleep(0.5)
+        page1.get_by_text("객관식").click()
+        time.sleep(0.5)
+        page1.get_by_role("button", name="추가", exact=True).click()
+        time.sleep(0.5)
+        page1.get_by_role("button", name="완료").click()
+
+        # 대기
+        page.wait_for_timeout(5000)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_NAVERWORKS_SURVEY,
+            test_cases=PATTERN_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Naverworks Survey Keyword Test")
 @pytest.mark.dependency(name="naverworks_survey_keyword")
-def test_naverworks_survey_keyword(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "naverworksstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 드라이브 페이지로 이동
-            page.goto(f"{NAVERWORKS_SURVEY_URL}")
-            time.sleep(3)
-
-            # 새설문 등록
-            page.get_by_role("button", name="새 설문").click()
-            page.get_by_role("button", name="사내용 설문").click()
-            with page.expect_popup() as page1_info:
-                page.get_by_role("link", name="새 설문").click()
-            page1 = page1_info.value
-            time.sleep(2)
-
-            # 제목 입력
-            page1.get_by_role("textbox", name="설문 제목을 입력하세요").click()
-            page1.get_by_role("textbox", name="설문 제목을 입력하세요").fill("키워드로깅테스트")
-            time.sleep(1)
-            page1.get_by_role("textbox", name="설문 설명을 입력하세요").click()
-            page1.get_by_role("textbox", name="설문 설명을 입력하세요").fill("\n".join(DLP_KEYWORDS))
-            time.sleep(1)
-
-            page1.get_by_role("button", name="구성 추가").click()
-            time.sleep(0.5)
-            page1.get_by_text("객관식").click()
-            time.sleep(0.5)
-            page1.get_by_role("button", name="추가", exact=True).click()
-            time.sleep(0.5)
-            page1.get_by_role("button", name="완료").click()
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_NAVERWORKS_SURVEY,
-                test_cases=KEYWORD_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_naverworks_survey_keyword(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("naverworks")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "naverworks_survey")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 드라이브 페이지로 이동
+        page.goto(f"{NAVERWORKS_SURVEY_URL}")
+        time.sleep(3)
+
+        # 새설문 등록
+        page.get_by_role("button", name="새 설문").click()
+        page.get_by_role("button", name="사내용 설문").click()
+        with page.expect_popup() as page1_info:
+            page.get_by_role("link", name="새 설문").click()
+        page1 = page1_info.value
+        time.sleep(2)
+
+        # 제목 입력
+        page1.get_by_role("textbox", name="설문 제목을 입력하세요").click()
+        page1.get_by_role("textbox", name="설문 제목을 입력하세요").fill(f"키워드로깅테스트 {dlp_token}")
+        time.sleep(1)
+        page1.get_by_role("textbox", name="설문 설명을 입력하세요").click()
+        page1.get_by_role("textbox", name="설문 설명을 입력하세요").fill("\n".join(DLP_KEYWORDS))
+        time.sleep(1)
+
+        page1.get_by_role("button", name="구성 추가").click()
+        time.sleep(0.5)
+        page1.get_by_text("객관식").click()
+        time.sleep(0.5)
+        page1.get_by_role("button", name="추가", exact=True).click()
+        time.sleep(0.5)
+        page1.get_by_role("button", name="완료").click()
+
+        # 대기
+        page.wait_for_timeout(5000)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_NAVERWORKS_SURVEY,
+            test_cases=KEYWORD_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.BLOCKER)
 @allure.step("Naverworks Survey Attach Test")
 @pytest.mark.dependency(name="naverworks_survey_attach")
-def test_naverworks_survey_attach(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "naverworksstorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 드라이브 페이지로 이동
-            page.goto(f"{NAVERWORKS_SURVEY_URL}")
-            time.sleep(3)
-
-            # 새설문 등록
-            page.get_by_role("button", name="새 설문").click()
-            page.get_by_role("button", name="사내용 설문").click()
-            with page.expect_popup() as page1_info:
-                page.get_by_role("link", name="새 설문").click()
-            page1 = page1_info.value
-            time.sleep(2)
-
-            # 제목 입력
-            page1.get_by_role("textbox", name="설문 제목을 입력하세요").click()
-            page1.get_by_role("textbox", name="설문 제목을 입력하세요").fill("첨부파일로깅테스트")
-            time.sleep(1)
-            page1.get_by_role("textbox", name="설문 설명을 입력하세요").click()
-            page1.get_by_role("textbox", name="설문 설명을 입력하세요").fill("\n".join(DLP_NORMAL))
-            time.sleep(1)
-            with page1.expect_file_chooser(timeout=5000) as fc_info:
-                page1.get_by_role("button", name="Choose File").click()
-            time.sleep(1)
-            file_chooser = fc_info.value
-            # 한 개 파일 첨부
+def test_naverworks_survey_attach(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("naverworks")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "naverworks_survey")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 드라이브 페이지로 이동
+        page.goto(f"{NAVERWORKS_SURVEY_URL}")
+        time.sleep(3)
+
+        # 새설문 등록
+        page.get_by_role("button", name="새 설문").click()
+        page.get_by_role("button", name="사내용 설문").click()
+        with page.expect_popup() as page1_info:
+            page.get_by_role("link", name="새 설문").click()
+        page1 = page1_info.value
+        time.sleep(2)
+
+        # 제목 입력
+        page1.get_by_role("textbox", name="설문 제목을 입력하세요").click()
+        page1.get_by_role("textbox", name="설문 제목을 입력하세요").fill(f"첨부파일로깅테스트 {dlp_token}")
+        time.sleep(1)
+        page1.get_by_role("textbox", name="설문 설명을 입력하세요").click()
+        page1.get_by_role("textbox", name="설문 설명을 입력하세요").fill("\n".join(DLP_NORMAL))
+        time.sleep(1)
+        with page1.expect_file_chooser(timeout=5000) as fc_info:
+            page1.get_by_role("button", name="Choose File").click()
+        time.sleep(1)
+        file_chooser = fc_info.value
+        # 한 개 파일 첨부
+        # 첨부 요청이 실제로 파일 크기만큼 나가는지 확인 (안 나가면 ES 대기 없이 바로 실패)
+        with expect_file_transmitted(page1, DLP_FILE):
             file_chooser.set_files(DLP_FILE)
-            # # 여러 파일 첨부(2개)
-            # file_chooser.set_files(DLP_FILES)
-            time.sleep(1)
-
-            page1.get_by_role("button", name="구성 추가").click()
-            time.sleep(0.5)
-            page1.get_by_text("객관식").click()
-            time.sleep(0.5)
-            page1.get_by_role("button", name="추가", exact=True).click()
-            time.sleep(0.5)
-            try:
-                page1.get_by_role("button", name="완료").click(timeout=2000)
-                print("✔ [DEBUG] 완료 클릭")
-            except:
-                print("▶ [DEBUG] 완료 없음 → 스킵")
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_NAVERWORKS_SURVEY,
-                test_cases=FILE_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
\ No newline at end of file
+        # # 여러 파일 첨부(2개)
+        # file_chooser.set_files(DLP_FILES)
+        time.sleep(1)
+
+        page1.get_by_role("button", name="구성 추가").click()
+        time.sleep(0.5)
+        page1.get_by_text("객관식").click()
+        time.sleep(0.5)
+        page1.get_by_role("button", name="추가", exact=True).click()
+        time.sleep(0.5)
+        try:
+            page1.get_by_role("button", name="완료").click(timeout=2000)
+            print("✔ [DEBUG] 완료 클릭")
+        except:
+            print("▶ [DEBUG] 완료 없음 → 스킵")
+
+        # 대기
+        page.wait_for_timeout(5000)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_NAVERWORKS_SURVEY,
+            test_cases=FILE_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
\ No newline at end of file
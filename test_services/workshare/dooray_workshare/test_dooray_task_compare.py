@@ -2,7 +2,7 @@ import os
 import time
 import allure
 import pytest
-from playwright.sync_api import sync_playwright,TimeoutError
+from playwright.sync_api import TimeoutError
 from base import *
 
 NORMAL_LOGGING_CASE = [
@@ -39,289 +39,291 @@ FILE_LOGGING_CASE = [
 
 @allure.severity(allure.severity_level.TRIVIAL)
 @allure.step("Dooray Login Test")
-def test_dooray_login(request):
-    with sync_playwright() as p:
-        # 브라우저 및 컨텍스트 생성
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
-        page = context.new_page()
-
-        try:
-            # 두레이 홈페이지 진입
-            page.goto(f"{DOORAY_BASE_URL}/")
-            time.sleep(3)
-
-
-            # 아이디 및 패스워드 입력
-            page.get_by_placeholder("아이디").click()
-            page.get_by_placeholder("아이디").fill(DOORAY_ID)
-            page.get_by_placeholder("비밀번호").click()
-            page.get_by_placeholder("비밀번호").fill(DOORAY_PASSWORD)
-            time.sleep(1)
-            page.get_by_role("button", name="로그인").click()
-            time.sleep(3)
-
-            # 세션 상태 저장
-            os.makedirs("session", exist_ok=True)
-            session_path = os.path.join("session", "dooraystorageState.json")
-            context.storage_state(path=session_path)
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-        finally:
-            browser.close()
+def test_dooray_login(request, browser):
+    # 저장된 벤더 세션이 아직 유효하면 UI 로그인 생략
+    if reuse_vendor_session(browser, "dooray"):
+        return
+
+    # 브라우저 및 컨텍스트 생성
+    context = browser.new_context()
+    apply_route_policy(context, "dooray_workshare")
+    page = context.new_page()
+
+    try:
+        # 두레이 홈페이지 진입
+        page.goto(f"{DOORAY_BASE_URL}/")
+        time.sleep(3)
+
+
+        # 아이디 및 패스워드 입력
+        page.get_by_placeholder("아이디").click()
+        page.get_by_placeholder("아이디").fill(DOORAY_ID)
+        page.get_by_placeholder("비밀번호").click()
+        page.get_by_placeholder("비밀번호").fill(DOORAY_PASSWORD)
+        time.sleep(1)
+        page.get_by_role("button", name="로그인").click()
+        time.sleep(3)
+
+        # 세션 상태 저장
+        save_vendor_session(context, "dooray")
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.NORMAL)
 @allure.step("Dooray Task Normal Test")
-def test_dooray_task_normal(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "dooraystorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 게시판 페이지로 이동
-            page.goto(f"{DOORAY_BASE_URL}/task")
-            time.sleep(3)
-
-
-            # 가장 위에 게시글 클릭
-            with page.expect_popup() as page1_info:
-                page.get_by_test_id("project-LNB-newTaskButton").click()
-            page1 = page1_info.value
-            time.sleep(3)
-
-            # 팝업 닫기
-            page1.keyboard.press("Escape")
-            time.sleep(1)
-
-            # 제목 입력
-            page1.get_by_role("textbox", name="제목을 입력해 주세요").click()
-            page1.get_by_role("textbox", name="제목을 입력해 주세요").fill("기본로깅테스트")
-            time.sleep(1)
-
-            # 본문 입력
-            editor_box = page1.get_by_test_id("DoorayMDEditor").get_by_role("textbox")
-            editor_box.click()
-            editor_box.fill("\n".join(DLP_NORMAL))
-            time.sleep(1)
-
-            # 저장 클릭
-            page1.get_by_test_id("project-base-writeFooterConfirm").click()
-            page1.close()
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_DOORAY_TASK,
-                test_cases=NORMAL_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_dooray_task_normal(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("dooray")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "dooray_workshare")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 게시판 페이지로 이동
+        page.goto(f"{DOORAY_BASE_URL}/task")
+        time.sleep(3)
+
+
+        # 가장 위에 게시글 클릭
+        with page.expect_popup() as page1_info:
+            page.get_by_test_id("project-LNB-newTaskButton").click()
+        page1 = page1_info.value
+        time.sleep(3)
+
+        # 팝업 닫기
+        page1.keyboard.press("Escape")
+        time.sleep(1)
+
+        # 제목 입력
+        page1.get_by_role("textbox", name="제목을 입력해 주세요").click()
+        page1.get_by_role("textbox", name="제목을 입력해 주세요").fill(f"기본로깅테스트 {dlp_token}")
+        time.sleep(1)
+
+        # 본문 입력
+        editor_box = page1.get_by_test_id("DoorayMDEditor").get_by_role("textbox")
+        editor_box.click()
+        editor_box.fill("\n".join(DLP_NORMAL))
+        time.sleep(1)
+
+        # 저장 클릭
+        page1.get_by_test_id("project-base-writeFooterConfirm").click()
+        page1.close()
+
+        # 대기
+        page.wait_for_timeout(5000)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DOORAY_TASK,
+            test_cases=NORMAL_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Dooray Task Pattern Test")
-def test_dooray_task_pattern(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "dooraystorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 게시판 페이지로 이동
-            page.goto(f"{DOORAY_BASE_URL}/task")
-            time.sleep(3)
-
-
-            # 가장 위에 게시글 클릭
-            with page.expect_popup() as page1_info:
-                page.get_by_test_id("project-LNB-newTaskButton").click()
-            page1 = page1_info.value
-            time.sleep(3)
-
-            # 팝업 닫기
-            page1.keyboard.press("Escape")
-            time.sleep(1)
-
-            # 제목 입력
-            page1.get_by_role("textbox", name="제목을 입력해 주세요").click()
-            page1.get_by_role("textbox", name="제목을 입력해 주세요").fill("개인정보로깅테스트")
-            time.sleep(1)
-
-            # 본문 입력
-            editor_box = page1.get_by_test_id("DoorayMDEditor").get_by_role("textbox")
-            editor_box.click()
-            editor_box.fill("\n".join(DLP_PATTERNS))
-            time.sleep(1)
-
-            # 저장 클릭
-            page1.get_by_test_id("project-base-writeFooterConfirm").click()
-            page1.close()
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_DOORAY_TASK,
-                test_cases=PATTERN_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_dooray_task_pattern(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("dooray")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "dooray_workshare")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 게시판 페이지로 이동
+        page.goto(f"{DOORAY_BASE_URL}/task")
+        time.sleep(3)
+
+
+        # 가장 위에 게시글 클릭
+        with page.expect_popup() as page1_info:
+            page.get_by_test_id("project-LNB-newTaskButton").click()
+        page1 = page1_info.value
+        time.sleep(3)
+
+        # 팝업 닫기
+        page1.keyboard.press("Escape")
+        time.sleep(1)
+
+        # 제목 입력
+        page1.get_by_role("textbox", name="제목을 입력해 주세요").click()
+        page1.get_by_role("textbox", name="제목을 입력해 주세요").fill(f"개인정보로깅테스트 {dlp_token}")
+        time.sleep(1)
+
+        # 본문 입력
+        editor_box = page1.get_by_test_id("DoorayMDEditor").get_by_role("textbox")
+        editor_box.click()
+        editor_box.fill("\n".join(DLP_PATTERNS))
+        time.sleep(1)
+
+        # 저장 클릭
+        page1.get_by_test_id("project-base-writeFooterConfirm").click()
+        page1.close()
+
+        # 대기
+        page.wait_for_timeout(5000)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DOORAY_TASK,
+            test_cases=PATTERN_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.CRITICAL)
 @allure.step("Dooray Task Keyword Test")
-def test_dooray_task_keyword(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "dooraystorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
-
-        try:
-
-            # 세션 유지한 채로 게시판 페이지로 이동
-            page.goto(f"{DOORAY_BASE_URL}/task")
-            time.sleep(3)
-
-
-            # 가장 위에 게시글 클릭
-            with page.expect_popup() as page1_info:
-                page.get_by_test_id("project-LNB-newTaskButton").click()
-            page1 = page1_info.value
-            time.sleep(3)
-
-            # 팝업 닫기
-            page1.keyboard.press("Escape")
-            time.sleep(1)
-
-            # 제목 입력
-            page1.get_by_role("textbox", name="제목을 입력해 주세요").click()
-            page1.get_by_role("textbox", name="제목을 입력해 주세요").fill("키워드로깅테스트")
-            time.sleep(1)
-
-            # 본문 입력
-            editor_box = page1.get_by_test_id("DoorayMDEditor").get_by_role("textbox")
-            editor_box.click()
-            editor_box.fill("\n".join(DLP_KEYWORDS))
-            time.sleep(1)
-
-            # 저장 클릭
-            page1.get_by_test_id("project-base-writeFooterConfirm").click()
-            page1.close()
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_DOORAY_TASK,
-                test_cases=KEYWORD_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
+def test_dooray_task_keyword(request, browser, dlp_token):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("dooray")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "dooray_workshare")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 게시판 페이지로 이동
+        page.goto(f"{DOORAY_BASE_URL}/task")
+        time.sleep(3)
+
+
+        # 가장 위에 게시글 클릭
+        with page.expect_popup() as page1_info:
+            page.get_by_test_id("project-LNB-newTaskButton").click()
+        page1 = page1_info.value
+        time.sleep(3)
+
+        # 팝업 닫기
+        page1.keyboard.press("Escape")
+        time.sleep(1)
+
+        # 제목 입력
+        page1.get_by_role("textbox", name="제목을 입력해 주세요").click()
+        page1.get_by_role("textbox", name="제목을 입력해 주세요").fill(f"키워드로깅테스트 {dlp_token}")
+        time.sleep(1)
+
+        # 본문 입력
+        editor_box = page1.get_by_test_id("DoorayMDEditor").get_by_role("textbox")
+        editor_box.click()
+        editor_box.fill("\n".join(DLP_KEYWORDS))
+        time.sleep(1)
+
+        # 저장 클릭
+        page1.get_by_test_id("project-base-writeFooterConfirm").click()
+        page1.close()
+
+        # 대기
+        page.wait_for_timeout(5000)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DOORAY_TASK,
+            test_cases=KEYWORD_LOGGING_CASE,
+            token=dlp_token,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
 
 @allure.severity(allure.severity_level.BLOCKER)
 @allure.step("Dooray Task Attach Test")
-def test_dooray_task_attach(request):
-    with sync_playwright() as p:
-        # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
-        session_path = os.path.join("session", "dooraystorageState.json")
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context(storage_state=session_path)
-        page = context.new_page()
+def test_dooray_task_attach(request, browser):
+    # 저장된 세션 상태를 로드하여 브라우저 컨텍스트 생성
+    session_path = get_session_path("dooray")
+    context = browser.new_context(storage_state=session_path)
+    apply_route_policy(context, "dooray_workshare")
+    page = context.new_page()
+
+    try:
+
+        # 세션 유지한 채로 게시판 페이지로 이동
+        page.goto(f"{DOORAY_BASE_URL}/task")
+        time.sleep(3)
+
+
+        # 가장 위에 게시글 클릭
+        with page.expect_popup() as page1_info:
+            page.get_by_test_id("project-LNB-newTaskButton").click()
+        page1 = page1_info.value
+        time.sleep(3)
+
+        # 팝업 닫기
+        page1.keyboard.press("Escape")
+        time.sleep(1)
+
+        # 파일첨부
+        with page1.expect_file_chooser() as fc_info:
+            page1.get_by_test_id("ProjectWriteAttachFilesContainer_GhostButton").click()
+        time.sleep(1)
+        file_chooser = fc_info.value
+        # 파일 1개 첨부
+        # 첨부 요청이 실제로 파일 크기만큼 나가는지 확인 (안 나가면 ES 대기 없이 바로 실패)
+        with expect_file_transmitted(page1, DLP_FILE):
+            file_chooser.set_files(DLP_FILE)
+        # # 파일 2개 첨부
+        # file_chooser.set_files(DLP_FILES)
+        print("파일을 첨부하였습니다.")
 
+        # 저장 클릭
         try:
-
-            # 세션 유지한 채로 게시판 페이지로 이동
-            page.goto(f"{DOORAY_BASE_URL}/task")
-            time.sleep(3)
-
-
-            # 가장 위에 게시글 클릭
-            with page.expect_popup() as page1_info:
-                page.get_by_test_id("project-LNB-newTaskButton").click()
-            page1 = page1_info.value
-            time.sleep(3)
-
-            # 팝업 닫기
-            page1.keyboard.press("Escape")
-            time.sleep(1)
-
-            # 파일첨부
-            with page1.expect_file_chooser() as fc_info:
-                page1.get_by_test_id("ProjectWriteAttachFilesContainer_GhostButton").click()
-            time.sleep(1)
-            file_chooser = fc_info.value
-            # 파일 1개 첨부
-            file_chooser.set_files(DLP_FILE)
-            # # 파일 2개 첨부
-            # file_chooser.set_files(DLP_FILES)
-            print("파일을 첨부하였습니다.")
-
-            # 저장 클릭
-            try:
-                page1.get_by_test_id("project-base-writeFooterConfirm").click(timeout=2000)
-                page1.close()
-                print("✔ [DEBUG] 완료 클릭")
-            except:
-                print("▶ [DEBUG] 완료 없음 → 스킵")
-
-            # 대기
-            page.wait_for_timeout(5000)
-
-            # ===== 여기서 ES 검증 반복 호출 =====
-            assert_es_logs_with_retry(
-                service_name=SERVICE_NAMES_DOORAY_TASK,
-                test_cases=FILE_LOGGING_CASE,
-                size=1,
-                max_attempts=3,  # 총 3번 시도
-                interval_sec=5  # 시도 간 5초 대기
-            )
-
-        except Exception as e:
-            capture_failure_screenshot(page, request, timeout=5000)
-            print(f"[WARN] 테스트 실패: {e}")
-            pytest.fail(f"Test failed: {str(e)}")
-
-        finally:
-            browser.close()
\ No newline at end of file
+            page1.get_by_test_id("project-base-writeFooterConfirm").click(timeout=2000)
+            page1.close()
+            print("✔ [DEBUG] 완료 클릭")
+        except:
+            print("▶ [DEBUG] 완료 없음 → 스킵")
+
+        # 대기
+        page.wait_for_timeout(5000)
+
+        # ===== 여기서 ES 검증 반복 호출 =====
+        assert_es_logs_with_retry(
+            service_name=SERVICE_NAMES_DOORAY_TASK,
+            test_cases=FILE_LOGGING_CASE,
+            size=1,
+            max_attempts=3,  # 총 3번 시도
+            interval_sec=5  # 시도 간 5초 대기
+        )
+
+    except Exception as e:
+        capture_failure_screenshot(page, request, timeout=5000)
+        print(f"[WARN] 테스트 실패: {e}")
+        pytest.fail(f"Test failed: {str(e)}")
+
+    finally:
+        context.close()
\ No newline at end of file